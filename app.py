@@ -1,11 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import sys
 import os
 import time
 import json
+import re
+import html
+from concurrent.futures import ThreadPoolExecutor
 
 # Add stock module to path for imports
 # This allows the app to work both locally and on Streamlit Cloud
@@ -14,10 +18,61 @@ stock_dir = os.path.join(current_dir, 'stock')
 if stock_dir not in sys.path:
     sys.path.insert(0, stock_dir)
 
+# pandas Copy-on-Write: 슬라이스/transpose/컬럼 선택 결과를 실제로 수정할 때까지 복사를 미룸
+# 전역 옵션이므로 라이브러리(stock 모듈) import 시가 아닌 앱 진입점에서만 설정
+# (pandas 3.0부터는 기본 동작이며 옵션이 없는 버전에서는 그대로 진행)
+try:
+    pd.set_option('mode.copy_on_write', True)
+except (KeyError, pd.errors.OptionError):
+    pass
+
+# orjson이 설치되어 있으면 Plotly figure 직렬화(fig.to_json)에 사용
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
 # Import from stock module
 from data_manager import StockDataManager
 from ai_analyst import AIAnalyst
-from utils import format_number
+from utils import format_number, format_series, flatten_metrics
+from indicators import compute_chart_indicators, rsi_status_labels
+
+# Plotly 차트 공통 설정 (modebar 비활성화로 초기 렌더링 부담 감소)
+PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# 모든 figure가 공유하는 Plotly 기본 테마 (모듈 로드 시 1회 지정 - figure마다 template 재적용 방지)
+# 범례/레인지 슬라이더 등 차트별 layout은 각 figure에서 지정
+pio.templates.default = 'plotly_white'
+
+# TRIX(30) 차트를 그리기 위한 최소 데이터 수 (period * 3)
+TRIX_MIN_POINTS = 30 * 3
+
+# Technicals 요약 표에 사용하는 technicals 키 (순서대로 unpack)
+_SUMMARY_KEYS = ('current_rsi', 'current_trix', 'volume_ratio', 'earnings_d_day', 'earnings_date')
+
+# 세션에 보관하는 티커별 분석 결과 최대 개수 (초과 시 가장 오래전에 분석한 티커부터 제거)
+ANALYSIS_MAX_TICKERS = 5
+
+# AI 리포트의 "## N. 섹션명" 헤더 (### 하위 헤더는 제외)
+_SECTION_RE = re.compile(r'^##\s+(?:\d+\.\s*)?(.+?)\s*$', re.M)
+
+
+@st.cache_data(show_spinner=False)
+def parse_sections(report: str) -> dict:
+    """
+    AI 리포트를 "## " 섹션 단위로 1회 분리 (리포트 문자열 기준 캐시)
+    
+    Returns:
+        {'Macro & Industry Context': '## 1. Macro & Industry Context ...', ...}
+    """
+    matches = list(_SECTION_RE.finditer(report or ''))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(report)
+        sections[match.group(1)] = report[match.start():end].strip()
+    return sections
 
 
 def _build_chat_context(ticker: str, data: dict, strategy: str, ai_report: str = None) -> str:
@@ -63,16 +118,19 @@ def _build_chat_context(ticker: str, data: dict, strategy: str, ai_report: str =
     
     # Recent news summary
     if news_context and news_context.get('recent_news'):
-        context += "## Recent News Headlines\n"
-        for i, news in enumerate(news_context.get('recent_news', [])[:5], 1):
-            context += f"{i}. {news.get('title', 'N/A')}\n"
-        context += "\n"
+        headlines = "".join(
+            f"{i}. {news.get('title', 'N/A')}\n"
+            for i, news in enumerate(news_context.get('recent_news', [])[:5], 1)
+        )
+        context += f"## Recent News Headlines\n{headlines}\n"
     
     # AI Report summary (if available)
     if ai_report:
+        # 결론 섹션이 있으면 해당 섹션을, 없으면 리포트 앞부분을 요약으로 사용
+        report_summary = parse_sections(ai_report).get('Entry Strategy & Final Verdict') or ai_report
         context += f"""## AI Analysis Report Summary
 
-{ai_report[:2000]}...
+{report_summary[:2000]}...
 
 (The full analysis report is available in the Summary & Analysis tab.)
 
@@ -80,1499 +138,1563 @@ def _build_chat_context(ticker: str, data: dict, strategy: str, ai_report: str =
     
     return context
 
-# 페이지 설정
-st.set_page_config(
-    page_title="Stock Deep-Dive AI",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
 
-# 사이드바
-st.sidebar.title("📈 Stock Deep-Dive AI")
-st.sidebar.markdown("---")
+@st.cache_resource(show_spinner=False)
+def get_manager(ticker: str) -> StockDataManager:
+    """
+    티커별 StockDataManager 인스턴스 (yfinance Ticker 객체를 rerun 간 재사용)
+    """
+    return StockDataManager(ticker)
 
-# API Key 입력 (사용자가 매번 직접 입력)
-api_key = st.sidebar.text_input(
-    "Gemini API Key",
-    type="password",
-    value="",  # 항상 빈 값으로 시작
-    help="Enter your Google Gemini API key to enable AI-powered analysis features.",
-    key="api_key_input"
-)
 
-if not api_key or not api_key.strip():
-    st.sidebar.info("💡 Enter your Gemini API Key to unlock AI analysis features. The app works without it for basic indicators.")
+def get_history(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+    """
+    주가 히스토리 조회
+    
+    StockDataManager의 히스토리 캐시(HISTORY_CACHE_TTL)만 거치므로 get_technicals/뉴스 컨텍스트와 같은 응답을 공유
+    (별도 Streamlit 캐시를 두면 Technicals 수치보다 오래된 주가로 차트를 그릴 수 있음)
+    """
+    return get_manager(ticker)._get_history(period=period, interval=interval)
 
-# Ticker 입력
-ticker = st.sidebar.text_input(
-    "Enter Ticker (e.g., NVDA, AAPL)",
-    value="GOOGL",
-    help="Enter stock ticker symbol"
-).upper()
 
-# 투자 성향 선택
-strategy = st.sidebar.radio(
-    "Investment Style",
-    ["🚀 Growth", "🛡️ Value"],
-    help="Select your investment strategy"
-)
+def history_as_of(price_data) -> str:
+    """
+    차트 캐시 키로 쓰는 가격 데이터의 마지막 봉 (날짜, 종가)
+    
+    get_technicals의 price_data 기준이므로 새 봉이 추가되거나 장중 마지막 봉이 갱신되면 차트 캐시도 무효화
+    """
+    if not isinstance(price_data, pd.DataFrame) or price_data.empty or 'Close' not in price_data.columns:
+        return ''
+    return f"{price_data.index[-1]}|{price_data['Close'].iat[-1]}"
 
-# 언어 선택
-language = st.sidebar.radio(
-    "Language",
-    ["🇺🇸 English", "🇰🇷 한국어"],
-    help="Select report language"
-)
 
-# 언어 코드 변환
-lang_code = "en" if "English" in language else "ko"
+def collect_data(ticker: str) -> dict:
+    """
+    분석에 필요한 전체 데이터 수집 (Run Analysis마다 새로 조회)
+    
+    각 조회 메서드는 실패 시 error/빈 결과를 반환하므로 결과 자체는 캐시하지 않음
+    (응답 캐시는 StockDataManager 내부에서 빈 응답을 제외하고 관리)
+    """
+    manager = get_manager(ticker)
+    fetchers = {
+        'profile': manager.get_profile,
+        'financials': manager.get_financials,
+        'technicals': manager.get_technicals,
+        'news_context': manager.get_news_context
+    }
+    # 네트워크 I/O 위주의 독립적인 조회이므로 병렬 실행 (예외는 result()에서 그대로 전파)
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {key: executor.submit(fetch) for key, fetch in fetchers.items()}
+        return {key: future.result() for key, future in futures.items()}
 
-# Gemini 모델 선택
-gemini_model = st.sidebar.radio(
-    "Gemini Model",
-    ["gemini-2.5-flash", "gemini-2.5-flash-lite"],
-    help="Select Gemini model (flash-lite is faster but less capable)"
-)
 
-# Run Analysis 버튼
-run_analysis = st.sidebar.button("Run Analysis", type="primary", use_container_width=True)
+def _epoch_ms(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    DatetimeIndex를 거래소 현지 시각 기준 epoch 밀리초(int64) 배열로 변환
+    
+    Plotly date 축은 숫자 x를 epoch ms로 해석하므로 날짜 문자열 대신 정수로 직렬화
+    """
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_localize(None)
+    return index.asi8 // 1_000_000
 
-# 메인 화면
-st.title("📈 Stock Deep-Dive AI")
-st.markdown("---")
 
-# 세션 상태 초기화
-if 'data' not in st.session_state:
-    st.session_state.data = None
-if 'ai_report' not in st.session_state:
-    st.session_state.ai_report = None
-if 'ai_score' not in st.session_state:
-    st.session_state.ai_score = None
-if 'verdict' not in st.session_state:
-    st.session_state.verdict = None
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def compute_indicators(ticker: str, as_of: str) -> dict:
+    """
+    차트용 기술적 지표(MA, RSI, TRIX) 1회 계산 - Price/RSI/TRIX 차트에서 공유
+    
+    Args:
+        ticker: 종목 티커
+        as_of: history_as_of 결과 (Technicals 수치와 같은 주가 데이터로 차트를 그리도록 캐시 키로 사용)
+    """
+    hist = get_history(ticker)
+    indicators = {'hist': hist}
+    if hist.empty:
+        return indicators
+    
+    # 모든 trace가 공유하는 x축 (epoch ms int64 배열, 거래소 현지 시각 기준 1회 변환)
+    indicators['x'] = _epoch_ms(hist.index)
+    
+    # 캐시된 hist에 컬럼을 추가하지 않고 지표는 별도 numpy 배열로 보관
+    # (차트 표시용이므로 float32로 줄여 브라우저로 보내는 figure JSON 크기 감소)
+    chart_values = compute_chart_indicators(hist['Close'])
+    chart_values['close'] = hist['Close'].to_numpy()
+    indicators.update({key: values.astype(np.float32) for key, values in chart_values.items()})
+    return indicators
 
-# 분석 실행
-if run_analysis:
-    if not ticker:
-        st.error("⚠️ Please enter a ticker symbol.")
-        st.stop()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_price_fig(ticker: str, as_of: str, ma_keys: tuple, events: tuple) -> dict:
+    """
+    주가 + 이동평균선 차트 생성 (ticker, 가격 데이터 기준 시점, 표시할 MA, 이벤트 기준 캐시)
     
-    # 진행 상황 표시
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    Args:
+        ticker: 종목 티커
+        as_of: history_as_of 결과 (주가 데이터가 갱신되면 캐시 무효화)
+        ma_keys: 표시할 이동평균 키 (예: ('MA_20', 'MA_60'))
+        events: (날짜, 변동률) tuple 목록
     
-    try:
-        # 1. 데이터 수집 (API 키 없이도 실행 가능)
-        status_text.text("📊 Collecting data...")
-        progress_bar.progress(20)
-        
-        manager = StockDataManager(ticker)
-        
-        data = {
-            'profile': manager.get_profile(),
-            'financials': manager.get_financials(),
-            'technicals': manager.get_technicals(),
-            'news_context': manager.get_news_context()
-        }
-        
-        st.session_state.data = data
-        progress_bar.progress(40)
+    Returns:
+        fig.to_dict() 결과 (go.Figure(...)로 복원)
+    """
+    indicators = compute_indicators(ticker, as_of)
+    hist = indicators['hist']
+    x_axis = indicators['x']
+    fig_price = go.Figure()
+    
+    # Candlestick
+    ohlc = hist[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float32)
+    fig_price.add_trace(go.Candlestick(
+        x=x_axis,
+        open=ohlc[:, 0],
+        high=ohlc[:, 1],
+        low=ohlc[:, 2],
+        close=ohlc[:, 3],
+        name='Price'
+    ))
+    
+    # MA (compute_indicators에서 계산된 값 사용)
+    ma_styles = (('MA_20', 20, 'MA 20', 'blue'), ('MA_60', 60, 'MA 60', 'orange'), ('MA_120', 120, 'MA 120', 'red'))
+    for key, window, name, color in ma_styles:
+        if key in ma_keys and len(hist) >= window:
+            fig_price.add_trace(go.Scattergl(
+                x=x_axis,
+                y=indicators[key],
+                mode='lines',
+                name=name,
+                line=dict(color=color, width=2)
+            ))
+    
+    # Historical Events 표시 (모든 이벤트를 마커 trace 1개로)
+    if events:
+        event_dates = pd.to_datetime([date for date, _ in events], errors='coerce')
+        event_changes = np.array([change_pct for _, change_pct in events], dtype=float)
         
-        # 2. AI 분석 (API 키가 있는 경우에만 실행)
-        if api_key and api_key.strip():
-            try:
-                status_text.text("🤖 Running AI analysis...")
-                progress_bar.progress(60)
-                
-                analyst = AIAnalyst(api_key, model_name=gemini_model)
-                ai_report = analyst.generate_report(ticker, data, strategy, language=lang_code)
-                # 리포트에서 Score와 Verdict 추출
-                ai_score, verdict = analyst.extract_score_and_verdict(ai_report)
-                
-                st.session_state.ai_report = ai_report
-                st.session_state.ai_score = ai_score
-                st.session_state.verdict = verdict
-                
-                progress_bar.progress(100)
-                status_text.text("✅ Analysis complete!")
-                time.sleep(0.5)
-                progress_bar.empty()
-                status_text.empty()
-            except Exception as ai_error:
-                # AI 분석 실패해도 기본 지표는 계속 표시
-                st.warning(f"⚠️ AI analysis failed: {str(ai_error)}. Showing basic indicators only.")
-                st.session_state.ai_report = None
-                st.session_state.ai_score = None
-                st.session_state.verdict = None
-                progress_bar.progress(100)
-                status_text.text("✅ Basic analysis complete!")
-                time.sleep(0.5)
-                progress_bar.empty()
-                status_text.empty()
-        else:
-            # API 키가 없는 경우 기본 지표만 표시
-            st.session_state.ai_report = None
-            st.session_state.ai_score = None
-            st.session_state.verdict = None
-            progress_bar.progress(100)
-            status_text.text("✅ Basic analysis complete! (Enter API key for AI analysis)")
-            time.sleep(0.5)
-            progress_bar.empty()
-            status_text.empty()
+        # x_axis는 현지 시각 epoch ms이므로 날짜로 되돌려 날짜 단위로 비교
+        positions = pd.to_datetime(x_axis, unit='ms').normalize().get_indexer(event_dates)
+        mask = positions >= 0
         
-    except Exception as e:
-        st.error(f"❌ Error collecting data: {str(e)}")
-        st.stop()
+        if mask.any():
+            matched = positions[mask]
+            changes = event_changes[mask]
+            fig_price.add_trace(go.Scattergl(
+                x=x_axis[matched],
+                y=indicators['close'][matched],
+                mode='markers',
+                marker=dict(size=15, color=np.where(changes < 0, 'red', 'green'), symbol='diamond'),
+                name='Event',
+                hovertext=[f"Event: {change_pct:.2f}%" for change_pct in changes],
+                showlegend=False
+            ))
+    
+    fig_price.update_layout(
+        title="Stock Price with Moving Averages",
+        xaxis=dict(type='date', title=dict(text="Date")),
+        yaxis_title="Price ($)",
+        height=500,
+        xaxis_rangeslider_visible=False
+    )
+    return fig_price.to_dict()
 
-# 데이터가 있으면 탭 표시
-if st.session_state.data:
-    data = st.session_state.data
+
+def _hline_layout(lines: list) -> dict:
+    """
+    add_hline과 동일한 수평선 shape/annotation을 layout dict로 생성
+    
+    Args:
+        lines: (y, 라벨, 색상, dash) tuple 목록
+    """
+    return {
+        'shapes': [
+            dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=y, y1=y,
+                 line=dict(color=color, dash=dash))
+            for y, _, color, dash in lines
+        ],
+        'annotations': [
+            dict(text=text, xref='x domain', x=1, yref='y', y=y,
+                 xanchor='right', yanchor='bottom', showarrow=False)
+            for y, text, _, _ in lines
+        ]
+    }
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_close_fig(ticker: str, as_of: str, title: str) -> dict:
+    """
+    RSI/TRIX 차트 위에 표시하는 종가 라인 차트 생성 (ticker, 가격 데이터 기준 시점, 제목 기준 캐시)
+    """
+    indicators = compute_indicators(ticker, as_of)
+    
+    fig_close = go.Figure(
+        data=[go.Scattergl(
+            x=indicators['x'],
+            y=indicators['close'],
+            name='Close Price',
+            line=dict(color='blue', width=1)
+        )],
+        layout=dict(
+            title=title,
+            height=320,
+            xaxis=dict(type='date'),
+            yaxis=dict(title=dict(text="Price ($)")),
+            showlegend=True,
+            margin=dict(t=40, b=20)
+        )
+    )
+    return fig_close.to_dict()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_rsi_fig(ticker: str, as_of: str, current_rsi) -> dict:
+    """
+    RSI(14) 단독 차트 생성 (ticker, 가격 데이터 기준 시점, 현재 RSI 기준 캐시)
+    """
+    indicators = compute_indicators(ticker, as_of)
+    
+    # 데이터와 layout(Overbought/Oversold lines 포함)을 생성자 1회 호출로 구성
+    fig_rsi = go.Figure(
+        data=[go.Scattergl(
+            x=indicators['x'],
+            y=indicators['RSI'],
+            name='RSI',
+            line=dict(color='purple', width=2)
+        )],
+        layout=dict(
+            title=f'RSI(14) - Current: {current_rsi:.2f}' if current_rsi != 'N/A' else 'RSI(14)',
+            height=260,
+            xaxis=dict(type='date', title=dict(text="Date")),
+            yaxis=dict(title=dict(text="RSI"), range=[0, 100]),
+            showlegend=True,
+            margin=dict(t=40, b=20),
+            **_hline_layout([
+                (70, "Overbought (70)", "red", "dash"),
+                (30, "Oversold (30)", "green", "dash")
+            ])
+        )
+    )
+    return fig_rsi.to_dict()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_trix_fig(ticker: str, as_of: str, current_trix) -> dict:
+    """
+    TRIX(30) + Signal 단독 차트 생성
+    
+    Args:
+        ticker: 종목 티커
+        as_of: history_as_of 결과 (주가 데이터가 갱신되면 캐시 무효화)
+        current_trix: 현재 TRIX 값 (차트 제목 표시용)
+    """
+    indicators = compute_indicators(ticker, as_of)
+    x_axis = indicators['x']
+    
+    # TRIX/Signal 라인과 layout(제목/축/Zero line)을 생성자 1회 호출로 구성
+    fig_trix = go.Figure(
+        data=[
+            go.Scattergl(
+                x=x_axis,
+                y=indicators['TRIX'],
+                name='TRIX',
+                line=dict(color='purple', width=2)
+            ),
+            go.Scattergl(
+                x=x_axis,
+                y=indicators['TRIX_SIG'],
+                name='TRIX Signal',
+                line=dict(color='orange', width=1, dash='dash')
+            )
+        ],
+        layout=dict(
+            title=f'TRIX(30) - Current: {current_trix:.4f}' if current_trix != 'N/A' else 'TRIX(30)',
+            height=260,
+            xaxis=dict(type='date', title=dict(text="Date")),
+            yaxis=dict(title=dict(text="TRIX")),
+            showlegend=True,
+            margin=dict(t=40, b=20),
+            **_hline_layout([(0, "Zero Line", "gray", "dot")])
+        )
+    )
+    return fig_trix.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_forensic_df(metrics_json: str) -> pd.DataFrame:
+    """
+    Forensic Check 테이블 생성 (metrics JSON 문자열 기준 캐시 - 탭 전환 시 재생성 방지)
+    """
+    flat = flatten_metrics(json.loads(metrics_json))
+    
+    forensic_data = []
+    
+    # Quality of Earnings
+    qoe_value = flat.get('quality_of_earnings.latest', 'N/A')
+    qoe_status = "✅" if (qoe_value != 'N/A' and isinstance(qoe_value, (int, float)) and qoe_value >= 1.0) else "⚠️" if flat.get('quality_of_earnings.warning') else "N/A"
+    forensic_data.append({
+        "Metric": "Quality of Earnings (OCF/Net Income)",
+        "Value": qoe_value,
+        "Trend": flat.get('quality_of_earnings.trend', 'N/A'),
+        "Status": qoe_status
+    })
+    
+    # Receivables Turnover
+    rt_trend = flat.get('receivables_turnover.trend', 'N/A')
+    forensic_data.append({
+        "Metric": "Receivables Turnover",
+        "Value": flat.get('receivables_turnover.latest', 'N/A'),
+        "Trend": rt_trend,
+        "Status": "✅" if rt_trend == 'Improving' else "⚠️" if rt_trend == 'Declining' else "N/A"
+    })
+    
+    # Inventory Turnover
+    it_trend = flat.get('inventory_turnover.trend', 'N/A')
+    forensic_data.append({
+        "Metric": "Inventory Turnover",
+        "Value": flat.get('inventory_turnover.latest', 'N/A'),
+        "Trend": it_trend,
+        "Status": "✅" if it_trend == 'Improving' else "⚠️" if it_trend == 'Declining' else "N/A"
+    })
+    
+    # Interest Coverage
+    ic_status = flat.get('interest_coverage.status', 'N/A')
+    forensic_data.append({
+        "Metric": "Interest Coverage Ratio",
+        "Value": flat.get('interest_coverage.latest', 'N/A'),
+        "Trend": ic_status,
+        "Status": "✅" if ic_status == 'Strong' else "⚠️" if ic_status == 'Weak' else "🔴" if ic_status == 'Critical' else "N/A"
+    })
+    
+    # Debt to Equity
+    dte_status = flat.get('debt_to_equity.status', 'N/A')
+    forensic_data.append({
+        "Metric": "Debt to Equity Ratio",
+        "Value": flat.get('debt_to_equity.latest', 'N/A'),
+        "Trend": dte_status,
+        "Status": "✅" if dte_status == 'Low' else "⚠️" if dte_status == 'Moderate' else "🔴" if dte_status == 'High' else "N/A"
+    })
+    
+    # CapEx Growth
+    capex_latest = flat.get('capex_growth.latest', 'N/A')
+    capex_trend = flat.get('capex_growth.trend', 'N/A')
+    forensic_data.append({
+        "Metric": "CapEx Growth",
+        "Value": f"{capex_latest}%" if capex_latest != 'N/A' else "N/A",
+        "Trend": capex_trend,
+        "Status": "✅" if capex_trend == 'Expanding' else "N/A"
+    })
+    
+    # Net Buyback Yield
+    buyback_latest = flat.get('net_buyback_yield.latest', 'N/A')
+    buyback_status = flat.get('net_buyback_yield.status', 'N/A')
+    forensic_data.append({
+        "Metric": "Net Buyback Yield",
+        "Value": f"{buyback_latest}%" if buyback_latest != 'N/A' else "N/A",
+        "Trend": buyback_status,
+        "Status": "✅" if buyback_status == 'Positive' else "N/A"
+    })
+    
+    df_forensic = pd.DataFrame(forensic_data)
+    # 숫자/문자열이 섞인 Value 컬럼을 한 번에 문자열로 포맷팅
+    df_forensic['Value'] = format_series(df_forensic['Value'])
+    return df_forensic
+
+
+# Performance Radar 축 순서대로의 지표 경로 (None = 현재 RSI)
+_RADAR_PATHS = (
+    'capex_growth.latest',         # Growth
+    'interest_coverage.latest',    # Stability
+    'quality_of_earnings.latest',  # Profitability
+    None,                          # Momentum
+    'net_buyback_yield.latest'     # Value
+)
+
+
+@st.cache_data(show_spinner=False)
+def build_radar_values(metrics_json: str, current_rsi) -> list:
+    """
+    Performance Radar 값 [Growth, Stability, Profitability, Momentum, Value] 계산 (metrics JSON 기준 캐시)
+    
+    숫자로 변환할 수 없는 값(N/A 등)은 50, 범위는 차트 축과 같은 0~100
+    """
+    flat = flatten_metrics(json.loads(metrics_json))
+    raw = [current_rsi if path is None else flat.get(path, 50) for path in _RADAR_PATHS]
+    scores = pd.to_numeric(pd.Series(raw, dtype=object), errors='coerce').fillna(50).clip(0, 100)
+    return scores.tolist()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def render_news_html(link: str, title: str, publisher: str, publish_time: str, summary: str) -> str:
+    """
+    뉴스 1건의 상세 정보를 HTML 블록 1개로 생성 (뉴스 항목은 불변이므로 내용 기준 캐시)
+    
+    외부 뉴스 텍스트는 unsafe_allow_html로 출력되므로 모두 escape 처리
+    """
+    rows = [
+        f"<b>Publisher:</b> {html.escape(str(publisher))}",
+        f"<b>Published:</b> {html.escape(str(publish_time))}",
+    ]
+    if link and link != 'N/A':
+        safe_link = html.escape(str(link), quote=True)
+        rows.append(f'<b>Link:</b> <a href="{safe_link}" target="_blank">{safe_link}</a>')
+    else:
+        rows.append("<b>Link:</b> N/A")
+    if summary and summary != 'N/A':
+        rows.append(f"<b>Summary:</b> {html.escape(str(summary))}")
+    return f'<div class="news-item" title="{html.escape(str(title), quote=True)}">' + "<br><br>".join(rows) + "</div>"
+
+
+def _numeric_column(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """
+    후보 컬럼 중 처음 존재하는 컬럼을 숫자 Series로 반환 (없으면 NaN Series)
+    """
+    for column in columns:
+        if column in df.columns:
+            return pd.to_numeric(df[column], errors='coerce')
+    return pd.Series(np.nan, index=df.index, dtype=float)
+
+
+def _extract_income_series(income_stmt: pd.DataFrame) -> tuple:
+    """
+    손익계산서에서 (날짜, Revenue, Net Income) 리스트 추출 - 결측/비숫자 값은 0
+    """
+    dates = income_stmt.index.astype(str).str[:10].tolist()  # 날짜만 추출 (YYYY-MM-DD)
+    revenue = _numeric_column(income_stmt, 'Total Revenue').fillna(0)
+    net_income = _numeric_column(income_stmt, 'Net Income').fillna(0)
+    return dates, revenue.tolist(), net_income.tolist()
+
+
+def _extract_cashflow_series(cashflow: pd.DataFrame) -> tuple:
+    """
+    현금흐름표에서 (날짜, Free Cash Flow, CapEx) 리스트 추출 - 결측/비숫자 값은 0
+    
+    Free Cash Flow 컬럼이 없으면 Operating Cash Flow - |CapEx| 로 계산
+    CapEx는 음수로 저장되므로 절댓값 사용
+    """
+    dates = cashflow.index.astype(str).str[:10].tolist()
+    capex = _numeric_column(cashflow, 'Capital Expenditure')
+    if 'Free Cash Flow' in cashflow.columns:
+        fcf = _numeric_column(cashflow, 'Free Cash Flow')
+    else:
+        ocf = _numeric_column(cashflow, 'Operating Cash Flow', 'Cash Flow From Continuing Operating Activities')
+        fcf = ocf - capex.abs()
+    return dates, fcf.fillna(0).tolist(), capex.abs().fillna(0).tolist()
+
+
+@st.fragment
+def _render_summary_tab(data: dict, strategy: str, api_key: str) -> None:
+    """
+    Tab 1: Summary & Analysis 렌더링 (탭 내부 위젯 상호작용 시 해당 탭만 재실행)
+    """
     profile = data.get('profile', {})
     
-    # 헤더 정보
-    col1, col2, col3, col4 = st.columns(4)
+    st.header("Summary & Analysis")
+    
+    # Company Profile 요약 (항상 표시)
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
     with col1:
         st.metric("Company", profile.get('longName', 'N/A'))
+        st.caption(f"Sector: {profile.get('sector', 'N/A')}")
     with col2:
-        st.metric("Ticker", ticker)
-    with col3:
         current_price = profile.get('currentPrice', 'N/A')
         change_pct = profile.get('changePercent', 'N/A')
-        if current_price != 'N/A' and change_pct != 'N/A':
-            st.metric("Current Price", f"${current_price:.2f}", f"{change_pct:.2f}%")
-        else:
-            st.metric("Current Price", "N/A")
+        st.metric("Current Price", f"${current_price}", f"{change_pct}%")
+        st.caption(f"Industry: {profile.get('industry', 'N/A')}")
+    with col3:
+        st.metric("Market Cap", f"${format_number(profile.get('marketCap', 'N/A'))}")
+        st.caption(f"Country: {profile.get('country', 'N/A')}")
     with col4:
-        if st.session_state.ai_score is not None:
-            st.metric("AI Score", f"{st.session_state.ai_score}/100")
-        else:
-            st.metric("AI Score", "N/A")
+        roe = profile.get('roe', 'N/A')
+        roe_display = f"{roe*100:.2f}%" if isinstance(roe, (int, float)) else 'N/A'
+        st.metric("ROE", roe_display)
+        st.caption("Return on Equity")
+    with col5:
+        trailing_pe = profile.get('trailingPE', 'N/A')
+        trailing_pe_display = f"{trailing_pe:.2f}" if isinstance(trailing_pe, (int, float)) else 'N/A'
+        st.metric("Trailing P/E", trailing_pe_display)
+        st.caption("Trailing Price to Earnings")
+    with col6:
+        forward_pe = profile.get('forwardPE', 'N/A')
+        forward_pe_display = f"{forward_pe:.2f}" if isinstance(forward_pe, (int, float)) else 'N/A'
+        st.metric("Forward P/E", forward_pe_display)
+        st.caption("Forward Price to Earnings")
     
-    # Verdict 배지 (API 키가 있고 AI 분석이 완료된 경우에만 표시)
-    if st.session_state.verdict:
-        st.markdown(f"### {st.session_state.verdict}")
-    elif not api_key or not api_key.strip():
-        st.info("💡 Enter your Gemini API Key in the sidebar to get AI analysis and investment verdict.")
+    # Beta와 Strategy 추가 행
+    col_beta, col_strategy = st.columns(2)
+    with col_beta:
+        st.metric("Beta", profile.get('beta', 'N/A'))
+    with col_strategy:
+        st.metric("Strategy", strategy)
     
     st.markdown("---")
     
-    # 탭 생성
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Summary & Analysis", "💰 Financials", "📊 Technicals", "📊 Raw Data", "💬 AI Chat"])
-    
-    # Tab 1: Summary & Analysis (통합)
-    with tab1:
-        st.header("Summary & Analysis")
-        
-        # Company Profile 요약 (항상 표시)
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        with col1:
-            st.metric("Company", profile.get('longName', 'N/A'))
-            st.caption(f"Sector: {profile.get('sector', 'N/A')}")
-        with col2:
-            current_price = profile.get('currentPrice', 'N/A')
-            change_pct = profile.get('changePercent', 'N/A')
-            st.metric("Current Price", f"${current_price}", f"{change_pct}%")
-            st.caption(f"Industry: {profile.get('industry', 'N/A')}")
-        with col3:
-            st.metric("Market Cap", f"${format_number(profile.get('marketCap', 'N/A'))}")
-            st.caption(f"Country: {profile.get('country', 'N/A')}")
-        with col4:
-            roe = profile.get('roe', 'N/A')
-            roe_display = f"{roe*100:.2f}%" if isinstance(roe, (int, float)) else 'N/A'
-            st.metric("ROE", roe_display)
-            st.caption("Return on Equity")
-        with col5:
-            trailing_pe = profile.get('trailingPE', 'N/A')
-            trailing_pe_display = f"{trailing_pe:.2f}" if isinstance(trailing_pe, (int, float)) else 'N/A'
-            st.metric("Trailing P/E", trailing_pe_display)
-            st.caption("Trailing Price to Earnings")
-        with col6:
-            forward_pe = profile.get('forwardPE', 'N/A')
-            forward_pe_display = f"{forward_pe:.2f}" if isinstance(forward_pe, (int, float)) else 'N/A'
-            st.metric("Forward P/E", forward_pe_display)
-            st.caption("Forward Price to Earnings")
-        
-        # Beta와 Strategy 추가 행
-        col_beta, col_strategy = st.columns(2)
-        with col_beta:
-            st.metric("Beta", profile.get('beta', 'N/A'))
-        with col_strategy:
-            st.metric("Strategy", strategy)
-        
-        st.markdown("---")
-        
-        # AI 리포트 전체 표시
-        if st.session_state.ai_report:
-            st.subheader("AI Analysis Report")
-            st.markdown(st.session_state.ai_report)
-        elif not api_key or not api_key.strip():
-            st.info("💡 **AI Report Not Available**\n\nTo view AI-powered analysis and insights, please enter your Gemini API Key in the sidebar and run the analysis again.")
-            st.markdown("---")
-            st.subheader("Quick Summary (Basic Indicators)")
-            financials = data.get('financials', {})
-            metrics = financials.get('derived_metrics', {})
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write(f"**Quality of Earnings:** {metrics.get('quality_of_earnings', {}).get('latest', 'N/A')}")
-                st.write(f"**Interest Coverage:** {metrics.get('interest_coverage', {}).get('latest', 'N/A')} ({metrics.get('interest_coverage', {}).get('status', 'N/A')})")
-            with col2:
-                st.write(f"**Receivables Turnover:** {metrics.get('receivables_turnover', {}).get('latest', 'N/A')}")
-                st.write(f"**Inventory Turnover:** {metrics.get('inventory_turnover', {}).get('latest', 'N/A')}")
-        else:
-            st.info("Run analysis to see the comprehensive analysis report.")
-        
+    # AI 리포트 전체 표시
+    if st.session_state.ai_report:
+        st.subheader("AI Analysis Report")
+        st.markdown(st.session_state.ai_report)
+    elif not api_key or not api_key.strip():
+        st.info("💡 **AI Report Not Available**\n\nTo view AI-powered analysis and insights, please enter your Gemini API Key in the sidebar and run the analysis again.")
         st.markdown("---")
+        st.subheader("Quick Summary (Basic Indicators)")
+        financials = data.get('financials', {})
+        flat = flatten_metrics(financials.get('derived_metrics', {}))
         
-        # Performance Radar Chart - 항상 표시 (데이터가 있을 때만)
-        if st.session_state.data:
-            st.subheader("Performance Radar")
-            
-            financials = data.get('financials', {})
-            metrics = financials.get('derived_metrics', {})
-            technicals = data.get('technicals', {})
-            
-            # 지표 값 추출 (N/A 처리)
-            def safe_get(value, default=50):
-                if value == 'N/A' or value is None:
-                    return default
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return default
-            
-            growth_score = safe_get(metrics.get('capex_growth', {}).get('latest', 50), 50)
-            stability_score = safe_get(metrics.get('interest_coverage', {}).get('latest', 50), 50)
-            profitability_score = safe_get(metrics.get('quality_of_earnings', {}).get('latest', 50), 50)
-            momentum_score = safe_get(technicals.get('current_rsi', 50), 50)
-            value_score = safe_get(metrics.get('net_buyback_yield', {}).get('latest', 50), 50)
-            
-            # Radar Chart
-            fig_radar = go.Figure()
-            
-            fig_radar.add_trace(go.Scatterpolar(
-                r=[growth_score, stability_score, profitability_score, momentum_score, value_score],
-                theta=['Growth', 'Stability', 'Profitability', 'Momentum', 'Value'],
-                fill='toself',
-                name='Performance'
-            ))
-            
-            fig_radar.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 100]
-                    )),
-                showlegend=True,
-                title="Performance Radar Chart"
-            )
-            
-            st.plotly_chart(fig_radar, use_container_width=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Quality of Earnings:** {flat.get('quality_of_earnings.latest', 'N/A')}")
+            st.write(f"**Interest Coverage:** {flat.get('interest_coverage.latest', 'N/A')} ({flat.get('interest_coverage.status', 'N/A')})")
+        with col2:
+            st.write(f"**Receivables Turnover:** {flat.get('receivables_turnover.latest', 'N/A')}")
+            st.write(f"**Inventory Turnover:** {flat.get('inventory_turnover.latest', 'N/A')}")
+    else:
+        st.info("Run analysis to see the comprehensive analysis report.")
     
-    # Tab 2: Financials
-    with tab2:
-        st.header("Financial Health")
+    st.markdown("---")
+    
+    # Performance Radar Chart - 항상 표시 (데이터가 있을 때만)
+    if st.session_state.data:
+        st.subheader("Performance Radar")
         
         financials = data.get('financials', {})
         metrics = financials.get('derived_metrics', {})
-        raw_data = financials.get('raw_data', {})
-        annual_data = raw_data.get('annual', {})
-        
-        # Forensic Check Table
-        st.subheader("Forensic Check")
-        
-        forensic_data = []
-        
-        # Quality of Earnings
-        qoe = metrics.get('quality_of_earnings', {})
-        qoe_value = qoe.get('latest', 'N/A')
-        qoe_status = "✅" if (qoe_value != 'N/A' and isinstance(qoe_value, (int, float)) and qoe_value >= 1.0) else "⚠️" if qoe.get('warning') else "N/A"
-        forensic_data.append({
-            "Metric": "Quality of Earnings (OCF/Net Income)",
-            "Value": qoe_value if qoe_value != 'N/A' else "N/A",
-            "Trend": qoe.get('trend', 'N/A'),
-            "Status": qoe_status
-        })
-        
-        # Receivables Turnover
-        rt = metrics.get('receivables_turnover', {})
-        forensic_data.append({
-            "Metric": "Receivables Turnover",
-            "Value": rt.get('latest', 'N/A'),
-            "Trend": rt.get('trend', 'N/A'),
-            "Status": "✅" if rt.get('trend') == 'Improving' else "⚠️" if rt.get('trend') == 'Declining' else "N/A"
-        })
+        technicals = data.get('technicals', {})
         
-        # Inventory Turnover
-        it = metrics.get('inventory_turnover', {})
-        forensic_data.append({
-            "Metric": "Inventory Turnover",
-            "Value": it.get('latest', 'N/A'),
-            "Trend": it.get('trend', 'N/A'),
-            "Status": "✅" if it.get('trend') == 'Improving' else "⚠️" if it.get('trend') == 'Declining' else "N/A"
-        })
+        # 지표 값 추출 (N/A 처리)
+        radar_values = build_radar_values(
+            json.dumps(metrics, default=str, sort_keys=True),
+            technicals.get('current_rsi', 50)
+        )
         
-        # Interest Coverage
-        ic = metrics.get('interest_coverage', {})
-        forensic_data.append({
-            "Metric": "Interest Coverage Ratio",
-            "Value": ic.get('latest', 'N/A'),
-            "Trend": ic.get('status', 'N/A'),
-            "Status": "✅" if ic.get('status') == 'Strong' else "⚠️" if ic.get('status') == 'Weak' else "🔴" if ic.get('status') == 'Critical' else "N/A"
-        })
+        # Radar Chart
+        fig_radar = go.Figure()
         
-        # Debt to Equity
-        dte = metrics.get('debt_to_equity', {})
-        dte_status = "✅" if dte.get('status') == 'Low' else "⚠️" if dte.get('status') == 'Moderate' else "🔴" if dte.get('status') == 'High' else "N/A"
-        forensic_data.append({
-            "Metric": "Debt to Equity Ratio",
-            "Value": dte.get('latest', 'N/A'),
-            "Trend": dte.get('status', 'N/A'),
-            "Status": dte_status
-        })
+        fig_radar.add_trace(go.Scatterpolar(
+            r=radar_values,
+            theta=['Growth', 'Stability', 'Profitability', 'Momentum', 'Value'],
+            fill='toself',
+            name='Performance'
+        ))
         
-        # CapEx Growth
-        capex = metrics.get('capex_growth', {})
-        forensic_data.append({
-            "Metric": "CapEx Growth",
-            "Value": f"{capex.get('latest', 'N/A')}%" if capex.get('latest') != 'N/A' else "N/A",
-            "Trend": capex.get('trend', 'N/A'),
-            "Status": "✅" if capex.get('trend') == 'Expanding' else "N/A"
-        })
+        fig_radar.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100]
+                )),
+            showlegend=True,
+            title="Performance Radar Chart"
+        )
         
-        # Net Buyback Yield
-        buyback = metrics.get('net_buyback_yield', {})
-        forensic_data.append({
-            "Metric": "Net Buyback Yield",
-            "Value": f"{buyback.get('latest', 'N/A')}%" if buyback.get('latest') != 'N/A' else "N/A",
-            "Trend": buyback.get('status', 'N/A'),
-            "Status": "✅" if buyback.get('status') == 'Positive' else "N/A"
-        })
+        st.plotly_chart(fig_radar, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+
+
+@st.fragment
+def _render_financials_tab(data: dict) -> None:
+    """
+    Tab 2: Financials 렌더링 (탭 내부 위젯 상호작용 시 해당 탭만 재실행)
+    """
+    st.header("Financial Health")
+    
+    financials = data.get('financials', {})
+    metrics = financials.get('derived_metrics', {})
+    raw_data = financials.get('raw_data', {})
+    annual_data = raw_data.get('annual', {})
+    
+    # Forensic Check Table
+    st.subheader("Forensic Check")
+    
+    df_forensic = build_forensic_df(json.dumps(metrics, default=str, sort_keys=True))
+    st.dataframe(df_forensic, use_container_width=True, hide_index=True)
+    
+    # Revenue & Net Income Chart
+    st.subheader("Revenue & Net Income (3 Years)")
+    
+    if annual_data and not annual_data.get('income_stmt', pd.DataFrame()).empty:
+        income_stmt = annual_data['income_stmt']
         
-        df_forensic = pd.DataFrame(forensic_data)
-        st.dataframe(df_forensic, use_container_width=True, hide_index=True)
+        try:
+            # 데이터 구조: 인덱스가 날짜, 컬럼이 재무 항목 (컬럼 단위로 한 번에 추출)
+            dates, revenue_data, net_income_data = _extract_income_series(income_stmt)
+            
+            if dates and (any(revenue_data) or any(net_income_data)):
+                fig_financials = go.Figure()
+                
+                if any(revenue_data):
+                    fig_financials.add_trace(
+                        go.Bar(name="Revenue", x=dates, y=revenue_data, marker_color='blue')
+                    )
+                
+                if any(net_income_data):
+                    fig_financials.add_trace(
+                        go.Bar(name="Net Income", x=dates, y=net_income_data, marker_color='green')
+                    )
+                
+                fig_financials.update_layout(
+                    title="Revenue & Net Income (Annual)",
+                    xaxis_title="Year",
+                    yaxis_title="Amount ($)",
+                    barmode='group',
+                    height=400
+                )
+                
+                st.plotly_chart(fig_financials, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+            else:
+                st.info("Financial data not available for charting.")
+                
+        except Exception as e:
+            st.warning(f"Could not create financial chart: {str(e)}")
+    else:
+        st.info("Financial data not available.")
+    
+    # Free Cash Flow vs CapEx Chart
+    st.subheader("Free Cash Flow vs CapEx")
+    
+    if annual_data and not annual_data.get('cashflow', pd.DataFrame()).empty:
+        cashflow = annual_data['cashflow']
         
-        # Revenue & Net Income Chart
-        st.subheader("Revenue & Net Income (3 Years)")
+        try:
+            # 데이터 구조: 인덱스가 날짜, 컬럼이 재무 항목 (컬럼 단위로 한 번에 추출)
+            dates, fcf_data, capex_data = _extract_cashflow_series(cashflow)
+            
+            if dates:
+                fig_cashflow = go.Figure()
+                
+                fig_cashflow.add_trace(go.Scatter(
+                    x=dates,
+                    y=fcf_data,
+                    mode='lines+markers',
+                    name='Free Cash Flow',
+                    line=dict(color='green', width=2)
+                ))
+                
+                fig_cashflow.add_trace(go.Scatter(
+                    x=dates,
+                    y=capex_data,
+                    mode='lines+markers',
+                    name='CapEx',
+                    line=dict(color='orange', width=2)
+                ))
+                
+                fig_cashflow.update_layout(
+                    title="Free Cash Flow vs CapEx (Annual)",
+                    xaxis_title="Year",
+                    yaxis_title="Amount ($)",
+                    height=400
+                )
+                
+                st.plotly_chart(fig_cashflow, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+            else:
+                st.info("Cash flow data not available for charting.")
+                
+        except Exception as e:
+            st.warning(f"Could not create cash flow chart: {str(e)}")
+    else:
+        st.info("Cash flow data not available.")
+    
+    st.markdown("---")
+    
+    # Quarterly Charts
+    quarterly_data = raw_data.get('quarterly', {})
+    quarterly_status = financials.get('quarterly_data_status', {})
+    
+    if quarterly_status and quarterly_status.get('has_data'):
+        # Quarterly Revenue & Net Income Chart
+        st.subheader("Revenue & Net Income (Quarterly)")
         
-        if annual_data and not annual_data.get('income_stmt', pd.DataFrame()).empty:
-            income_stmt = annual_data['income_stmt']
+        if quarterly_data and not quarterly_data.get('income_stmt', pd.DataFrame()).empty:
+            q_income_stmt = quarterly_data['income_stmt']
             
             try:
-                # 데이터 구조: 인덱스가 날짜, 컬럼이 재무 항목
-                dates = []
-                revenue_data = []
-                net_income_data = []
+                # 최신순 정렬 후 최근 12개 쿼터만
+                q_income_recent = q_income_stmt.sort_index(ascending=False).iloc[:12]
+                dates, q_revenue_data, q_net_income_data = _extract_income_series(q_income_recent)
                 
-                # 인덱스에서 날짜 추출
-                for date in income_stmt.index:
-                    dates.append(str(date)[:10])  # 날짜만 추출 (YYYY-MM-DD)
-                    
-                    # Total Revenue 추출
-                    if 'Total Revenue' in income_stmt.columns:
-                        rev = income_stmt.loc[date, 'Total Revenue']
-                        if pd.notna(rev) and rev != 'N/A':
-                            try:
-                                revenue_data.append(float(rev))
-                            except (ValueError, TypeError):
-                                revenue_data.append(0)
-                        else:
-                            revenue_data.append(0)
-                    else:
-                        revenue_data.append(0)
+                if dates and (any(q_revenue_data) or any(q_net_income_data)):
+                    fig_q_financials = go.Figure()
                     
-                    # Net Income 추출
-                    if 'Net Income' in income_stmt.columns:
-                        ni = income_stmt.loc[date, 'Net Income']
-                        if pd.notna(ni) and ni != 'N/A':
-                            try:
-                                net_income_data.append(float(ni))
-                            except (ValueError, TypeError):
-                                net_income_data.append(0)
-                        else:
-                            net_income_data.append(0)
-                    else:
-                        net_income_data.append(0)
-                
-                if dates and (any(revenue_data) or any(net_income_data)):
-                    fig_financials = go.Figure()
+                    # 날짜를 역순으로 표시 (오래된 것부터)
+                    dates_display = dates[::-1]
+                    q_revenue_display = q_revenue_data[::-1]
+                    q_net_income_display = q_net_income_data[::-1]
                     
-                    if any(revenue_data):
-                        fig_financials.add_trace(
-                            go.Bar(name="Revenue", x=dates, y=revenue_data, marker_color='blue')
+                    if any(q_revenue_display):
+                        fig_q_financials.add_trace(
+                            go.Bar(name="Revenue", x=dates_display, y=q_revenue_display, marker_color='blue')
                         )
                     
-                    if any(net_income_data):
-                        fig_financials.add_trace(
-                            go.Bar(name="Net Income", x=dates, y=net_income_data, marker_color='green')
+                    if any(q_net_income_display):
+                        fig_q_financials.add_trace(
+                            go.Bar(name="Net Income", x=dates_display, y=q_net_income_display, marker_color='green')
                         )
                     
-                    fig_financials.update_layout(
-                        title="Revenue & Net Income (Annual)",
-                        xaxis_title="Year",
+                    fig_q_financials.update_layout(
+                        title="Quarterly Revenue & Net Income",
+                        xaxis_title="Quarter",
                         yaxis_title="Amount ($)",
                         barmode='group',
-                        height=400
+                        height=400,
+                        xaxis_tickangle=-45
                     )
                     
-                    st.plotly_chart(fig_financials, use_container_width=True)
+                    st.plotly_chart(fig_q_financials, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
                 else:
-                    st.info("Financial data not available for charting.")
+                    st.info("Quarterly financial data not available for charting.")
                     
             except Exception as e:
-                st.warning(f"Could not create financial chart: {str(e)}")
+                st.warning(f"Could not create quarterly financial chart: {str(e)}")
         else:
-            st.info("Financial data not available.")
+            st.info("Quarterly income statement data not available.")
         
-        # Free Cash Flow vs CapEx Chart
-        st.subheader("Free Cash Flow vs CapEx")
+        # Quarterly Free Cash Flow vs CapEx Chart
+        st.subheader("Free Cash Flow vs CapEx (Quarterly)")
         
-        if annual_data and not annual_data.get('cashflow', pd.DataFrame()).empty:
-            cashflow = annual_data['cashflow']
+        if quarterly_data and not quarterly_data.get('cashflow', pd.DataFrame()).empty:
+            q_cashflow = quarterly_data['cashflow']
             
             try:
-                dates = []
-                fcf_data = []
-                capex_data = []
-                
-                # 데이터 구조: 인덱스가 날짜, 컬럼이 재무 항목
-                for date in cashflow.index:
-                    dates.append(str(date)[:10])  # 날짜만 추출
-                    
-                    # Free Cash Flow (직접 사용 가능)
-                    fcf = None
-                    if 'Free Cash Flow' in cashflow.columns:
-                        fcf = cashflow.loc[date, 'Free Cash Flow']
-                    else:
-                        # Free Cash Flow = Operating Cash Flow - CapEx (계산)
-                        ocf = None
-                        capex = None
-                        
-                        if 'Operating Cash Flow' in cashflow.columns:
-                            ocf = cashflow.loc[date, 'Operating Cash Flow']
-                        elif 'Cash Flow From Continuing Operating Activities' in cashflow.columns:
-                            ocf = cashflow.loc[date, 'Cash Flow From Continuing Operating Activities']
-                        
-                        if 'Capital Expenditure' in cashflow.columns:
-                            capex = cashflow.loc[date, 'Capital Expenditure']
-                        
-                        if pd.notna(ocf) and ocf != 'N/A' and pd.notna(capex) and capex != 'N/A':
-                            try:
-                                fcf = float(ocf) - abs(float(capex))
-                            except (ValueError, TypeError):
-                                fcf = None
-                    
-                    if pd.notna(fcf) and fcf != 'N/A':
-                        try:
-                            fcf_data.append(float(fcf))
-                        except (ValueError, TypeError):
-                            fcf_data.append(0)
-                    else:
-                        fcf_data.append(0)
-                    
-                    # Capital Expenditure (음수이므로 절댓값 사용)
-                    capex = None
-                    if 'Capital Expenditure' in cashflow.columns:
-                        capex = cashflow.loc[date, 'Capital Expenditure']
-                    
-                    if pd.notna(capex) and capex != 'N/A':
-                        try:
-                            capex_data.append(abs(float(capex)))  # CapEx는 음수로 저장되므로 절댓값
-                        except (ValueError, TypeError):
-                            capex_data.append(0)
-                    else:
-                        capex_data.append(0)
+                # 최신순 정렬 후 최근 12개 쿼터만
+                q_cashflow_recent = q_cashflow.sort_index(ascending=False).iloc[:12]
+                dates, q_fcf_data, q_capex_data = _extract_cashflow_series(q_cashflow_recent)
                 
                 if dates:
-                    fig_cashflow = go.Figure()
+                    fig_q_cashflow = go.Figure()
+                    
+                    # 날짜를 역순으로 표시
+                    dates_display = dates[::-1]
+                    q_fcf_display = q_fcf_data[::-1]
+                    q_capex_display = q_capex_data[::-1]
                     
-                    fig_cashflow.add_trace(go.Scatter(
-                        x=dates,
-                        y=fcf_data,
+                    fig_q_cashflow.add_trace(go.Scatter(
+                        x=dates_display,
+                        y=q_fcf_display,
                         mode='lines+markers',
                         name='Free Cash Flow',
                         line=dict(color='green', width=2)
                     ))
                     
-                    fig_cashflow.add_trace(go.Scatter(
-                        x=dates,
-                        y=capex_data,
+                    fig_q_cashflow.add_trace(go.Scatter(
+                        x=dates_display,
+                        y=q_capex_display,
                         mode='lines+markers',
                         name='CapEx',
                         line=dict(color='orange', width=2)
                     ))
                     
-                    fig_cashflow.update_layout(
-                        title="Free Cash Flow vs CapEx (Annual)",
-                        xaxis_title="Year",
+                    fig_q_cashflow.update_layout(
+                        title="Free Cash Flow vs CapEx (Quarterly)",
+                        xaxis_title="Quarter",
                         yaxis_title="Amount ($)",
-                        height=400
+                        height=400,
+                        xaxis_tickangle=-45
                     )
                     
-                    st.plotly_chart(fig_cashflow, use_container_width=True)
+                    st.plotly_chart(fig_q_cashflow, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
                 else:
-                    st.info("Cash flow data not available for charting.")
+                    st.info("Quarterly cash flow data not available for charting.")
                     
             except Exception as e:
-                st.warning(f"Could not create cash flow chart: {str(e)}")
+                st.warning(f"Could not create quarterly cash flow chart: {str(e)}")
         else:
-            st.info("Cash flow data not available.")
+            st.info("Quarterly cash flow data not available.")
+    else:
+        st.info("💡 **Quarterly data not available**\n\nQuarterly financial charts require quarterly data from yfinance. This data may not be available for all tickers.")
+
+
+@st.fragment
+def _render_technicals_tab(ticker: str, data: dict) -> None:
+    """
+    Tab 3: Technicals 렌더링 (탭 내부 위젯 상호작용 시 해당 탭만 재실행)
+    """
+    st.header("Timing & Technical Analysis")
+    
+    technicals = data.get('technicals', {})
+    
+    if technicals.get('error'):
+        st.error(f"Error loading technical data: {technicals.get('error')}")
+    else:
+        # 주가 히스토리 및 지표는 1회만 계산하여 세 차트에서 공유 (Technicals 수치와 같은 주가 데이터 기준)
+        as_of = history_as_of(technicals.get('price_data'))
+        try:
+            indicators = compute_indicators(ticker, as_of)
+        except Exception as e:
+            st.warning(f"Could not load price history: {str(e)}")
+            indicators = {'hist': pd.DataFrame()}
+        hist = indicators['hist']
+        
+        # Price Chart with MA Lines
+        st.subheader("Price Chart with Moving Averages")
+        
+        try:
+            if not hist.empty:
+                # Moving Averages (실제 계산된 값이 있는 MA만 표시)
+                ma_data = technicals.get('ma_data', {})
+                ma_keys = tuple(
+                    key for key in ('MA_20', 'MA_60', 'MA_120')
+                    if ma_data.get(key) != 'N/A'
+                )
+                
+                # Historical Events (캐시 키로 쓰기 위해 hashable한 tuple로 변환)
+                news_context = data.get('news_context', {})
+                historical_events = news_context.get('historical_events', [])
+                events = tuple(
+                    (event.get('date', ''), event.get('change_pct', 0))
+                    for event in historical_events[:5]
+                )
+                
+                fig_price = go.Figure(build_price_fig(ticker, as_of, ma_keys, events))
+                st.plotly_chart(fig_price, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+            else:
+                st.info("Price data not available.")
+                
+        except Exception as e:
+            st.warning(f"Could not create price chart: {str(e)}")
+        
+        # RSI Sub-chart
+        st.subheader("RSI Indicator")
+        
+        try:
+            if not hist.empty and len(hist) >= 14:
+                current_rsi = technicals.get('current_rsi', 'N/A')
+                # 가격/RSI를 독립된 작은 차트로 분리 (subplot 레이아웃 재계산 방지)
+                with st.container():
+                    st.plotly_chart(go.Figure(build_close_fig(ticker, as_of, "Price & RSI(14) Indicator")), use_container_width=True, theme=None, config=PLOTLY_CONFIG, key='rsi_close_chart')
+                with st.container():
+                    st.plotly_chart(go.Figure(build_rsi_fig(ticker, as_of, current_rsi)), use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+            else:
+                st.info("RSI data not available (insufficient historical data).")
+                
+        except Exception as e:
+            st.warning(f"Could not create RSI chart: {str(e)}")
+        
+        # TRIX Sub-chart
+        st.subheader("TRIX Indicator")
+        
+        try:
+            # TRIX(30)은 EMA 3단계라 최소 period*3개 데이터가 필요 - 부족하면 figure 생성 자체를 생략
+            if not hist.empty and len(hist) >= TRIX_MIN_POINTS:
+                current_trix = technicals.get('current_trix', 'N/A')
+                # 가격/TRIX를 독립된 작은 차트로 분리 (subplot 레이아웃 재계산 방지)
+                with st.container():
+                    st.plotly_chart(go.Figure(build_close_fig(ticker, as_of, "Price & TRIX(30) Indicator")), use_container_width=True, theme=None, config=PLOTLY_CONFIG, key='trix_close_chart')
+                with st.container():
+                    st.plotly_chart(go.Figure(build_trix_fig(ticker, as_of, current_trix)), use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+            else:
+                st.info("TRIX data not available (insufficient historical data).")
+                
+        except Exception as e:
+            st.warning(f"Could not create TRIX chart: {str(e)}")
+        
+        # Technical Indicators Summary
+        st.subheader("Technical Indicators Summary")
+        
+        # 4개 지표를 st.metric 4번 대신 표 1개로 한 번에 전송
+        rsi, trix, volume_ratio, earnings_d_day, earnings_date = (
+            technicals.get(key, 'N/A') for key in _SUMMARY_KEYS
+        )
+        rsi_status = rsi_status_labels(rsi)[0] if rsi != 'N/A' else ""
+        has_earnings = earnings_d_day not in ('N/A', None) and earnings_date not in ('N/A', None)
+        
+        df_summary = pd.DataFrame({
+            "Indicator": ["RSI(14)", "TRIX(30)", "Volume Ratio", "Next Earnings"],
+            "Value": [
+                f"{rsi}{rsi_status}" if rsi != 'N/A' else "N/A",
+                f"{trix}" if trix != 'N/A' else "N/A",
+                f"{volume_ratio}" if volume_ratio != 'N/A' else "N/A",
+                f"{earnings_date} (D-{earnings_d_day})" if has_earnings else "N/A"
+            ]
+        })
+        st.dataframe(df_summary, hide_index=True, use_container_width=True)
+        
+        # Earnings Alert
+        if isinstance(earnings_d_day, (int, float)) and earnings_d_day <= 7:
+            st.warning(f"⚠️ Earnings Alert: Next earnings in {earnings_d_day} days. High volatility expected.")
+        
+        # News Feed
+        st.subheader("Recent News")
+        news_context = data.get('news_context', {})
+        recent_news = news_context.get('recent_news', [])
+        
+        if recent_news:
+            # 펼친 기사 1개만 본문을 그리도록 제목 선택 + 상세 영역 1개로 구성
+            top_news = recent_news[:5]
+            selected = st.selectbox(
+                "Select a headline",
+                range(len(top_news)),
+                format_func=lambda i: f"{i + 1}. {top_news[i].get('title', 'N/A')}",
+                key='news_selected'
+            )
+            news = top_news[selected]
+            body_slot = st.empty()
+            body_slot.markdown(
+                render_news_html(
+                    news.get('link', 'N/A'),
+                    news.get('title', 'N/A'),
+                    news.get('publisher', 'N/A'),
+                    news.get('publishTime', 'N/A'),
+                    news.get('summary', 'N/A')
+                ),
+                unsafe_allow_html=True
+            )
+        else:
+            st.info("No recent news available.")
+
+
+@st.fragment
+def _render_raw_data_tab(ticker: str, data: dict) -> None:
+    """
+    Tab 4: Raw Data 렌더링 (탭 내부 위젯 상호작용 시 해당 탭만 재실행)
+    """
+    st.header("📊 Raw Data")
+    st.markdown("View all raw data collected for detailed analysis.")
+    st.markdown("---")
+    
+    # 1. Profile (Company Info) - Raw
+    with st.expander("📌 Company Profile (Raw)", expanded=False):
+        st.subheader("Company Profile Data")
+        profile_raw = data.get('profile', {})
+        if profile_raw:
+            # 딕셔너리를 JSON 형태로 표시
+            st.json(profile_raw)
+        else:
+            st.info("Profile data not available.")
+    
+    # 2. Annual Financial Statements
+    with st.expander("📈 Annual Financial Statements", expanded=False):
+        financials = data.get('financials', {})
+        raw_data = financials.get('raw_data', {})
+        annual_data = raw_data.get('annual', {})
+        
+        # Income Statement
+        st.subheader("Income Statement (Annual)")
+        income_stmt = annual_data.get('income_stmt', pd.DataFrame())
+        if not income_stmt.empty:
+            st.dataframe(income_stmt, use_container_width=True, height=400)
+            # CSV 다운로드 버튼
+            csv_income = income_stmt.to_csv()
+            st.download_button(
+                label="📥 Download Income Statement as CSV",
+                data=csv_income,
+                file_name=f"{ticker}_income_statement_annual.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Income statement data not available.")
+        
+        st.markdown("---")
+        
+        # Balance Sheet
+        st.subheader("Balance Sheet (Annual)")
+        balance_sheet = annual_data.get('balance_sheet', pd.DataFrame())
+        if not balance_sheet.empty:
+            st.dataframe(balance_sheet, use_container_width=True, height=400)
+            csv_balance = balance_sheet.to_csv()
+            st.download_button(
+                label="📥 Download Balance Sheet as CSV",
+                data=csv_balance,
+                file_name=f"{ticker}_balance_sheet_annual.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Balance sheet data not available.")
         
         st.markdown("---")
         
-        # Quarterly Charts
+        # Cash Flow
+        st.subheader("Cash Flow Statement (Annual)")
+        cashflow = annual_data.get('cashflow', pd.DataFrame())
+        if not cashflow.empty:
+            st.dataframe(cashflow, use_container_width=True, height=400)
+            csv_cashflow = cashflow.to_csv()
+            st.download_button(
+                label="📥 Download Cash Flow as CSV",
+                data=csv_cashflow,
+                file_name=f"{ticker}_cashflow_annual.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Cash flow data not available.")
+    
+    # 3. Quarterly Financial Statements
+    with st.expander("📊 Quarterly Financial Statements", expanded=False):
         quarterly_data = raw_data.get('quarterly', {})
-        quarterly_status = financials.get('quarterly_data_status', {})
         
-        if quarterly_status and quarterly_status.get('has_data'):
-            # Quarterly Revenue & Net Income Chart
-            st.subheader("Revenue & Net Income (Quarterly)")
+        # Quarterly 데이터 상태 표시
+        quarterly_status = financials.get('quarterly_data_status', {})
+        if quarterly_status:
+            st.markdown("### 📋 Quarterly Data Status")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Has Data", "✅ Yes" if quarterly_status.get('has_data') else "❌ No")
+                st.metric("Total Quarters", quarterly_status.get('total_quarters', 0))
+            with col2:
+                st.write(f"**Income Stmt Periods:** {quarterly_status.get('income_stmt_periods', 0)}")
+                st.write(f"**Balance Sheet Periods:** {quarterly_status.get('balance_sheet_periods', 0)}")
+                st.write(f"**Cash Flow Periods:** {quarterly_status.get('cashflow_periods', 0)}")
+            with col3:
+                if quarterly_status.get('earliest_date'):
+                    st.write(f"**Earliest Date:** {quarterly_status.get('earliest_date')}")
+                if quarterly_status.get('latest_date'):
+                    st.write(f"**Latest Date:** {quarterly_status.get('latest_date')}")
+                if quarterly_status.get('missing_data'):
+                    st.warning(f"⚠️ Missing: {', '.join(quarterly_status.get('missing_data', []))}")
             
-            if quarterly_data and not quarterly_data.get('income_stmt', pd.DataFrame()).empty:
-                q_income_stmt = quarterly_data['income_stmt']
-                
-                try:
-                    dates = []
-                    q_revenue_data = []
-                    q_net_income_data = []
-                    
-                    # 인덱스에서 날짜 추출 (최신순 정렬)
-                    sorted_dates = sorted(q_income_stmt.index, reverse=True)[:12]  # 최근 12개 쿼터만
-                    
-                    for date in sorted_dates:
-                        dates.append(str(date)[:10])
-                        
-                        # Total Revenue 추출
-                        if 'Total Revenue' in q_income_stmt.columns:
-                            rev = q_income_stmt.loc[date, 'Total Revenue']
-                            if pd.notna(rev) and rev != 'N/A':
-                                try:
-                                    q_revenue_data.append(float(rev))
-                                except (ValueError, TypeError):
-                                    q_revenue_data.append(0)
-                            else:
-                                q_revenue_data.append(0)
-                        else:
-                            q_revenue_data.append(0)
-                        
-                        # Net Income 추출
-                        if 'Net Income' in q_income_stmt.columns:
-                            ni = q_income_stmt.loc[date, 'Net Income']
-                            if pd.notna(ni) and ni != 'N/A':
-                                try:
-                                    q_net_income_data.append(float(ni))
-                                except (ValueError, TypeError):
-                                    q_net_income_data.append(0)
-                            else:
-                                q_net_income_data.append(0)
-                        else:
-                            q_net_income_data.append(0)
-                    
-                    if dates and (any(q_revenue_data) or any(q_net_income_data)):
-                        fig_q_financials = go.Figure()
-                        
-                        # 날짜를 역순으로 표시 (오래된 것부터)
-                        dates_display = dates[::-1]
-                        q_revenue_display = q_revenue_data[::-1]
-                        q_net_income_display = q_net_income_data[::-1]
-                        
-                        if any(q_revenue_display):
-                            fig_q_financials.add_trace(
-                                go.Bar(name="Revenue", x=dates_display, y=q_revenue_display, marker_color='blue')
-                            )
-                        
-                        if any(q_net_income_display):
-                            fig_q_financials.add_trace(
-                                go.Bar(name="Net Income", x=dates_display, y=q_net_income_display, marker_color='green')
-                            )
-                        
-                        fig_q_financials.update_layout(
-                            title="Quarterly Revenue & Net Income",
-                            xaxis_title="Quarter",
-                            yaxis_title="Amount ($)",
-                            barmode='group',
-                            height=400,
-                            xaxis_tickangle=-45
-                        )
-                        
-                        st.plotly_chart(fig_q_financials, use_container_width=True)
-                    else:
-                        st.info("Quarterly financial data not available for charting.")
-                        
-                except Exception as e:
-                    st.warning(f"Could not create quarterly financial chart: {str(e)}")
-            else:
-                st.info("Quarterly income statement data not available.")
+            if not quarterly_status.get('has_data'):
+                st.info("💡 **Note:** yfinance does not provide quarterly financial data for this ticker, or the data is not available. This is a limitation of the data source, not a bug in the application.")
             
-            # Quarterly Free Cash Flow vs CapEx Chart
-            st.subheader("Free Cash Flow vs CapEx (Quarterly)")
+            st.markdown("---")
+        
+        # Quarterly Income Statement
+        st.subheader("Income Statement (Quarterly)")
+        q_income_stmt = quarterly_data.get('income_stmt', pd.DataFrame())
+        if not q_income_stmt.empty:
+            st.dataframe(q_income_stmt, use_container_width=True, height=400)
+            csv_q_income = q_income_stmt.to_csv()
+            st.download_button(
+                label="📥 Download Quarterly Income Statement as CSV",
+                data=csv_q_income,
+                file_name=f"{ticker}_income_statement_quarterly.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Quarterly income statement data not available.")
+        
+        st.markdown("---")
+        
+        # Quarterly Balance Sheet
+        st.subheader("Balance Sheet (Quarterly)")
+        q_balance_sheet = quarterly_data.get('balance_sheet', pd.DataFrame())
+        if not q_balance_sheet.empty:
+            st.dataframe(q_balance_sheet, use_container_width=True, height=400)
+            csv_q_balance = q_balance_sheet.to_csv()
+            st.download_button(
+                label="📥 Download Quarterly Balance Sheet as CSV",
+                data=csv_q_balance,
+                file_name=f"{ticker}_balance_sheet_quarterly.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Quarterly balance sheet data not available.")
+        
+        st.markdown("---")
+        
+        # Quarterly Cash Flow
+        st.subheader("Cash Flow Statement (Quarterly)")
+        q_cashflow = quarterly_data.get('cashflow', pd.DataFrame())
+        if not q_cashflow.empty:
+            st.dataframe(q_cashflow, use_container_width=True, height=400)
+            csv_q_cashflow = q_cashflow.to_csv()
+            st.download_button(
+                label="📥 Download Quarterly Cash Flow as CSV",
+                data=csv_q_cashflow,
+                file_name=f"{ticker}_cashflow_quarterly.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("Quarterly cash flow data not available.")
+    
+    # 4. Derived Metrics (Raw) - 추세 포함
+    with st.expander("🔢 Derived Metrics with Trends", expanded=False):
+        st.subheader("Calculated Financial Metrics")
+        
+        # 연간 추세
+        st.markdown("### 📈 Annual Trends")
+        metrics_annual = financials.get('derived_metrics', {})
+        if metrics_annual:
+            # 테이블 형태로 표시
+            metrics_list = []
+            for metric_name, metric_data in metrics_annual.items():
+                if isinstance(metric_data, dict):
+                    metrics_list.append({
+                        "Metric": metric_name.replace('_', ' ').title(),
+                        "Latest Value": metric_data.get('latest', 'N/A'),
+                        "Trend/Status": metric_data.get('trend', metric_data.get('status', 'N/A')),
+                        "Warning": metric_data.get('warning', False) if 'warning' in metric_data else 'N/A',
+                        "Has Time Series": len(metric_data.get('time_series', [])) > 0
+                    })
             
-            if quarterly_data and not quarterly_data.get('cashflow', pd.DataFrame()).empty:
-                q_cashflow = quarterly_data['cashflow']
+            if metrics_list:
+                df_metrics = pd.DataFrame(metrics_list)
+                st.dataframe(df_metrics, use_container_width=True, hide_index=True)
                 
-                try:
-                    dates = []
-                    q_fcf_data = []
-                    q_capex_data = []
-                    
-                    # 최신순 정렬 (최근 12개 쿼터만)
-                    sorted_dates = sorted(q_cashflow.index, reverse=True)[:12]
-                    
-                    for date in sorted_dates:
-                        dates.append(str(date)[:10])
-                        
-                        # Free Cash Flow
-                        fcf = None
-                        if 'Free Cash Flow' in q_cashflow.columns:
-                            fcf = q_cashflow.loc[date, 'Free Cash Flow']
-                        else:
-                            # Free Cash Flow = Operating Cash Flow - CapEx (계산)
-                            ocf = None
-                            capex = None
-                            
-                            if 'Operating Cash Flow' in q_cashflow.columns:
-                                ocf = q_cashflow.loc[date, 'Operating Cash Flow']
-                            elif 'Cash Flow From Continuing Operating Activities' in q_cashflow.columns:
-                                ocf = q_cashflow.loc[date, 'Cash Flow From Continuing Operating Activities']
-                            
-                            if 'Capital Expenditure' in q_cashflow.columns:
-                                capex = q_cashflow.loc[date, 'Capital Expenditure']
-                            
-                            if pd.notna(ocf) and ocf != 'N/A' and pd.notna(capex) and capex != 'N/A':
-                                try:
-                                    fcf = float(ocf) - abs(float(capex))
-                                except (ValueError, TypeError):
-                                    fcf = None
-                        
-                        if pd.notna(fcf) and fcf != 'N/A':
+                # 추세 차트
+                st.markdown("#### Annual Trend Charts")
+                charts_created = 0
+                for metric_name, metric_data in metrics_annual.items():
+                    if isinstance(metric_data, dict) and 'time_series' in metric_data:
+                        time_series = metric_data.get('time_series', [])
+                        if time_series and len(time_series) > 1:  # 최소 2개 데이터 포인트 필요
                             try:
-                                q_fcf_data.append(float(fcf))
-                            except (ValueError, TypeError):
-                                q_fcf_data.append(0)
-                        else:
-                            q_fcf_data.append(0)
-                        
-                        # Capital Expenditure
-                        capex = None
-                        if 'Capital Expenditure' in q_cashflow.columns:
-                            capex = q_cashflow.loc[date, 'Capital Expenditure']
-                        
-                        if pd.notna(capex) and capex != 'N/A':
+                                df_trend = pd.DataFrame(time_series)
+                                if 'date' in df_trend.columns and 'value' in df_trend.columns:
+                                    # 날짜 순서 정렬 (최신이 앞)
+                                    df_trend = df_trend.sort_values('date', ascending=False)
+                                    
+                                    fig = go.Figure()
+                                    fig.add_trace(go.Scatter(
+                                        x=df_trend['date'],
+                                        y=df_trend['value'],
+                                        mode='lines+markers',
+                                        name=metric_name.replace('_', ' ').title(),
+                                        line=dict(width=2)
+                                    ))
+                                    fig.update_layout(
+                                        title=f"{metric_name.replace('_', ' ').title()} - Annual Trend",
+                                        xaxis_title="Date",
+                                        yaxis_title="Value",
+                                        height=300,
+                                        xaxis_tickangle=-45
+                                    )
+                                    st.plotly_chart(fig, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+                                    charts_created += 1
+                            except Exception as e:
+                                st.warning(f"Could not create chart for {metric_name}: {str(e)}")
+                
+                if charts_created == 0:
+                    st.info("No trend charts available (insufficient data points)")
+        else:
+            st.info("Annual derived metrics not available.")
+        
+        # 쿼터별 추세
+        st.markdown("---")
+        st.markdown("### 📊 Quarterly Trends")
+        metrics_quarterly = financials.get('derived_metrics_quarterly', {})
+        if metrics_quarterly:
+            # 테이블 형태로 표시
+            q_metrics_list = []
+            for metric_name, metric_data in metrics_quarterly.items():
+                if isinstance(metric_data, dict):
+                    q_metrics_list.append({
+                        "Metric": metric_name.replace('_', ' ').title(),
+                        "Latest Value": metric_data.get('latest', 'N/A'),
+                        "Trend/Status": metric_data.get('trend', metric_data.get('status', 'N/A'))
+                    })
+            
+            if q_metrics_list:
+                df_q_metrics = pd.DataFrame(q_metrics_list)
+                st.dataframe(df_q_metrics, use_container_width=True, hide_index=True)
+                
+                # 쿼터별 추세 차트
+                st.markdown("#### Quarterly Trend Charts")
+                q_charts_created = 0
+                for metric_name, metric_data in metrics_quarterly.items():
+                    if isinstance(metric_data, dict) and 'time_series' in metric_data:
+                        time_series = metric_data.get('time_series', [])
+                        if time_series and len(time_series) > 1:  # 최소 2개 데이터 포인트 필요
                             try:
-                                q_capex_data.append(abs(float(capex)))  # CapEx는 음수로 저장되므로 절댓값
-                            except (ValueError, TypeError):
-                                q_capex_data.append(0)
-                        else:
-                            q_capex_data.append(0)
-                    
-                    if dates:
-                        fig_q_cashflow = go.Figure()
-                        
-                        # 날짜를 역순으로 표시
-                        dates_display = dates[::-1]
-                        q_fcf_display = q_fcf_data[::-1]
-                        q_capex_display = q_capex_data[::-1]
-                        
-                        fig_q_cashflow.add_trace(go.Scatter(
-                            x=dates_display,
-                            y=q_fcf_display,
-                            mode='lines+markers',
-                            name='Free Cash Flow',
-                            line=dict(color='green', width=2)
-                        ))
-                        
-                        fig_q_cashflow.add_trace(go.Scatter(
-                            x=dates_display,
-                            y=q_capex_display,
-                            mode='lines+markers',
-                            name='CapEx',
-                            line=dict(color='orange', width=2)
-                        ))
-                        
-                        fig_q_cashflow.update_layout(
-                            title="Free Cash Flow vs CapEx (Quarterly)",
-                            xaxis_title="Quarter",
-                            yaxis_title="Amount ($)",
-                            height=400,
-                            xaxis_tickangle=-45
-                        )
-                        
-                        st.plotly_chart(fig_q_cashflow, use_container_width=True)
-                    else:
-                        st.info("Quarterly cash flow data not available for charting.")
-                        
-                except Exception as e:
-                    st.warning(f"Could not create quarterly cash flow chart: {str(e)}")
-            else:
-                st.info("Quarterly cash flow data not available.")
+                                df_trend = pd.DataFrame(time_series)
+                                if 'date' in df_trend.columns and 'value' in df_trend.columns:
+                                    # 날짜 순서 정렬 (최신이 앞)
+                                    df_trend = df_trend.sort_values('date', ascending=False)
+                                    
+                                    fig = go.Figure()
+                                    fig.add_trace(go.Scatter(
+                                        x=df_trend['date'],
+                                        y=df_trend['value'],
+                                        mode='lines+markers',
+                                        name=metric_name.replace('_', ' ').title(),
+                                        line=dict(width=2, color='orange')
+                                    ))
+                                    fig.update_layout(
+                                        title=f"{metric_name.replace('_', ' ').title()} - Quarterly Trend",
+                                        xaxis_title="Quarter",
+                                        yaxis_title="Value",
+                                        height=300,
+                                        xaxis_tickangle=-45
+                                    )
+                                    st.plotly_chart(fig, use_container_width=True, theme=None, config=PLOTLY_CONFIG)
+                                    q_charts_created += 1
+                            except Exception as e:
+                                st.warning(f"Could not create quarterly chart for {metric_name}: {str(e)}")
+                
+                if q_charts_created == 0:
+                    st.info("No quarterly trend charts available (insufficient data points)")
         else:
-            st.info("💡 **Quarterly data not available**\n\nQuarterly financial charts require quarterly data from yfinance. This data may not be available for all tickers.")
-    
-    # Tab 3: Technicals
-    with tab3:
-        st.header("Timing & Technical Analysis")
+            st.info("💡 Quarterly trends are not available. This may be because:\n"
+                   "- yfinance does not provide quarterly financial data for this ticker\n"
+                   "- The quarterly data is incomplete\n"
+                   "- The ticker is too new or delisted")
         
+        # JSON Export
+        st.markdown("---")
+        with st.expander("📋 Raw JSON Data", expanded=False):
+            import json
+            all_metrics = {
+                'annual': metrics_annual,
+                'quarterly': metrics_quarterly
+            }
+            st.json(all_metrics)
+    
+    # 5. Technical Indicators (Raw)
+    with st.expander("📈 Technical Indicators (Raw)", expanded=False):
         technicals = data.get('technicals', {})
         
         if technicals.get('error'):
             st.error(f"Error loading technical data: {technicals.get('error')}")
         else:
-            # Price Chart with MA Lines
-            st.subheader("Price Chart with Moving Averages")
-            
-            try:
-                # StockDataManager에서 가져온 데이터로 차트 생성
-                manager = StockDataManager(ticker)
-                hist = manager.ticker.history(period="1y", interval="1d")
-                
-                if not hist.empty:
-                    fig_price = go.Figure()
-                    
-                    # Candlestick
-                    fig_price.add_trace(go.Candlestick(
-                        x=hist.index,
-                        open=hist['Open'],
-                        high=hist['High'],
-                        low=hist['Low'],
-                        close=hist['Close'],
-                        name='Price'
-                    ))
-                    
-                    # Moving Averages (실제 계산된 값 사용)
-                    ma_data = technicals.get('ma_data', {})
-                    
-                    # MA 계산 (hist 데이터에서)
-                    if len(hist) >= 20:
-                        hist['MA_20'] = hist['Close'].rolling(window=20).mean()
-                        if ma_data.get('MA_20') != 'N/A':
-                            fig_price.add_trace(go.Scatter(
-                                x=hist.index,
-                                y=hist['MA_20'],
-                                mode='lines',
-                                name='MA 20',
-                                line=dict(color='blue', width=2)
-                            ))
-                    
-                    if len(hist) >= 60:
-                        hist['MA_60'] = hist['Close'].rolling(window=60).mean()
-                        if ma_data.get('MA_60') != 'N/A':
-                            fig_price.add_trace(go.Scatter(
-                                x=hist.index,
-                                y=hist['MA_60'],
-                                mode='lines',
-                                name='MA 60',
-                                line=dict(color='orange', width=2)
-                            ))
-                    
-                    if len(hist) >= 120:
-                        hist['MA_120'] = hist['Close'].rolling(window=120).mean()
-                        if ma_data.get('MA_120') != 'N/A':
-                            fig_price.add_trace(go.Scatter(
-                                x=hist.index,
-                                y=hist['MA_120'],
-                                mode='lines',
-                                name='MA 120',
-                                line=dict(color='red', width=2)
-                            ))
-                    
-                    # Historical Events 표시
-                    news_context = data.get('news_context', {})
-                    historical_events = news_context.get('historical_events', [])
-                    for event in historical_events[:5]:
-                        event_date = pd.to_datetime(event.get('date', ''))
-                        if event_date in hist.index:
-                            change_pct = event.get('change_pct', 0)
-                            color = 'red' if change_pct < 0 else 'green'
-                            fig_price.add_trace(go.Scatter(
-                                x=[event_date],
-                                y=[hist.loc[event_date, 'Close']],
-                                mode='markers',
-                                marker=dict(size=15, color=color, symbol='diamond'),
-                                name=f"Event: {change_pct:.2f}%",
-                                showlegend=False
-                            ))
-                    
-                    fig_price.update_layout(
-                        title="Stock Price with Moving Averages",
-                        xaxis_title="Date",
-                        yaxis_title="Price ($)",
-                        height=500,
-                        xaxis_rangeslider_visible=False
-                    )
-                    
-                    st.plotly_chart(fig_price, use_container_width=True)
-                else:
-                    st.info("Price data not available.")
-                    
-            except Exception as e:
-                st.warning(f"Could not create price chart: {str(e)}")
+            st.subheader("Price Data & Technical Indicators")
             
-            # RSI Sub-chart
-            st.subheader("RSI Indicator")
-            
-            try:
-                # Historical RSI 계산
-                manager = StockDataManager(ticker)
-                hist = manager.ticker.history(period="1y", interval="1d")
+            # Price Data DataFrame
+            price_data = technicals.get('price_data')
+            if price_data is not None and not price_data.empty:
+                st.markdown("### Historical Price Data")
+                # 주요 컬럼만 표시 (너무 많으면 성능 저하)
+                display_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+                if 'RSI' in price_data.columns:
+                    display_cols.append('RSI')
+                if 'TRIX' in price_data.columns:
+                    display_cols.append('TRIX')
+                if 'MA_20' in price_data.columns:
+                    display_cols.extend(['MA_20', 'MA_60', 'MA_120'])
                 
-                if not hist.empty and len(hist) >= 14:
-                    # RSI 계산 (14일)
-                    delta = hist['Close'].diff()
-                    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                    rs = gain / loss
-                    rsi = 100 - (100 / (1 + rs))
-                    
-                    current_rsi = technicals.get('current_rsi', 'N/A')
-                    
-                    # Price & RSI 차트 (2개 subplot)
-                    fig_rsi = make_subplots(
-                        rows=2, cols=1,
-                        subplot_titles=('Price', f'RSI(14) - Current: {current_rsi:.2f}' if current_rsi != 'N/A' else 'RSI(14)'),
-                        row_heights=[0.6, 0.4],
-                        vertical_spacing=0.1
-                    )
-                    
-                    # Price 차트
-                    fig_rsi.add_trace(
-                        go.Scatter(
-                            x=hist.index,
-                            y=hist['Close'],
-                            name='Close Price',
-                            line=dict(color='blue', width=1)
-                        ),
-                        row=1, col=1
-                    )
-                    
-                    # RSI 차트
-                    fig_rsi.add_trace(
-                        go.Scatter(
-                            x=hist.index,
-                            y=rsi,
-                            name='RSI',
-                            line=dict(color='purple', width=2)
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # Overbought/Oversold lines
-                    fig_rsi.add_hline(
-                        y=70,
-                        line_dash="dash",
-                        line_color="red",
-                        annotation_text="Overbought (70)",
-                        row=2, col=1
+                available_cols = [col for col in display_cols if col in price_data.columns]
+                if available_cols:
+                    st.dataframe(price_data[available_cols], use_container_width=True, height=400)
+                    csv_price = price_data[available_cols].to_csv()
+                    st.download_button(
+                        label="📥 Download Price Data as CSV",
+                        data=csv_price,
+                        file_name=f"{ticker}_price_data.csv",
+                        mime="text/csv"
                     )
-                    fig_rsi.add_hline(
-                        y=30,
-                        line_dash="dash",
-                        line_color="green",
-                        annotation_text="Oversold (30)",
-                        row=2, col=1
-                    )
-                    
-                    fig_rsi.update_layout(
-                        title="Price & RSI(14) Indicator",
-                        height=600,
-                        showlegend=True,
-                        xaxis_rangeslider_visible=False
-                    )
-                    
-                    fig_rsi.update_yaxes(title_text="Price ($)", row=1, col=1)
-                    fig_rsi.update_yaxes(title_text="RSI", range=[0, 100], row=2, col=1)
-                    fig_rsi.update_xaxes(title_text="Date", row=2, col=1)
-                    
-                    st.plotly_chart(fig_rsi, use_container_width=True)
                 else:
-                    st.info("RSI data not available (insufficient historical data).")
-                    
-            except Exception as e:
-                st.warning(f"Could not create RSI chart: {str(e)}")
-            
-            # TRIX Sub-chart
-            st.subheader("TRIX Indicator")
+                    st.dataframe(price_data, use_container_width=True, height=400)
+            else:
+                st.info("Price data not available.")
             
-            try:
-                # Historical TRIX 계산
-                manager = StockDataManager(ticker)
-                hist = manager.ticker.history(period="1y", interval="1d")
-                
-                if not hist.empty and len(hist) >= 30:
-                    # TRIX 계산 (30일 EMA의 3차 지수 이동평균)
-                    # 1. 30일 EMA
-                    ema1 = hist['Close'].ewm(span=30, adjust=False).mean()
-                    # 2. EMA의 EMA
-                    ema2 = ema1.ewm(span=30, adjust=False).mean()
-                    # 3. EMA의 EMA의 EMA
-                    ema3 = ema2.ewm(span=30, adjust=False).mean()
-                    # 4. TRIX = (EMA3 - 이전 EMA3) / 이전 EMA3 * 100
-                    trix = ((ema3 - ema3.shift(1)) / ema3.shift(1)) * 100
-                    # 5. TRIX Signal (TRIX의 9일 EMA)
-                    trix_signal = trix.ewm(span=9, adjust=False).mean()
-                    
-                    current_trix = technicals.get('current_trix', 'N/A')
-                    current_trix_signal = technicals.get('current_trix_signal', 'N/A')
-                    
-                    # Price & TRIX 차트 (2개 subplot)
-                    fig_trix = make_subplots(
-                        rows=2, cols=1,
-                        subplot_titles=('Price', f'TRIX(30) - Current: {current_trix:.4f}' if current_trix != 'N/A' else 'TRIX(30)'),
-                        row_heights=[0.6, 0.4],
-                        vertical_spacing=0.1
-                    )
-                    
-                    # Price 차트
-                    fig_trix.add_trace(
-                        go.Scatter(
-                            x=hist.index,
-                            y=hist['Close'],
-                            name='Close Price',
-                            line=dict(color='blue', width=1)
-                        ),
-                        row=1, col=1
-                    )
-                    
-                    # TRIX 차트
-                    fig_trix.add_trace(
-                        go.Scatter(
-                            x=hist.index,
-                            y=trix,
-                            name='TRIX',
-                            line=dict(color='purple', width=2)
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # TRIX Signal 라인
-                    fig_trix.add_trace(
-                        go.Scatter(
-                            x=hist.index,
-                            y=trix_signal,
-                            name='TRIX Signal',
-                            line=dict(color='orange', width=1, dash='dash')
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # Zero line
-                    fig_trix.add_hline(
-                        y=0,
-                        line_dash="dot",
-                        line_color="gray",
-                        annotation_text="Zero Line",
-                        row=2, col=1
-                    )
-                    
-                    fig_trix.update_layout(
-                        title="Price & TRIX(30) Indicator",
-                        height=600,
-                        showlegend=True,
-                        xaxis_rangeslider_visible=False
-                    )
-                    
-                    fig_trix.update_yaxes(title_text="Price ($)", row=1, col=1)
-                    fig_trix.update_yaxes(title_text="TRIX", row=2, col=1)
-                    fig_trix.update_xaxes(title_text="Date", row=2, col=1)
-                    
-                    st.plotly_chart(fig_trix, use_container_width=True)
-                else:
-                    st.info("TRIX data not available (insufficient historical data).")
-                    
-            except Exception as e:
-                st.warning(f"Could not create TRIX chart: {str(e)}")
+            st.markdown("---")
             
-            # Technical Indicators Summary
-            st.subheader("Technical Indicators Summary")
+            # Current Technical Indicators
+            st.markdown("### Current Technical Indicator Values")
+            tech_summary = {
+                "RSI(14)": technicals.get('current_rsi', 'N/A'),
+                "TRIX(30)": technicals.get('current_trix', 'N/A'),
+                "TRIX Signal": technicals.get('current_trix_signal', 'N/A'),
+                "Volume Ratio": technicals.get('volume_ratio', 'N/A'),
+                "MA 20": technicals.get('ma_data', {}).get('MA_20', 'N/A'),
+                "MA 60": technicals.get('ma_data', {}).get('MA_60', 'N/A'),
+                "MA 120": technicals.get('ma_data', {}).get('MA_120', 'N/A'),
+                "Earnings Date": technicals.get('earnings_date', 'N/A'),
+                "Earnings D-Day": technicals.get('earnings_d_day', 'N/A')
+            }
             
-            col1, col2, col3, col4 = st.columns(4)
+            df_tech = pd.DataFrame(list(tech_summary.items()), columns=["Indicator", "Value"])
+            st.dataframe(df_tech, use_container_width=True, hide_index=True)
+    
+    # 6. News Context (Raw)
+    with st.expander("📰 News Context (Raw)", expanded=False):
+        news_context = data.get('news_context', {})
+        
+        # Recent News
+        st.subheader("Recent News (Raw)")
+        recent_news = news_context.get('recent_news', [])
+        if recent_news:
+            st.json(recent_news)
             
-            with col1:
-                rsi = technicals.get('current_rsi', 'N/A')
-                rsi_status = ""
-                if rsi != 'N/A':
-                    if rsi > 70:
-                        rsi_status = " (Overbought)"
-                    elif rsi < 30:
-                        rsi_status = " (Oversold)"
-                st.metric("RSI(14)", f"{rsi}{rsi_status}" if rsi != 'N/A' else "N/A")
-            
-            with col2:
-                trix = technicals.get('current_trix', 'N/A')
-                st.metric("TRIX(30)", f"{trix}" if trix != 'N/A' else "N/A")
-            
-            with col3:
-                volume_ratio = technicals.get('volume_ratio', 'N/A')
-                st.metric("Volume Ratio", f"{volume_ratio}" if volume_ratio != 'N/A' else "N/A")
-            
-            with col4:
-                earnings_d_day = technicals.get('earnings_d_day', 'N/A')
-                earnings_date = technicals.get('earnings_date', 'N/A')
-                if earnings_d_day != 'N/A' and earnings_date != 'N/A':
-                    st.metric("Next Earnings", f"{earnings_date} (D-{earnings_d_day})")
-                else:
-                    st.metric("Next Earnings", "N/A")
-            
-            # Earnings Alert
-            if technicals.get('earnings_d_day') is not None and technicals.get('earnings_d_day') <= 7:
-                st.warning(f"⚠️ Earnings Alert: Next earnings in {technicals.get('earnings_d_day')} days. High volatility expected.")
-            
-            # News Feed
-            st.subheader("Recent News")
-            news_context = data.get('news_context', {})
-            recent_news = news_context.get('recent_news', [])
-            
-            if recent_news:
-                for i, news in enumerate(recent_news[:5], 1):
-                    with st.expander(f"{i}. {news.get('title', 'N/A')}"):
-                        st.write(f"**Publisher:** {news.get('publisher', 'N/A')}")
-                        st.write(f"**Published:** {news.get('publishTime', 'N/A')}")
-                        st.write(f"**Link:** {news.get('link', 'N/A')}")
-                        if news.get('summary') and news.get('summary') != 'N/A':
-                            st.write(f"**Summary:** {news.get('summary')}")
-            else:
-                st.info("No recent news available.")
-    
-    # Tab 4: Raw Data
-    with tab4:
-        st.header("📊 Raw Data")
-        st.markdown("View all raw data collected for detailed analysis.")
-        st.markdown("---")
+            # 테이블 형태로도 표시
+            st.markdown("### Recent News Table")
+            news_table = [
+                {
+                    "Title": news.get('title', 'N/A'),
+                    "Publisher": news.get('publisher', 'N/A'),
+                    "Published": news.get('publishTime', 'N/A'),
+                    "Link": news.get('link', 'N/A')[:50] + "..." if news.get('link', 'N/A') != 'N/A' and len(news.get('link', '')) > 50 else news.get('link', 'N/A')
+                }
+                for news in recent_news
+            ]
+            if news_table:
+                df_news = pd.DataFrame(news_table)
+                st.dataframe(df_news, use_container_width=True, hide_index=True)
+        else:
+            st.info("Recent news not available.")
         
-        # 1. Profile (Company Info) - Raw
-        with st.expander("📌 Company Profile (Raw)", expanded=False):
-            st.subheader("Company Profile Data")
-            profile_raw = data.get('profile', {})
-            if profile_raw:
-                # 딕셔너리를 JSON 형태로 표시
-                st.json(profile_raw)
-            else:
-                st.info("Profile data not available.")
+        st.markdown("---")
         
-        # 2. Annual Financial Statements
-        with st.expander("📈 Annual Financial Statements", expanded=False):
-            financials = data.get('financials', {})
-            raw_data = financials.get('raw_data', {})
-            annual_data = raw_data.get('annual', {})
-            
-            # Income Statement
-            st.subheader("Income Statement (Annual)")
-            income_stmt = annual_data.get('income_stmt', pd.DataFrame())
-            if not income_stmt.empty:
-                st.dataframe(income_stmt, use_container_width=True, height=400)
-                # CSV 다운로드 버튼
-                csv_income = income_stmt.to_csv()
-                st.download_button(
-                    label="📥 Download Income Statement as CSV",
-                    data=csv_income,
-                    file_name=f"{ticker}_income_statement_annual.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Income statement data not available.")
+        # Historical Events
+        st.subheader("Historical Volatile Events")
+        historical_events = news_context.get('historical_events', [])
+        if historical_events:
+            st.json(historical_events)
             
-            st.markdown("---")
-            
-            # Balance Sheet
-            st.subheader("Balance Sheet (Annual)")
-            balance_sheet = annual_data.get('balance_sheet', pd.DataFrame())
-            if not balance_sheet.empty:
-                st.dataframe(balance_sheet, use_container_width=True, height=400)
-                csv_balance = balance_sheet.to_csv()
-                st.download_button(
-                    label="📥 Download Balance Sheet as CSV",
-                    data=csv_balance,
-                    file_name=f"{ticker}_balance_sheet_annual.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Balance sheet data not available.")
-            
-            st.markdown("---")
-            
-            # Cash Flow
-            st.subheader("Cash Flow Statement (Annual)")
-            cashflow = annual_data.get('cashflow', pd.DataFrame())
-            if not cashflow.empty:
-                st.dataframe(cashflow, use_container_width=True, height=400)
-                csv_cashflow = cashflow.to_csv()
-                st.download_button(
-                    label="📥 Download Cash Flow as CSV",
-                    data=csv_cashflow,
-                    file_name=f"{ticker}_cashflow_annual.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Cash flow data not available.")
+            # 테이블 형태로도 표시
+            st.markdown("### Historical Events Table")
+            events_table = []
+            for event in historical_events:
+                events_table.append({
+                    "Date": event.get('date', 'N/A'),
+                    "Change %": event.get('change_pct', 'N/A'),
+                    "Close Price": event.get('close_price', 'N/A'),
+                    "Volume": event.get('volume', 'N/A')
+                })
+            if events_table:
+                df_events = pd.DataFrame(events_table)
+                st.dataframe(df_events, use_container_width=True, hide_index=True)
+        else:
+            st.info("Historical events data not available.")
+    
+    # 7. All Raw Data (JSON Export)
+    with st.expander("💾 Export All Raw Data", expanded=False):
+        st.subheader("Export All Data as JSON")
+        st.markdown("Download all collected raw data in JSON format for external analysis.")
         
-        # 3. Quarterly Financial Statements
-        with st.expander("📊 Quarterly Financial Statements", expanded=False):
-            quarterly_data = raw_data.get('quarterly', {})
-            
-            # Quarterly 데이터 상태 표시
-            quarterly_status = financials.get('quarterly_data_status', {})
-            if quarterly_status:
-                st.markdown("### 📋 Quarterly Data Status")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Has Data", "✅ Yes" if quarterly_status.get('has_data') else "❌ No")
-                    st.metric("Total Quarters", quarterly_status.get('total_quarters', 0))
-                with col2:
-                    st.write(f"**Income Stmt Periods:** {quarterly_status.get('income_stmt_periods', 0)}")
-                    st.write(f"**Balance Sheet Periods:** {quarterly_status.get('balance_sheet_periods', 0)}")
-                    st.write(f"**Cash Flow Periods:** {quarterly_status.get('cashflow_periods', 0)}")
-                with col3:
-                    if quarterly_status.get('earliest_date'):
-                        st.write(f"**Earliest Date:** {quarterly_status.get('earliest_date')}")
-                    if quarterly_status.get('latest_date'):
-                        st.write(f"**Latest Date:** {quarterly_status.get('latest_date')}")
-                    if quarterly_status.get('missing_data'):
-                        st.warning(f"⚠️ Missing: {', '.join(quarterly_status.get('missing_data', []))}")
-                
-                if not quarterly_status.get('has_data'):
-                    st.info("💡 **Note:** yfinance does not provide quarterly financial data for this ticker, or the data is not available. This is a limitation of the data source, not a bug in the application.")
-                
-                st.markdown("---")
+        try:
+            # 전체 데이터를 JSON으로 변환 (DataFrame은 dict로 변환)
+            export_data = {}
+            export_data['profile'] = data.get('profile', {})
             
-            # Quarterly Income Statement
-            st.subheader("Income Statement (Quarterly)")
-            q_income_stmt = quarterly_data.get('income_stmt', pd.DataFrame())
-            if not q_income_stmt.empty:
-                st.dataframe(q_income_stmt, use_container_width=True, height=400)
-                csv_q_income = q_income_stmt.to_csv()
-                st.download_button(
-                    label="📥 Download Quarterly Income Statement as CSV",
-                    data=csv_q_income,
-                    file_name=f"{ticker}_income_statement_quarterly.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Quarterly income statement data not available.")
+            # Financials - DataFrame을 dict로 변환
+            financials_export = {}
+            raw_data_export = {}
             
-            st.markdown("---")
+            # Annual
+            annual_export = {}
+            for key, df in raw_data.get('annual', {}).items():
+                if not df.empty:
+                    annual_export[key] = df.to_dict('index')
+            raw_data_export['annual'] = annual_export
             
-            # Quarterly Balance Sheet
-            st.subheader("Balance Sheet (Quarterly)")
-            q_balance_sheet = quarterly_data.get('balance_sheet', pd.DataFrame())
-            if not q_balance_sheet.empty:
-                st.dataframe(q_balance_sheet, use_container_width=True, height=400)
-                csv_q_balance = q_balance_sheet.to_csv()
-                st.download_button(
-                    label="📥 Download Quarterly Balance Sheet as CSV",
-                    data=csv_q_balance,
-                    file_name=f"{ticker}_balance_sheet_quarterly.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Quarterly balance sheet data not available.")
+            # Quarterly
+            quarterly_export = {}
+            for key, df in raw_data.get('quarterly', {}).items():
+                if not df.empty:
+                    quarterly_export[key] = df.to_dict('index')
+            raw_data_export['quarterly'] = quarterly_export
             
-            st.markdown("---")
+            financials_export['raw_data'] = raw_data_export
+            financials_export['derived_metrics'] = financials.get('derived_metrics', {})
+            export_data['financials'] = financials_export
             
-            # Quarterly Cash Flow
-            st.subheader("Cash Flow Statement (Quarterly)")
-            q_cashflow = quarterly_data.get('cashflow', pd.DataFrame())
-            if not q_cashflow.empty:
-                st.dataframe(q_cashflow, use_container_width=True, height=400)
-                csv_q_cashflow = q_cashflow.to_csv()
-                st.download_button(
-                    label="📥 Download Quarterly Cash Flow as CSV",
-                    data=csv_q_cashflow,
-                    file_name=f"{ticker}_cashflow_quarterly.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("Quarterly cash flow data not available.")
-        
-        # 4. Derived Metrics (Raw) - 추세 포함
-        with st.expander("🔢 Derived Metrics with Trends", expanded=False):
-            st.subheader("Calculated Financial Metrics")
-            
-            # 연간 추세
-            st.markdown("### 📈 Annual Trends")
-            metrics_annual = financials.get('derived_metrics', {})
-            if metrics_annual:
-                # 테이블 형태로 표시
-                metrics_list = []
-                for metric_name, metric_data in metrics_annual.items():
-                    if isinstance(metric_data, dict):
-                        metrics_list.append({
-                            "Metric": metric_name.replace('_', ' ').title(),
-                            "Latest Value": metric_data.get('latest', 'N/A'),
-                            "Trend/Status": metric_data.get('trend', metric_data.get('status', 'N/A')),
-                            "Warning": metric_data.get('warning', False) if 'warning' in metric_data else 'N/A',
-                            "Has Time Series": len(metric_data.get('time_series', [])) > 0
-                        })
-                
-                if metrics_list:
-                    df_metrics = pd.DataFrame(metrics_list)
-                    st.dataframe(df_metrics, use_container_width=True, hide_index=True)
-                    
-                    # 추세 차트
-                    st.markdown("#### Annual Trend Charts")
-                    charts_created = 0
-                    for metric_name, metric_data in metrics_annual.items():
-                        if isinstance(metric_data, dict) and 'time_series' in metric_data:
-                            time_series = metric_data.get('time_series', [])
-                            if time_series and len(time_series) > 1:  # 최소 2개 데이터 포인트 필요
-                                try:
-                                    df_trend = pd.DataFrame(time_series)
-                                    if 'date' in df_trend.columns and 'value' in df_trend.columns:
-                                        # 날짜 순서 정렬 (최신이 앞)
-                                        df_trend = df_trend.sort_values('date', ascending=False)
-                                        
-                                        fig = go.Figure()
-                                        fig.add_trace(go.Scatter(
-                                            x=df_trend['date'],
-                                            y=df_trend['value'],
-                                            mode='lines+markers',
-                                            name=metric_name.replace('_', ' ').title(),
-                                            line=dict(width=2)
-                                        ))
-                                        fig.update_layout(
-                                            title=f"{metric_name.replace('_', ' ').title()} - Annual Trend",
-                                            xaxis_title="Date",
-                                            yaxis_title="Value",
-                                            height=300,
-                                            xaxis_tickangle=-45
-                                        )
-                                        st.plotly_chart(fig, use_container_width=True)
-                                        charts_created += 1
-                                except Exception as e:
-                                    st.warning(f"Could not create chart for {metric_name}: {str(e)}")
-                    
-                    if charts_created == 0:
-                        st.info("No trend charts available (insufficient data points)")
-            else:
-                st.info("Annual derived metrics not available.")
+            # Technicals - DataFrame 제외하고 dict만
+            technicals_export = {k: v for k, v in technicals.items() if k != 'price_data'}
+            if price_data is not None and not price_data.empty:
+                technicals_export['price_data_sample'] = price_data.head(100).to_dict('index')  # 샘플만
+            export_data['technicals'] = technicals_export
             
-            # 쿼터별 추세
-            st.markdown("---")
-            st.markdown("### 📊 Quarterly Trends")
-            metrics_quarterly = financials.get('derived_metrics_quarterly', {})
-            if metrics_quarterly:
-                # 테이블 형태로 표시
-                q_metrics_list = []
-                for metric_name, metric_data in metrics_quarterly.items():
-                    if isinstance(metric_data, dict):
-                        q_metrics_list.append({
-                            "Metric": metric_name.replace('_', ' ').title(),
-                            "Latest Value": metric_data.get('latest', 'N/A'),
-                            "Trend/Status": metric_data.get('trend', metric_data.get('status', 'N/A'))
-                        })
-                
-                if q_metrics_list:
-                    df_q_metrics = pd.DataFrame(q_metrics_list)
-                    st.dataframe(df_q_metrics, use_container_width=True, hide_index=True)
-                    
-                    # 쿼터별 추세 차트
-                    st.markdown("#### Quarterly Trend Charts")
-                    q_charts_created = 0
-                    for metric_name, metric_data in metrics_quarterly.items():
-                        if isinstance(metric_data, dict) and 'time_series' in metric_data:
-                            time_series = metric_data.get('time_series', [])
-                            if time_series and len(time_series) > 1:  # 최소 2개 데이터 포인트 필요
-                                try:
-                                    df_trend = pd.DataFrame(time_series)
-                                    if 'date' in df_trend.columns and 'value' in df_trend.columns:
-                                        # 날짜 순서 정렬 (최신이 앞)
-                                        df_trend = df_trend.sort_values('date', ascending=False)
-                                        
-                                        fig = go.Figure()
-                                        fig.add_trace(go.Scatter(
-                                            x=df_trend['date'],
-                                            y=df_trend['value'],
-                                            mode='lines+markers',
-                                            name=metric_name.replace('_', ' ').title(),
-                                            line=dict(width=2, color='orange')
-                                        ))
-                                        fig.update_layout(
-                                            title=f"{metric_name.replace('_', ' ').title()} - Quarterly Trend",
-                                            xaxis_title="Quarter",
-                                            yaxis_title="Value",
-                                            height=300,
-                                            xaxis_tickangle=-45
-                                        )
-                                        st.plotly_chart(fig, use_container_width=True)
-                                        q_charts_created += 1
-                                except Exception as e:
-                                    st.warning(f"Could not create quarterly chart for {metric_name}: {str(e)}")
-                    
-                    if q_charts_created == 0:
-                        st.info("No quarterly trend charts available (insufficient data points)")
-            else:
-                st.info("💡 Quarterly trends are not available. This may be because:\n"
-                       "- yfinance does not provide quarterly financial data for this ticker\n"
-                       "- The quarterly data is incomplete\n"
-                       "- The ticker is too new or delisted")
+            export_data['news_context'] = news_context
             
-            # JSON Export
-            st.markdown("---")
-            with st.expander("📋 Raw JSON Data", expanded=False):
-                import json
-                all_metrics = {
-                    'annual': metrics_annual,
-                    'quarterly': metrics_quarterly
-                }
-                st.json(all_metrics)
+            json_str = json.dumps(export_data, indent=2, default=str)
+            st.download_button(
+                label="📥 Download All Raw Data as JSON",
+                data=json_str,
+                file_name=f"{ticker}_raw_data.json",
+                mime="application/json"
+            )
+        except Exception as e:
+            st.error(f"Error preparing export data: {str(e)}")
+            st.info("Please try exporting individual data sections above.")
+
+
+# 페이지 설정
+st.set_page_config(
+    page_title="Stock Deep-Dive AI",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# 사이드바
+st.sidebar.title("📈 Stock Deep-Dive AI")
+st.sidebar.markdown("---")
+
+# API Key 입력 (사용자가 매번 직접 입력)
+api_key = st.sidebar.text_input(
+    "Gemini API Key",
+    type="password",
+    value="",  # 항상 빈 값으로 시작
+    help="Enter your Google Gemini API key to enable AI-powered analysis features.",
+    key="api_key_input"
+)
+
+if not api_key or not api_key.strip():
+    st.sidebar.info("💡 Enter your Gemini API Key to unlock AI analysis features. The app works without it for basic indicators.")
+
+# Ticker 입력
+ticker = st.sidebar.text_input(
+    "Enter Ticker (e.g., NVDA, AAPL)",
+    value="GOOGL",
+    help="Enter stock ticker symbol"
+).upper()
+
+# 투자 성향 선택
+strategy = st.sidebar.radio(
+    "Investment Style",
+    ["🚀 Growth", "🛡️ Value"],
+    help="Select your investment strategy"
+)
+
+# 언어 선택
+language = st.sidebar.radio(
+    "Language",
+    ["🇺🇸 English", "🇰🇷 한국어"],
+    help="Select report language"
+)
+
+# 언어 코드 변환
+lang_code = "en" if "English" in language else "ko"
+
+# Gemini 모델 선택
+gemini_model = st.sidebar.radio(
+    "Gemini Model",
+    ["gemini-2.5-flash", "gemini-2.5-flash-lite"],
+    help="Select Gemini model (flash-lite is faster but less capable)"
+)
+
+# Run Analysis 버튼
+run_analysis = st.sidebar.button("Run Analysis", type="primary", use_container_width=True)
+
+# 메인 화면
+st.title("📈 Stock Deep-Dive AI")
+st.markdown("---")
+
+# 세션 상태 초기화
+if 'data' not in st.session_state:
+    st.session_state.data = None
+if 'ai_report' not in st.session_state:
+    st.session_state.ai_report = None
+if 'ai_score' not in st.session_state:
+    st.session_state.ai_score = None
+if 'verdict' not in st.session_state:
+    st.session_state.verdict = None
+if 'chat_history' not in st.session_state:
+    st.session_state.chat_history = []
+if 'analysis' not in st.session_state:
+    st.session_state.analysis = {}
+
+# 분석 실행
+if run_analysis:
+    if not ticker:
+        st.error("⚠️ Please enter a ticker symbol.")
+        st.stop()
+    
+    # 진행 상황 표시
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    try:
+        # 1. 데이터 수집 (API 키 없이도 실행 가능)
+        status_text.text("📊 Collecting data...")
+        progress_bar.progress(20)
         
-        # 5. Technical Indicators (Raw)
-        with st.expander("📈 Technical Indicators (Raw)", expanded=False):
-            technicals = data.get('technicals', {})
-            
-            if technicals.get('error'):
-                st.error(f"Error loading technical data: {technicals.get('error')}")
-            else:
-                st.subheader("Price Data & Technical Indicators")
-                
-                # Price Data DataFrame
-                price_data = technicals.get('price_data')
-                if price_data is not None and not price_data.empty:
-                    st.markdown("### Historical Price Data")
-                    # 주요 컬럼만 표시 (너무 많으면 성능 저하)
-                    display_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-                    if 'RSI' in price_data.columns:
-                        display_cols.append('RSI')
-                    if 'TRIX' in price_data.columns:
-                        display_cols.append('TRIX')
-                    if 'MA_20' in price_data.columns:
-                        display_cols.extend(['MA_20', 'MA_60', 'MA_120'])
-                    
-                    available_cols = [col for col in display_cols if col in price_data.columns]
-                    if available_cols:
-                        st.dataframe(price_data[available_cols], use_container_width=True, height=400)
-                        csv_price = price_data[available_cols].to_csv()
-                        st.download_button(
-                            label="📥 Download Price Data as CSV",
-                            data=csv_price,
-                            file_name=f"{ticker}_price_data.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.dataframe(price_data, use_container_width=True, height=400)
-                else:
-                    st.info("Price data not available.")
-                
-                st.markdown("---")
-                
-                # Current Technical Indicators
-                st.markdown("### Current Technical Indicator Values")
-                tech_summary = {
-                    "RSI(14)": technicals.get('current_rsi', 'N/A'),
-                    "TRIX(30)": technicals.get('current_trix', 'N/A'),
-                    "TRIX Signal": technicals.get('current_trix_signal', 'N/A'),
-                    "Volume Ratio": technicals.get('volume_ratio', 'N/A'),
-                    "MA 20": technicals.get('ma_data', {}).get('MA_20', 'N/A'),
-                    "MA 60": technicals.get('ma_data', {}).get('MA_60', 'N/A'),
-                    "MA 120": technicals.get('ma_data', {}).get('MA_120', 'N/A'),
-                    "Earnings Date": technicals.get('earnings_date', 'N/A'),
-                    "Earnings D-Day": technicals.get('earnings_d_day', 'N/A')
-                }
-                
-                df_tech = pd.DataFrame(list(tech_summary.items()), columns=["Indicator", "Value"])
-                st.dataframe(df_tech, use_container_width=True, hide_index=True)
+        data = collect_data(ticker)
         
-        # 6. News Context (Raw)
-        with st.expander("📰 News Context (Raw)", expanded=False):
-            news_context = data.get('news_context', {})
-            
-            # Recent News
-            st.subheader("Recent News (Raw)")
-            recent_news = news_context.get('recent_news', [])
-            if recent_news:
-                st.json(recent_news)
-                
-                # 테이블 형태로도 표시
-                st.markdown("### Recent News Table")
-                news_table = []
-                for news in recent_news:
-                    news_table.append({
-                        "Title": news.get('title', 'N/A'),
-                        "Publisher": news.get('publisher', 'N/A'),
-                        "Published": news.get('publishTime', 'N/A'),
-                        "Link": news.get('link', 'N/A')[:50] + "..." if news.get('link', 'N/A') != 'N/A' and len(news.get('link', '')) > 50 else news.get('link', 'N/A')
-                    })
-                if news_table:
-                    df_news = pd.DataFrame(news_table)
-                    st.dataframe(df_news, use_container_width=True, hide_index=True)
-            else:
-                st.info("Recent news not available.")
-            
-            st.markdown("---")
-            
-            # Historical Events
-            st.subheader("Historical Volatile Events")
-            historical_events = news_context.get('historical_events', [])
-            if historical_events:
-                st.json(historical_events)
-                
-                # 테이블 형태로도 표시
-                st.markdown("### Historical Events Table")
-                events_table = []
-                for event in historical_events:
-                    events_table.append({
-                        "Date": event.get('date', 'N/A'),
-                        "Change %": event.get('change_pct', 'N/A'),
-                        "Close Price": event.get('close_price', 'N/A'),
-                        "Volume": event.get('volume', 'N/A')
-                    })
-                if events_table:
-                    df_events = pd.DataFrame(events_table)
-                    st.dataframe(df_events, use_container_width=True, hide_index=True)
-            else:
-                st.info("Historical events data not available.")
+        st.session_state.data = data
+        # 같은 티커는 최신 순서로 다시 넣고, 보관 개수를 넘으면 가장 오래된 분석부터 제거
+        st.session_state.analysis.pop(ticker, None)
+        st.session_state.analysis[ticker] = {'data': data}
+        while len(st.session_state.analysis) > ANALYSIS_MAX_TICKERS:
+            st.session_state.analysis.pop(next(iter(st.session_state.analysis)))
+        progress_bar.progress(40)
         
-        # 7. All Raw Data (JSON Export)
-        with st.expander("💾 Export All Raw Data", expanded=False):
-            st.subheader("Export All Data as JSON")
-            st.markdown("Download all collected raw data in JSON format for external analysis.")
-            
+        # 2. AI 분석 (API 키가 있는 경우에만 실행)
+        if api_key and api_key.strip():
             try:
-                # 전체 데이터를 JSON으로 변환 (DataFrame은 dict로 변환)
-                export_data = {}
-                export_data['profile'] = data.get('profile', {})
-                
-                # Financials - DataFrame을 dict로 변환
-                financials_export = {}
-                raw_data_export = {}
-                
-                # Annual
-                annual_export = {}
-                for key, df in raw_data.get('annual', {}).items():
-                    if not df.empty:
-                        annual_export[key] = df.to_dict('index')
-                raw_data_export['annual'] = annual_export
-                
-                # Quarterly
-                quarterly_export = {}
-                for key, df in raw_data.get('quarterly', {}).items():
-                    if not df.empty:
-                        quarterly_export[key] = df.to_dict('index')
-                raw_data_export['quarterly'] = quarterly_export
-                
-                financials_export['raw_data'] = raw_data_export
-                financials_export['derived_metrics'] = financials.get('derived_metrics', {})
-                export_data['financials'] = financials_export
+                status_text.text("🤖 Running AI analysis...")
+                progress_bar.progress(60)
                 
-                # Technicals - DataFrame 제외하고 dict만
-                technicals_export = {k: v for k, v in technicals.items() if k != 'price_data'}
-                if price_data is not None and not price_data.empty:
-                    technicals_export['price_data_sample'] = price_data.head(100).to_dict('index')  # 샘플만
-                export_data['technicals'] = technicals_export
+                analyst = AIAnalyst(api_key, model_name=gemini_model)
+                ai_report = analyst.generate_report(ticker, data, strategy, language=lang_code)
+                # 리포트에서 Score와 Verdict 추출
+                ai_score, verdict = analyst.extract_score_and_verdict(ai_report)
                 
-                export_data['news_context'] = news_context
+                st.session_state.ai_report = ai_report
+                st.session_state.ai_score = ai_score
+                st.session_state.verdict = verdict
                 
-                json_str = json.dumps(export_data, indent=2, default=str)
-                st.download_button(
-                    label="📥 Download All Raw Data as JSON",
-                    data=json_str,
-                    file_name=f"{ticker}_raw_data.json",
-                    mime="application/json"
-                )
-            except Exception as e:
-                st.error(f"Error preparing export data: {str(e)}")
-                st.info("Please try exporting individual data sections above.")
+                progress_bar.progress(100)
+                status_text.text("✅ Analysis complete!")
+                time.sleep(0.5)
+                progress_bar.empty()
+                status_text.empty()
+            except Exception as ai_error:
+                # AI 분석 실패해도 기본 지표는 계속 표시
+                st.warning(f"⚠️ AI analysis failed: {str(ai_error)}. Showing basic indicators only.")
+                st.session_state.ai_report = None
+                st.session_state.ai_score = None
+                st.session_state.verdict = None
+                progress_bar.progress(100)
+                status_text.text("✅ Basic analysis complete!")
+                time.sleep(0.5)
+                progress_bar.empty()
+                status_text.empty()
+        else:
+            # API 키가 없는 경우 기본 지표만 표시
+            st.session_state.ai_report = None
+            st.session_state.ai_score = None
+            st.session_state.verdict = None
+            progress_bar.progress(100)
+            status_text.text("✅ Basic analysis complete! (Enter API key for AI analysis)")
+            time.sleep(0.5)
+            progress_bar.empty()
+            status_text.empty()
+        
+        # AI 결과도 티커별 분석 결과와 함께 보관
+        st.session_state.analysis[ticker].update(
+            ai_report=st.session_state.ai_report,
+            ai_score=st.session_state.ai_score,
+            verdict=st.session_state.verdict
+        )
+        
+    except Exception as e:
+        st.error(f"❌ Error collecting data: {str(e)}")
+        st.stop()
+
+# 티커별로 저장된 분석 결과 재사용 (데이터와 AI 리포트가 같은 시점을 유지하도록 Run Analysis에서만 갱신)
+cached_analysis = st.session_state.analysis.get(ticker)
+if cached_analysis:
+    # 다른 티커의 데이터/리포트가 섞여 표시되지 않도록 해당 티커의 결과 복원
+    st.session_state.data = cached_analysis['data']
+    for field in ('ai_report', 'ai_score', 'verdict'):
+        if field in cached_analysis:
+            st.session_state[field] = cached_analysis[field]
+
+# 데이터가 있으면 탭 표시
+if st.session_state.data:
+    data = st.session_state.data
+    profile = data.get('profile', {})
+    
+    # 헤더 정보
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Company", profile.get('longName', 'N/A'))
+    with col2:
+        st.metric("Ticker", ticker)
+    with col3:
+        current_price = profile.get('currentPrice', 'N/A')
+        change_pct = profile.get('changePercent', 'N/A')
+        if current_price != 'N/A' and change_pct != 'N/A':
+            st.metric("Current Price", f"${current_price:.2f}", f"{change_pct:.2f}%")
+        else:
+            st.metric("Current Price", "N/A")
+    with col4:
+        if st.session_state.ai_score is not None:
+            st.metric("AI Score", f"{st.session_state.ai_score}/100")
+        else:
+            st.metric("AI Score", "N/A")
+    
+    # Verdict 배지 (API 키가 있고 AI 분석이 완료된 경우에만 표시)
+    if st.session_state.verdict:
+        st.markdown(f"### {st.session_state.verdict}")
+    elif not api_key or not api_key.strip():
+        st.info("💡 Enter your Gemini API Key in the sidebar to get AI analysis and investment verdict.")
+    
+    st.markdown("---")
+    
+    # 탭 생성
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Summary & Analysis", "💰 Financials", "📊 Technicals", "📊 Raw Data", "💬 AI Chat"])
+    
+    # Tab 1: Summary & Analysis (통합)
+    with tab1:
+        _render_summary_tab(data, strategy, api_key)
+    
+    # Tab 2: Financials
+    with tab2:
+        _render_financials_tab(data)
+    
+    # Tab 3: Technicals
+    with tab3:
+        _render_technicals_tab(ticker, data)
+    
+    # Tab 4: Raw Data
+    with tab4:
+        _render_raw_data_tab(ticker, data)
     
     # Tab 5: AI Chat
     with tab5:
@@ -7,17 +7,65 @@ from typing import Dict, Any, Optional, Tuple
 import json
 import pandas as pd
 import re
+import logging
+import warnings
 
 try:
     # Try absolute import first (when stock is a package)
-    from stock.utils import format_number, safe_execute
+    from stock.utils import format_number
 except ImportError:
     # Fallback to relative import (when running from stock directory)
     try:
-        from .utils import format_number, safe_execute
+        from .utils import format_number
     except ImportError:
         # Final fallback: direct import (when stock is in sys.path)
-        from utils import format_number, safe_execute
+        from utils import format_number
+
+logger = logging.getLogger(__name__)
+
+
+# Verdict 문자열 상수 (호출마다 새 객체를 만들지 않고 동일 참조 반환)
+_V_STRONG_BUY = "🟢 STRONG BUY"
+_V_BUY = "🟢 BUY"
+_V_HOLD = "🟡 HOLD"
+_V_SELL = "🔴 SELL"
+_FALLBACK = (50, _V_HOLD)
+
+# AI Score가 없을 때 Verdict별 기본 점수
+_VERDICT_DEFAULT_SCORE = {
+    _V_STRONG_BUY: 85,
+    _V_BUY: 70,
+    _V_HOLD: 50,
+    _V_SELL: 30,
+}
+
+# Deprecated 메서드 경고는 메서드별로 1회만 발생
+_deprecation_warned = set()
+
+
+def _warn_deprecated(name: str) -> None:
+    if name in _deprecation_warned:
+        return
+    _deprecation_warned.add(name)
+    warnings.warn(
+        f"AIAnalyst.{name} is deprecated; use extract_score_and_verdict instead",
+        DeprecationWarning,
+        stacklevel=3
+    )
+
+
+# Score/Verdict 추출용 정규식 (대소문자 무시, 모듈 로드 시 1회 컴파일)
+# [:\*\s]* 가 이미 '**' 를 흡수하므로 별도의 \*?\*? 는 두지 않음 (불필요한 백트래킹 방지)
+_AI_SCORE_PATTERNS = (
+    re.compile(r'\bai\s+score[:\*\s]*(\d+)', re.IGNORECASE),  # "AI Score: **85**", "AI Score: 85"
+    re.compile(r'score[:\*\s]*(\d+)', re.IGNORECASE),  # "Score: **85**"
+)
+_FINAL_RATING_RE = re.compile(
+    r'\bfinal\s+(?:rating|verdict)[:\*\s]*([A-Z\s]+)',
+    re.IGNORECASE
+)
+# Final Rating 섹션이 없을 때 리포트 전체를 1회 스캔하여 등장한 키워드 수집
+_VERDICT_KEYWORD_RE = re.compile(r'STRONG BUY|FINAL RATING|BUY|HOLD|SELL', re.IGNORECASE)
 
 
 class AIAnalyst:
@@ -281,6 +329,10 @@ $[Specific price]
         news_context = data.get('news_context', {})
         metrics = financials.get('derived_metrics', {}) if financials else {}
         
+        # 실적 발표 임박 여부는 1회만 판단하여 두 언어 프롬프트에서 재사용
+        earnings_d_day = technicals.get('earnings_d_day')
+        earnings_soon = earnings_d_day is not None and earnings_d_day <= 7
+        
         if language == "ko":
             prompt = f"""다음은 {ticker} 주식의 분석 데이터다. 위에서 제시한 원칙과 순서에 따라 종합 분석 리포트를 작성하라.
 
@@ -334,7 +386,7 @@ $[Specific price]
 - **Volume Ratio**: {technicals.get('volume_ratio', 'N/A')}
 
 - **Next Earnings**: {technicals.get('earnings_date', 'N/A')} (D-{technicals.get('earnings_d_day', 'N/A')})
-  - {"⚠️ Earnings within 7 days - Volatility warning required" if technicals.get('earnings_d_day') is not None and technicals.get('earnings_d_day') <= 7 else ""}
+  - {"⚠️ Earnings within 7 days - Volatility warning required" if earnings_soon else ""}
 
 ---
 
@@ -417,7 +469,7 @@ The following metrics are already calculated and provided. DO NOT calculate - in
 - **Volume Ratio**: {technicals.get('volume_ratio', 'N/A')}
   
 - **Next Earnings**: {technicals.get('earnings_date', 'N/A')} (D-{technicals.get('earnings_d_day', 'N/A')})
-  - {"⚠️ Earnings within 7 days - Volatility Warning Required" if technicals.get('earnings_d_day') is not None and technicals.get('earnings_d_day') <= 7 else ""}
+  - {"⚠️ Earnings within 7 days - Volatility Warning Required" if earnings_soon else ""}
 
 ---
 
@@ -735,20 +787,18 @@ Your role combines:
         Returns:
             (score: int, verdict: str) 튜플
         """
+        # 빈 리포트는 정규식 스캔 없이 기본값 반환
+        if not report:
+            return _FALLBACK
+        
         try:
             verdict = None
             score = None
-            report_upper = report.upper()
             
             # 1. AI Score 직접 추출 (우선순위 1)
-            ai_score_patterns = [
-                r'ai\s+score[:\*\s]*\*?\*?(\d+)\*?\*?',  # "AI Score: **85**"
-                r'ai\s+score[:\*\s]*(\d+)',  # "AI Score: 85"
-                r'score[:\*\s]*\*?\*?(\d+)\*?\*?',  # "Score: **85**"
-            ]
-            
-            for pattern in ai_score_patterns:
-                score_match = re.search(pattern, report_upper, re.IGNORECASE | re.MULTILINE)
+            # 원본 리포트를 대소문자 무시 정규식으로 스캔 (upper() 복사본 생성 없음)
+            for pattern in _AI_SCORE_PATTERNS:
+                score_match = pattern.search(report)
                 if score_match:
                     try:
                         score = int(score_match.group(1))
@@ -761,82 +811,67 @@ Your role combines:
                         continue
             
             # 2. Final Rating 추출 (Verdict 결정용)
-            final_rating_match = re.search(
-                r'(?:final\s+rating|final\s+verdict)[:\*\s]*\*?\*?([A-Z\s]+)\*?\*?',
-                report_upper,
-                re.IGNORECASE | re.MULTILINE
-            )
+            final_rating_match = _FINAL_RATING_RE.search(report)
             
             if final_rating_match:
-                rating_text = final_rating_match.group(1).strip()
+                rating_text = final_rating_match.group(1).strip().upper()
                 if "STRONG" in rating_text and "BUY" in rating_text:
-                    verdict = "🟢 STRONG BUY"
-                    if score is None:
-                        score = 85
+                    verdict = _V_STRONG_BUY
                 elif "BUY" in rating_text:
-                    verdict = "🟢 BUY"
-                    if score is None:
-                        score = 70
+                    verdict = _V_BUY
                 elif "HOLD" in rating_text:
-                    verdict = "🟡 HOLD"
-                    if score is None:
-                        score = 50
+                    verdict = _V_HOLD
                 elif "SELL" in rating_text:
-                    verdict = "🔴 SELL"
-                    if score is None:
-                        score = 30
+                    verdict = _V_SELL
             else:
                 # Final Rating 섹션을 못 찾은 경우, 전체 리포트에서 검색
-                if "**STRONG BUY**" in report or "STRONG BUY" in report_upper:
-                    verdict = "🟢 STRONG BUY"
-                    if score is None:
-                        score = 85
-                elif "**BUY**" in report or (report_upper.find("FINAL RATING") != -1 and "BUY" in report_upper):
-                    verdict = "🟢 BUY"
-                    if score is None:
-                        score = 70
-                elif "**HOLD**" in report or "HOLD" in report_upper:
-                    verdict = "🟡 HOLD"
-                    if score is None:
-                        score = 50
-                elif "**SELL**" in report or "SELL" in report_upper:
-                    verdict = "🔴 SELL"
-                    if score is None:
-                        score = 30
+                # (STRONG BUY > BUY > HOLD > SELL 우선순위, STRONG BUY 발견 시 즉시 중단)
+                found = set()
+                for keyword_match in _VERDICT_KEYWORD_RE.finditer(report):
+                    keyword = keyword_match.group(0).upper()
+                    found.add(keyword)
+                    if keyword == "STRONG BUY":
+                        break
+                
+                if "STRONG BUY" in found:
+                    verdict = _V_STRONG_BUY
+                elif "**BUY**" in report or ("FINAL RATING" in found and "BUY" in found):
+                    verdict = _V_BUY
+                elif "HOLD" in found:
+                    verdict = _V_HOLD
+                elif "SELL" in found:
+                    verdict = _V_SELL
                 else:
                     # Verdict를 찾을 수 없는 경우 기본값
-                    verdict = "🟡 HOLD"
-                    if score is None:
-                        score = 50
+                    verdict = _V_HOLD
             
-            # 3. 점수가 여전히 None이면 기본값 설정
+            # 3. 점수가 없으면 Verdict별 기본 점수 사용 (dict 조회 1회)
             if score is None:
-                score = 50
+                score = _VERDICT_DEFAULT_SCORE.get(verdict, 50)
             
             # 4. 점수 범위 제한 (안전장치)
-            score = max(0, min(100, score))
+            score = 0 if score < 0 else (100 if score > 100 else score)
             
             return score, verdict
             
-        except Exception as e:
-            return safe_execute(
-                lambda: (50, "🟡 HOLD"),
-                (50, "🟡 HOLD"),
-                f"Error extracting score and verdict: {str(e)}",
-                log_error=True
-            )
+        except Exception:
+            logger.exception("Error extracting score and verdict")
+            return _FALLBACK
     
-    def calculate_ai_score(self, data: Dict[str, Any], strategy: str) -> int:
+    @staticmethod
+    def calculate_ai_score(data: Dict[str, Any], strategy: str) -> int:
         """
         [Deprecated] 리포트 기반 점수 추출 사용 권장
         호환성을 위해 유지하지만, extract_score_and_verdict 사용 권장
         """
-        return 50  # 기본값 반환
+        _warn_deprecated("calculate_ai_score")
+        return _FALLBACK[0]  # 기본값 반환
     
-    def get_verdict(self, score: int) -> str:
+    @staticmethod
+    def get_verdict(score: int) -> str:
         """
         [Deprecated] 리포트 기반 verdict 추출 사용 권장
         호환성을 위해 유지하지만, extract_score_and_verdict 사용 권장
         """
-        return "🟡 HOLD"  # 기본값 반환
-
+        _warn_deprecated("get_verdict")
+        return _V_HOLD  # 기본값 반환
@@ -6,8 +6,16 @@ yfinance를 활용하여 재무 데이터, 기술적 지표 등을 수집하고
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Sequence
+import json
+import os
+import re
+import shutil
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 try:
     # Try absolute import first (when stock is a package)
@@ -35,6 +43,20 @@ except ImportError:
             safe_divide
         )
 
+try:
+    from stock.indicators import compute_technicals, rolling_mean
+except ImportError:
+    try:
+        from .indicators import compute_technicals, rolling_mean
+    except ImportError:
+        from indicators import compute_technicals, rolling_mean
+
+# yfinance 0.2.54+는 HTTP 429를 전용 예외로 알림 (이전 버전은 HTTP 상태 코드로 판단)
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:
+    YFRateLimitError = None
+
 # duckduckgo_search 라이브러리
 try:
     from duckduckgo_search import DDGS
@@ -50,12 +72,407 @@ try:
 except ImportError:
     USE_PANDAS_TA = False
 
+# pyarrow가 있으면 재무제표/주가 데이터를 Parquet 파일로 디스크에 캐시
+try:
+    import pyarrow  # noqa: F401
+    USE_PARQUET = True
+except ImportError:
+    USE_PARQUET = False
+
 warnings.filterwarnings('ignore')
 
+# yfinance 응답 캐시 TTL (초)
+INFO_CACHE_TTL = 60 * 60
+HISTORY_CACHE_TTL = 10 * 60
+NEWS_CACHE_TTL = 10 * 60
+
+# 주가 데이터에서 사용하는 컬럼 (배당/분할 컬럼은 요청하지 않음)
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+STATEMENT_CACHE_TTL = 24 * 60 * 60
+
+# 디스크 캐시 (.cache/<TICKER>/<endpoint>.parquet|.json) - 프로세스 재시작 후에도 재사용
+# 재무제표는 연간 7일, 분기 1일 / info·주가·뉴스는 메모리 캐시와 같은 TTL (현재가/최신 봉/기사 반영)
+DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+ANNUAL_STATEMENT_FILE_TTL = 7 * 24 * 60 * 60
+QUARTERLY_STATEMENT_FILE_TTL = 24 * 60 * 60
+INFO_FILE_TTL = INFO_CACHE_TTL
+HISTORY_FILE_TTL = HISTORY_CACHE_TTL
+NEWS_FILE_TTL = NEWS_CACHE_TTL
+# 디스크 캐시에 보관할 최대 티커 수 (초과 시 가장 오래전에 기록된 티커 디렉터리부터 삭제)
+DISK_CACHE_MAX_TICKERS = 200
+# 디스크 캐시 경로에 사용할 수 있는 티커/엔드포인트 형식 (사용자 입력이 캐시 디렉터리 밖을 가리키지 않도록 제한)
+_CACHE_TICKER_RE = re.compile(r'(?=.*[A-Z0-9])[A-Z0-9.\-^=]{1,15}')
+_CACHE_ENDPOINT_RE = re.compile(r'[A-Za-z0-9_]{1,64}')
+
+# yfinance 요청 재시도 (rate limit(429)/서버 오류(5xx)/연결 오류 시 0.5초, 1초 간격으로 최대 3회 시도)
+FETCH_ATTEMPTS = 3
+FETCH_BACKOFF_SECONDS = 0.5
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+# 빈 응답(ETF의 재무제표, 실적 일정/뉴스 없는 종목 등)은 정상 응답이지만 일시적일 수 있으므로 짧게 캐시
+EMPTY_RESPONSE_TTL = 60
+
+# yfinance 요청 속도 제한 (순간 10건까지 허용, 이후 초당 5건)
+REQUEST_RATE_PER_SECOND = 5.0
+REQUEST_BURST = 10
+
+# (티커, 엔드포인트) -> (조회 시각, 응답) : 인스턴스 간 공유되는 프로세스 전역 캐시
+# 최근 사용 순으로 최대 RESPONSE_CACHE_SIZE개 유지 (티커당 info/재무제표 6종/주가/뉴스 등 약 10개)
+RESPONSE_CACHE_SIZE = 256
+_response_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+_response_cache_lock = threading.Lock()
+# 캐시 미스 시 (티커, 엔드포인트)별 요청 잠금 (같은 키를 동시에 요청한 스레드가 중복 요청하지 않도록)
+# 키 -> [잠금, 사용 중인 스레드 수] : 잠금을 기다리는 스레드가 없을 때만 항목 제거
+_fetch_locks: Dict[tuple, list] = {}
+_fetch_locks_guard = threading.Lock()
+
+# 파생 지표 계산 결과 캐시 (재무제표 내용 기준, 최근 사용 순으로 최대 METRICS_CACHE_SIZE개 유지)
+METRICS_CACHE_SIZE = 64
+_metrics_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_metrics_cache_lock = threading.Lock()
+
+# 티커별 yf.Ticker 객체 공유 (같은 티커의 StockDataManager 인스턴스가 Ticker 내부 캐시를 함께 사용)
+# 최근 사용 순으로 최대 TICKER_CACHE_SIZE개 유지
+TICKER_CACHE_SIZE = 64
+_ticker_cache: 'OrderedDict[str, yf.Ticker]' = OrderedDict()
+_ticker_cache_lock = threading.Lock()
+
+
+def _get_ticker(ticker_symbol: str) -> yf.Ticker:
+    """티커 심볼에 대한 공유 yf.Ticker 객체 반환 (캐시에 없을 때만 생성)"""
+    with _ticker_cache_lock:
+        ticker = _ticker_cache.get(ticker_symbol)
+        if ticker is None:
+            ticker = yf.Ticker(ticker_symbol)
+            _ticker_cache[ticker_symbol] = ticker
+            if len(_ticker_cache) > TICKER_CACHE_SIZE:
+                _ticker_cache.popitem(last=False)
+        else:
+            _ticker_cache.move_to_end(ticker_symbol)
+        return ticker
+
+
+# 데이터가 없을 때 반환하는 빈 재무제표 (오류 경로마다 새로 만들지 않고 공유 - 읽기 전용)
+_EMPTY_STATEMENT = pd.DataFrame()
+
+
+class _RateLimiter:
+    """스레드 간 공유되는 토큰 버킷 속도 제한기"""
+    
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """토큰 1개 사용 (부족하면 다음 토큰이 채워질 때까지 대기)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # 음수가 되면 이후 채워질 토큰을 미리 예약한 것으로 보고 그만큼 대기
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(REQUEST_RATE_PER_SECOND, REQUEST_BURST)
+
+
+def _is_empty_response(value: Any) -> bool:
+    """yfinance 빈 응답 여부 (None, 빈 dict/list, 빈 DataFrame)"""
+    if isinstance(value, (dict, list)):
+        return len(value) == 0
+    return value is None or getattr(value, 'empty', False)
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """재시도할 만한 오류인지 확인 (rate limit, 5xx 응답, 연결/타임아웃 오류)"""
+    if YFRateLimitError is not None and isinstance(error, YFRateLimitError):
+        return True
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is not None:
+        return status in RETRY_STATUS_CODES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _request_with_retry(fetch):
+    """
+    속도 제한을 거쳐 yfinance 요청 실행, 재시도할 만한 오류(_is_retryable_error)면 지수 백오프 후 재시도
+    
+    빈 응답은 정상 결과로 보고 그대로 반환, 그 밖의 예외와 마지막 시도의 예외는 그대로 전파
+    """
+    for attempt in range(FETCH_ATTEMPTS):
+        _rate_limiter.acquire()
+        try:
+            return fetch()
+        except Exception as e:
+            if attempt == FETCH_ATTEMPTS - 1 or not _is_retryable_error(e):
+                raise
+        time.sleep(FETCH_BACKOFF_SECONDS * 2 ** attempt)
+
+
+# _cache_lookup의 캐시 미스 표시 (None도 캐시된 응답일 수 있으므로 별도 객체 사용)
+_CACHE_MISS = object()
+
+
+def _cache_lookup(key: tuple, ttl: float):
+    """유효한 캐시 응답 반환 (없거나 만료되었으면 _CACHE_MISS - 만료된 항목은 캐시에서 제거)"""
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None:
+            return _CACHE_MISS
+        fetched_at, value = cached
+        # 빈 응답은 EMPTY_RESPONSE_TTL 동안만 재사용
+        if time.monotonic() - fetched_at < (min(ttl, EMPTY_RESPONSE_TTL) if _is_empty_response(value) else ttl):
+            _response_cache.move_to_end(key)
+            return value
+        del _response_cache[key]
+        return _CACHE_MISS
+
+
+def _cached_fetch(ticker_symbol: str, endpoint: str, ttl: float, fetch):
+    """
+    티커/엔드포인트별 yfinance 응답 캐시 (TTL 내 재호출 시 네트워크 요청 생략)
+    
+    Args:
+        ticker_symbol: 주식 티커 심볼
+        endpoint: 캐시 구분용 이름 (예: 'info', 'income_stmt')
+        ttl: 캐시 유지 시간 (초)
+        fetch: 캐시 미스 시 호출할 함수
+    """
+    key = (ticker_symbol, endpoint)
+    value = _cache_lookup(key, ttl)
+    if value is not _CACHE_MISS:
+        return value
+    
+    # 같은 키를 동시에 요청한 스레드는 먼저 시작한 요청이 끝나기를 기다린 뒤 그 결과를 재사용
+    # (먼저 시작한 요청이 실패하면 기다리던 스레드가 같은 잠금 아래에서 한 번에 하나씩 다시 요청)
+    with _fetch_locks_guard:
+        entry = _fetch_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            value = _cache_lookup(key, ttl)
+            if value is _CACHE_MISS:
+                now = time.monotonic()
+                value = fetch()
+                with _response_cache_lock:
+                    _response_cache[key] = (now, value)
+                    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                        _response_cache.popitem(last=False)
+            return value
+    finally:
+        with _fetch_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _fetch_locks[key]
+
+
+def _disk_cache_path(ticker_symbol: str, endpoint: str, extension: str) -> Optional[str]:
+    """디스크 캐시 파일 경로 (티커/엔드포인트가 허용된 형식이 아니면 None - 디스크 캐시 생략)"""
+    if not (_CACHE_TICKER_RE.fullmatch(ticker_symbol) and _CACHE_ENDPOINT_RE.fullmatch(endpoint)):
+        return None
+    return os.path.join(DISK_CACHE_DIR, ticker_symbol, f'{endpoint}.{extension}')
+
+
+def _prepare_disk_cache_dir(path: str) -> None:
+    """
+    캐시 파일의 티커 디렉터리를 만들고 최근 기록 시각 갱신
+    
+    새 티커 디렉터리를 만든 경우 DISK_CACHE_MAX_TICKERS개를 넘는 오래된 티커 디렉터리 삭제
+    """
+    directory = os.path.dirname(path)
+    is_new = not os.path.isdir(directory)
+    os.makedirs(directory, exist_ok=True)
+    os.utime(directory)
+    if not is_new:
+        return
+    
+    entries = [entry for entry in os.scandir(DISK_CACHE_DIR) if entry.is_dir()]
+    excess = len(entries) - DISK_CACHE_MAX_TICKERS
+    if excess > 0:
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime)[:excess]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _parquet_cached_frame(ticker_symbol: str, endpoint: str, ttl: float, fetch, transpose: bool = False):
+    """
+    DataFrame을 Parquet 파일로 디스크 캐시 (파일 수정 시각 기준 TTL, 프로세스 재시작 후에도 재사용)
+    
+    재무제표는 열이 날짜(Timestamp)이므로 문자열 열 이름이 필요한 Parquet에는 transpose=True로 저장
+    """
+    path = _disk_cache_path(ticker_symbol, endpoint, 'parquet')
+    if not USE_PARQUET or path is None:
+        return fetch()
+    
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            frame = pd.read_parquet(path)
+            return frame.T if transpose else frame
+    except Exception:
+        # 파일 없음/손상 시 네트워크에서 다시 조회
+        pass
+    
+    frame = fetch()
+    if frame is not None and not frame.empty:
+        try:
+            _prepare_disk_cache_dir(path)
+            (frame.T if transpose else frame).to_parquet(path, engine='pyarrow', compression='zstd')
+        except Exception:
+            # 디스크 쓰기 실패는 캐시만 건너뜀
+            pass
+    return frame
+
+
+def _json_cached_response(ticker_symbol: str, endpoint: str, ttl: float, fetch):
+    """JSON 응답(info, 뉴스 목록 등)을 파일로 디스크 캐시 (파일 수정 시각 기준 TTL)"""
+    path = _disk_cache_path(ticker_symbol, endpoint, 'json')
+    if path is None:
+        return fetch()
+    
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception:
+        # 파일 없음/손상 시 네트워크에서 다시 조회
+        pass
+    
+    response = fetch()
+    if response:
+        try:
+            _prepare_disk_cache_dir(path)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(response, f, ensure_ascii=False)
+        except Exception:
+            # 직렬화/디스크 쓰기 실패는 캐시만 건너뜀
+            pass
+    return response
+
+
+def _as_float(value: Any) -> float:
+    """숫자면 float, 결측(None)이나 비숫자면 NaN 반환"""
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+def _find_column(df: pd.DataFrame, keys: Sequence[str]) -> Optional[pd.Series]:
+    """
+    후보 컬럼명 중 df에 존재하는 첫 번째 컬럼 반환 (없으면 None)
+    
+    Index의 `in` 검사는 Index에 캐시되는 해시 테이블을 사용하므로
+    같은 프레임에 대한 반복 조회마다 set을 새로 만들지 않고 df.columns를 그대로 사용
+    """
+    columns = df.columns
+    key = next((key for key in keys if key in columns), None)
+    return df[key] if key is not None else None
+
+
+def _coalesce_columns(df: pd.DataFrame, keys: Sequence[str]) -> Optional[pd.Series]:
+    """후보 컬럼들을 우선순위대로 합쳐 행마다 첫 번째 유효값을 갖는 Series 반환 (없으면 None)"""
+    columns = df.columns
+    present = [key for key in keys if key in columns]
+    if not present:
+        return None
+    return df[present].bfill(axis=1).iloc[:, 0]
+
+
+def _period_ratios(numerator: pd.Series, denominator: pd.Series,
+                   absolute_denominator: bool = False):
+    """
+    기간별 분자/분모 비율을 한 번에 계산하고 계산 가능한 기간만 반환 (safe_divide와 같은 규칙)
+    
+    Args:
+        numerator: 분자 컬럼 (index=기간)
+        denominator: 분모 컬럼 (numerator의 기간에 맞춰 정렬)
+        absolute_denominator: 분모에 절댓값 사용 여부 (예: Interest Expense)
+    
+    Returns:
+        (기간 목록, 분자 list, 분모 list, 비율 ndarray) - 결측/0 분모 기간 제외
+    """
+    num = pd.to_numeric(numerator, errors='coerce').to_numpy(dtype=np.float64)
+    den = pd.to_numeric(denominator.reindex(numerator.index), errors='coerce').to_numpy(dtype=np.float64)
+    divisor = np.abs(den) if absolute_denominator else den
+    
+    valid = ~np.isnan(num) & ~np.isnan(den) & (den != 0)
+    ratios = num[valid] / divisor[valid]
+    return numerator.index[valid].tolist(), num[valid].tolist(), den[valid].tolist(), ratios
+
+
+def _trend_label(values: np.ndarray) -> str:
+    """최근 값(values[0])과 직전 값(values[1]) 비교로 추세 라벨 결정"""
+    if values.size < 2:
+        return 'N/A'
+    return 'Improving' if values[0] > values[1] else 'Declining' if values[0] < values[1] else 'Stable'
+
+
+def _compact_history(hist: pd.DataFrame) -> pd.DataFrame:
+    """
+    캐시에 보관할 주가 데이터 축소 (OHLCV 컬럼만 유지, 거래량은 손실 없는 최소 정수형으로 변환)
+    
+    가격 컬럼은 고가 종목(예: BRK-A)의 소수점 정밀도를 위해 float64 유지
+    """
+    hist = hist[list(hist.columns.intersection(PRICE_COLUMNS, sort=False))]
+    if 'Volume' in hist.columns:
+        # 결측치나 음수가 있으면 pandas가 원래 dtype을 그대로 유지
+        hist = hist.assign(Volume=pd.to_numeric(hist['Volume'], downcast='unsigned'))
+    return hist
+
+
+def _frame_signature(df: pd.DataFrame) -> tuple:
+    """재무제표 내용 비교용 키 (행/열 라벨 + 값 바이트)"""
+    return (
+        tuple(df.index.astype(str)),
+        tuple(df.columns.astype(str)),
+        df.to_numpy(dtype=np.float64, na_value=np.nan).tobytes()
+    )
+
+
+def _recent_periods(statement: Optional[pd.DataFrame], periods: int) -> pd.DataFrame:
+    """
+    재무제표(열=날짜)에서 최근 periods개 기간만 잘라 행=날짜로 변환
+    
+    날짜 열만 먼저 잘라낸 뒤 transpose하여 전체 프레임을 복사하지 않음
+    (object/혼합 dtype이면 float64 단일 블록으로 바꾼 뒤 transpose - 2차원 배열 전치만으로 처리됨)
+    """
+    if statement is None or statement.empty:
+        return pd.DataFrame()
+    recent = statement.iloc[:, :periods]
+    if not (recent.dtypes == np.float64).all():
+        recent = recent.apply(pd.to_numeric, errors='coerce').astype(np.float64)
+    return recent.T
+
 
 class StockDataManager:
     """주식 데이터 수집 및 분석을 담당하는 클래스"""
     
+    # 재무제표 항목별 후보 컬럼명 (yfinance 버전/기업마다 이름이 달라 우선순위대로 탐색)
+    _OCF_KEYS = ('Operating Cash Flow', 'Total Cash From Operating Activities',
+                 'OperatingCashFlow', 'Cash from Operating Activities')
+    _NET_INCOME_KEYS = ('Net Income', 'NetIncome', 'Net Income Common Stockholders')
+    _REVENUE_KEYS = ('Total Revenue', 'Revenue', 'Revenues', 'Net Sales')
+    _RECEIVABLES_KEYS = ('Receivables', 'Accounts Receivable',
+                         'Net Receivables', 'AccountsReceivable')
+    _COGS_KEYS = ('Cost Of Goods Sold', 'Cost of Revenue', 'COGS',
+                  'CostOfGoodsSold', 'Cost of Goods Sold')
+    _INVENTORY_KEYS = ('Inventory', 'Inventories', 'Total Inventory')
+    _EBIT_KEYS = ('EBIT', 'Earnings Before Interest And Taxes',
+                  'Operating Income', 'Income Before Tax')
+    _INTEREST_KEYS = ('Interest Expense', 'InterestExpense',
+                      'Total Interest Expense', 'Interest And Debt Expense')
+    _DEBT_KEYS = ('Total Debt', 'TotalDebt', 'Total Liabilities Net Minority Interest',
+                  'Total Liabilities', 'Long Term Debt', 'Short Term Debt')
+    _EQUITY_KEYS = ('Total Stockholder Equity', 'Stockholders Equity',
+                    'Total Equity', 'Total Shareholders Equity')
+    _CAPEX_KEYS = ('Capital Expenditure', 'CapitalExpenditure',
+                   'Capital Expenditures', 'Purchase Of Property Plant And Equipment')
+    _REPURCHASE_KEYS = ('Purchase Of Common Stock', 'Common Stock Repurchased',
+                        'Repurchase Of Common Stock', 'Stock Repurchase')
+    _ISSUANCE_KEYS = ('Sale Of Common Stock', 'Common Stock Issued', 'Issuance Of Common Stock')
+    
     def __init__(self, ticker_symbol: str):
         """
         Args:
@@ -64,8 +481,61 @@ class StockDataManager:
         self.ticker_symbol = ticker_symbol.upper()
         
         # 최신 yfinance는 자체적으로 세션을 관리하므로 session 파라미터 제거
-        # Ticker 객체 초기화
-        self.ticker = yf.Ticker(self.ticker_symbol)
+        # Ticker 객체 초기화 (같은 티커의 인스턴스끼리 공유)
+        self.ticker = _get_ticker(self.ticker_symbol)
+    
+    def _get_history(self, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """
+        주가 데이터 조회 (티커/기간별 캐시 공유)
+        
+        호출 측에서 컬럼을 추가하므로 캐시 원본과 분리된 프레임 반환
+        (컬럼 목록 선택은 Copy-on-Write 설정과 관계없이 항상 새 프레임)
+        
+        배당/분할(actions)과 장전/장후 데이터는 요청하지 않고 OHLCV 컬럼만 유지
+        """
+        endpoint = f'history_{period}_{interval}'
+        # get_technicals / get_news_context가 병렬 실행되어도 _cached_fetch의 키별 잠금으로 1회만 요청
+        hist = _cached_fetch(
+            self.ticker_symbol, endpoint, HISTORY_CACHE_TTL,
+            lambda: _parquet_cached_frame(
+                self.ticker_symbol, endpoint, HISTORY_FILE_TTL,
+                lambda: _compact_history(_request_with_retry(lambda: self.ticker.history(
+                    period=period, interval=interval, actions=False, prepost=False
+                )))
+            )
+        )
+        return hist[list(hist.columns)]
+    
+    def _get_info(self) -> Dict[str, Any]:
+        """
+        ticker.info 조회 (TTL 동안 get_profile 등 메서드 간 공유)
+        
+        인스턴스에 따로 보관하지 않고 응답 캐시의 TTL을 따르므로 빈 응답도 EMPTY_RESPONSE_TTL 후 재조회
+        """
+        return _cached_fetch(
+            self.ticker_symbol, 'info', INFO_CACHE_TTL,
+            lambda: _json_cached_response(
+                self.ticker_symbol, 'info', INFO_FILE_TTL, lambda: _request_with_retry(lambda: self.ticker.info)
+            )
+        ) or {}
+
+    def _get_market_cap(self) -> Optional[float]:
+        """공유된 ticker.info의 시가총액 (조회 실패 시 None)"""
+        try:
+            return self._get_info().get('marketCap')
+        except Exception:
+            return None
+    
+    def _get_statement(self, name: str) -> Optional[pd.DataFrame]:
+        """재무제표 조회 (예: 'income_stmt', 'quarterly_cashflow') - 티커별 메모리 + 디스크 캐시"""
+        file_ttl = QUARTERLY_STATEMENT_FILE_TTL if name.startswith('quarterly_') else ANNUAL_STATEMENT_FILE_TTL
+        return _cached_fetch(
+            self.ticker_symbol, name, STATEMENT_CACHE_TTL,
+            lambda: _parquet_cached_frame(
+                self.ticker_symbol, name, file_ttl, lambda: _request_with_retry(lambda: getattr(self.ticker, name)),
+                transpose=True
+            )
+        )
     
     def get_profile(self) -> Dict[str, Any]:
         """
@@ -76,7 +546,7 @@ class StockDataManager:
                            longName, currentPrice, previousClose 등
         """
         try:
-            info = self.ticker.info
+            info = self._get_info()
             
             if not info or len(info) == 0:
                 return self._empty_profile()
@@ -97,16 +567,11 @@ class StockDataManager:
                 'forwardPE': safe_get_numeric(info, 'forwardPE'),  # Forward PER (Price to Earnings Ratio)
             }
             
-            # Change % 계산
-            if profile['currentPrice'] != 'N/A' and profile['previousClose'] != 'N/A':
-                try:
-                    change_pct = ((profile['currentPrice'] - profile['previousClose']) 
-                                 / profile['previousClose']) * 100
-                    profile['changePercent'] = round(change_pct, 2)
-                except (TypeError, ZeroDivisionError):
-                    profile['changePercent'] = 'N/A'
-            else:
-                profile['changePercent'] = 'N/A'
+            # Change % 계산 (결측/비숫자는 NaN으로 계산하고 결과가 유한하지 않을 때만 'N/A')
+            current_price = _as_float(info.get('currentPrice'))
+            previous_close = _as_float(info.get('previousClose'))
+            change_pct = (current_price - previous_close) / previous_close * 100 if previous_close else np.nan
+            profile['changePercent'] = round(change_pct, 2) if np.isfinite(change_pct) else 'N/A'
             
             return profile
             
@@ -130,15 +595,24 @@ class StockDataManager:
             - derived_metrics: 5가지 파생 지표
         """
         try:
-            # 원본 재무제표 데이터 수집 (연간)
-            income_stmt = self.ticker.income_stmt
-            balance_sheet = self.ticker.balance_sheet
-            cashflow = self.ticker.cashflow
-            
-            # 쿼터별 재무제표 데이터 수집
-            quarterly_income_stmt = self.ticker.quarterly_income_stmt
-            quarterly_balance_sheet = self.ticker.quarterly_balance_sheet
-            quarterly_cashflow = self.ticker.quarterly_cashflow
+            # 원본 재무제표 데이터 수집 (연간 + 쿼터별 6건은 서로 독립적인 요청이므로 병렬 조회)
+            statement_names = (
+                'income_stmt', 'balance_sheet', 'cashflow',
+                'quarterly_income_stmt', 'quarterly_balance_sheet', 'quarterly_cashflow'
+            )
+            with ThreadPoolExecutor(max_workers=len(statement_names)) as executor:
+                futures = [executor.submit(self._get_statement, name) for name in statement_names]
+                # 한 엔드포인트 실패가 나머지 결과를 버리지 않도록 개별적으로 None 처리
+                (income_stmt, balance_sheet, cashflow,
+                 quarterly_income_stmt, quarterly_balance_sheet, quarterly_cashflow) = [
+                    safe_execute(
+                        future.result,
+                        None,
+                        f"Error fetching {name} for {self.ticker_symbol}",
+                        log_error=True
+                    )
+                    for name, future in zip(statement_names, futures)
+                ]
             
             # 데이터 유효성 검사
             if (income_stmt is None or income_stmt.empty or 
@@ -146,32 +620,15 @@ class StockDataManager:
                 cashflow is None or cashflow.empty):
                 return self._empty_financials()
             
-            # 최근 3년 데이터만 추출 (열이 날짜이므로)
-            income_stmt_3yr = income_stmt.iloc[:, :3] if income_stmt.shape[1] >= 3 else income_stmt
-            balance_sheet_3yr = balance_sheet.iloc[:, :3] if balance_sheet.shape[1] >= 3 else balance_sheet
-            cashflow_3yr = cashflow.iloc[:, :3] if cashflow.shape[1] >= 3 else cashflow
-            
-            # Transpose하여 날짜를 행(Index)으로 변환 (시계열 분석 용이)
-            income_stmt_transposed = income_stmt_3yr.T
-            balance_sheet_transposed = balance_sheet_3yr.T
-            cashflow_transposed = cashflow_3yr.T
+            # 최근 3년(연간) / 12쿼터(분기)만 잘라 날짜를 행(Index)으로 변환
+            # (UI 표시용 raw_data와 파생 지표 계산이 같은 프레임을 공유하므로 프레임당 1회만 변환)
+            income_stmt_transposed = _recent_periods(income_stmt, 3)
+            balance_sheet_transposed = _recent_periods(balance_sheet, 3)
+            cashflow_transposed = _recent_periods(cashflow, 3)
             
-            # 쿼터별 데이터 처리 (최근 12쿼터 = 3년)
-            quarterly_income_transposed = pd.DataFrame()
-            quarterly_balance_transposed = pd.DataFrame()
-            quarterly_cashflow_transposed = pd.DataFrame()
-            
-            if quarterly_income_stmt is not None and not quarterly_income_stmt.empty:
-                quarterly_income_12q = quarterly_income_stmt.iloc[:, :12] if quarterly_income_stmt.shape[1] >= 12 else quarterly_income_stmt
-                quarterly_income_transposed = quarterly_income_12q.T
-            
-            if quarterly_balance_sheet is not None and not quarterly_balance_sheet.empty:
-                quarterly_balance_12q = quarterly_balance_sheet.iloc[:, :12] if quarterly_balance_sheet.shape[1] >= 12 else quarterly_balance_sheet
-                quarterly_balance_transposed = quarterly_balance_12q.T
-            
-            if quarterly_cashflow is not None and not quarterly_cashflow.empty:
-                quarterly_cashflow_12q = quarterly_cashflow.iloc[:, :12] if quarterly_cashflow.shape[1] >= 12 else quarterly_cashflow
-                quarterly_cashflow_transposed = quarterly_cashflow_12q.T
+            quarterly_income_transposed = _recent_periods(quarterly_income_stmt, 12)
+            quarterly_balance_transposed = _recent_periods(quarterly_balance_sheet, 12)
+            quarterly_cashflow_transposed = _recent_periods(quarterly_cashflow, 12)
             
             # 파생 지표 계산 (연간 데이터 기준 - 시계열 포함)
             derived_metrics_annual = self._calculate_derived_metrics_with_trend(
@@ -219,23 +676,14 @@ class StockDataManager:
             }
             
         except Exception as e:
+            empty = self._empty_financials()
             return safe_execute(
-                lambda: self._empty_financials(),
-                self._empty_financials(),
+                lambda: empty,
+                empty,
                 f"Error in get_financials for {self.ticker_symbol}",
                 log_error=True
             )
     
-    def _calculate_derived_metrics(self, income_stmt: pd.DataFrame, 
-                                   balance_sheet: pd.DataFrame, 
-                                   cashflow: pd.DataFrame) -> Dict[str, Any]:
-        """
-        PRD에 명시된 5가지 파생 지표 계산 (기존 방식 - 호환성 유지)
-        """
-        return self._calculate_derived_metrics_with_trend(
-            income_stmt, balance_sheet, cashflow, period_type='annual'
-        )
-    
     def _calculate_derived_metrics_with_trend(self, income_stmt: pd.DataFrame, 
                                              balance_sheet: pd.DataFrame, 
                                              cashflow: pd.DataFrame,
@@ -251,7 +699,26 @@ class StockDataManager:
         
         Args:
             period_type: 'annual' or 'quarterly'
+        
+        같은 재무제표(내용 기준)와 시가총액이면 이전 계산 결과를 재사용
         """
+        try:
+            market_cap = self._get_market_cap()
+            cache_key = (
+                self.ticker_symbol, period_type, market_cap,
+                _frame_signature(income_stmt), _frame_signature(balance_sheet), _frame_signature(cashflow)
+            )
+        except Exception:
+            # 숫자로 변환할 수 없는 값이 있으면 캐시 없이 계산
+            cache_key = None
+        
+        if cache_key is not None:
+            with _metrics_cache_lock:
+                cached = _metrics_cache.get(cache_key)
+                if cached is not None:
+                    _metrics_cache.move_to_end(cache_key)
+                    return cached
+        
         metrics = {}
         
         # 1. Quality of Earnings: OCF / Net Income (시계열 포함)
@@ -287,6 +754,11 @@ class StockDataManager:
             cashflow, balance_sheet, period_type
         )
         
+        if cache_key is not None:
+            with _metrics_cache_lock:
+                _metrics_cache[cache_key] = metrics
+                if len(_metrics_cache) > METRICS_CACHE_SIZE:
+                    _metrics_cache.popitem(last=False)
         return metrics
     
     def _get_quarterly_data_status(self, quarterly_income: pd.DataFrame,
@@ -342,87 +814,6 @@ class StockDataManager:
         
         return status
     
-    def _calculate_quality_of_earnings(self, cashflow: pd.DataFrame, 
-                                       income_stmt: pd.DataFrame) -> Dict[str, Any]:
-        """OCF / Net Income 계산"""
-        try:
-            # 최신 연도 데이터 (첫 번째 행)
-            latest_year = cashflow.index[0] if len(cashflow) > 0 else None
-            
-            if latest_year is None:
-                return {'latest': 'N/A', 'trend': 'N/A', 'warning': False}
-            
-            # Operating Cash Flow 찾기 (다양한 키 이름 대응)
-            ocf_keys = ['Operating Cash Flow', 'Total Cash From Operating Activities', 
-                       'OperatingCashFlow', 'Cash from Operating Activities']
-            ocf = None
-            for key in ocf_keys:
-                if key in cashflow.columns:
-                    ocf = cashflow.loc[latest_year, key]
-                    break
-            
-            # Net Income 찾기
-            ni_keys = ['Net Income', 'NetIncome', 'Net Income Common Stockholders']
-            net_income = None
-            for key in ni_keys:
-                if key in income_stmt.columns:
-                    net_income = income_stmt.loc[latest_year, key]
-                    break
-            
-            if ocf is None or net_income is None:
-                return {'latest': 'N/A', 'trend': 'N/A', 'warning': False}
-            
-            # NaN 또는 0 체크
-            # 안전한 나눗셈 사용
-            ratio = safe_divide(ocf, net_income, default='N/A')
-            if ratio == 'N/A':
-                return {'latest': 'N/A', 'trend': 'N/A', 'warning': False}
-            warning = ratio < 1.0  # 1.0 미만 시 Warning
-            
-            # 추세 계산 (3년 데이터가 있는 경우)
-            trend = 'N/A'
-            if len(cashflow) >= 2 and len(income_stmt) >= 2:
-                try:
-                    prev_year = cashflow.index[1]
-                    prev_ocf = None
-                    prev_ni = None
-                    
-                    for key in ocf_keys:
-                        if key in cashflow.columns:
-                            prev_ocf = cashflow.loc[prev_year, key]
-                            break
-                    for key in ni_keys:
-                        if key in income_stmt.columns:
-                            prev_ni = income_stmt.loc[prev_year, key]
-                            break
-                    
-                    if (prev_ocf is not None and prev_ni is not None and 
-                        not pd.isna(prev_ocf) and not pd.isna(prev_ni)):
-                        prev_ratio = safe_divide(prev_ocf, prev_ni, default='N/A')
-                        if prev_ratio != 'N/A' and isinstance(ratio, (int, float)):
-                            if ratio > prev_ratio:
-                                trend = 'Improving'
-                            elif ratio < prev_ratio:
-                                trend = 'Declining'
-                            else:
-                                trend = 'Stable'
-                except Exception:
-                    pass
-            
-            return {
-                'latest': round(ratio, 2),
-                'trend': trend,
-                'warning': warning
-            }
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'trend': 'N/A', 'warning': False},
-                {'latest': 'N/A', 'trend': 'N/A', 'warning': False},
-                "Error calculating quality of earnings",
-                log_error=True
-            )
-    
     def _calculate_quality_of_earnings_with_trend(self, cashflow: pd.DataFrame, 
                                                    income_stmt: pd.DataFrame,
                                                    period_type: str = 'annual') -> Dict[str, Any]:
@@ -431,60 +822,27 @@ class StockDataManager:
             if len(cashflow) == 0 or len(income_stmt) == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'warning': False, 'time_series': []}
             
-            ocf_keys = ['Operating Cash Flow', 'Total Cash From Operating Activities', 
-                       'OperatingCashFlow', 'Cash from Operating Activities']
-            ni_keys = ['Net Income', 'NetIncome', 'Net Income Common Stockholders']
-            
-            time_series = []
-            ratios = []
-            dates = []
+            # 후보 컬럼은 한 번만 찾고, 모든 기간의 비율을 배열 연산 1회로 계산
+            ocf_col = _find_column(cashflow, self._OCF_KEYS)
+            ni_col = _find_column(income_stmt, self._NET_INCOME_KEYS)
+            if ocf_col is None or ni_col is None:
+                return {'latest': 'N/A', 'trend': 'N/A', 'warning': False, 'time_series': []}
+            dates, ocf_values, ni_values, ratios = _period_ratios(ocf_col, ni_col)
             
-            # 모든 기간에 대해 계산
-            for date_idx in cashflow.index:
-                ocf = None
-                net_income = None
-                
-                for key in ocf_keys:
-                    if key in cashflow.columns:
-                        ocf = cashflow.loc[date_idx, key]
-                        break
-                
-                for key in ni_keys:
-                    if key in income_stmt.columns:
-                        net_income = income_stmt.loc[date_idx, key]
-                        break
-                
-                if ocf is not None and net_income is not None:
-                    ratio = safe_divide(ocf, net_income, default='N/A')
-                    if ratio != 'N/A':
-                        ratios.append(ratio)
-                        dates.append(str(date_idx))
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(ratio, 2),
-                            'ocf': float(ocf) if pd.notna(ocf) else None,
-                            'net_income': float(net_income) if pd.notna(net_income) else None
-                        })
-            
-            if not ratios:
+            if ratios.size == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'warning': False, 'time_series': []}
             
-            latest = round(ratios[0], 2)
-            warning = latest < 1.0
+            time_series = [
+                {'date': str(date_idx), 'value': round(ratio, 2), 'ocf': ocf, 'net_income': net_income}
+                for date_idx, ocf, net_income, ratio in zip(dates, ocf_values, ni_values, ratios.tolist())
+            ]
             
-            # 추세 계산
-            trend = 'N/A'
-            if len(ratios) >= 2:
-                if ratios[0] > ratios[1]:
-                    trend = 'Improving'
-                elif ratios[0] < ratios[1]:
-                    trend = 'Declining'
-                else:
-                    trend = 'Stable'
+            latest = round(float(ratios[0]), 2)
+            warning = latest < 1.0
             
             return {
                 'latest': latest,
-                'trend': trend,
+                'trend': _trend_label(ratios),
                 'warning': warning,
                 'time_series': time_series
             }
@@ -497,323 +855,6 @@ class StockDataManager:
                 log_error=True
             )
     
-    def _calculate_receivables_turnover(self, income_stmt: pd.DataFrame, 
-                                       balance_sheet: pd.DataFrame) -> Dict[str, Any]:
-        """Receivables Turnover = Revenue / Receivables"""
-        try:
-            latest_year = income_stmt.index[0] if len(income_stmt) > 0 else None
-            if latest_year is None:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # Revenue 찾기
-            revenue_keys = ['Total Revenue', 'Revenue', 'Revenues', 'Net Sales']
-            revenue = None
-            for key in revenue_keys:
-                if key in income_stmt.columns:
-                    revenue = income_stmt.loc[latest_year, key]
-                    break
-            
-            # Receivables 찾기
-            receivables_keys = ['Receivables', 'Accounts Receivable', 
-                              'Net Receivables', 'AccountsReceivable']
-            receivables = None
-            for key in receivables_keys:
-                if key in balance_sheet.columns:
-                    receivables = balance_sheet.loc[latest_year, key]
-                    break
-            
-            if revenue is None or receivables is None:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # 안전한 나눗셈 사용
-            turnover = safe_divide(revenue, receivables, default='N/A')
-            if turnover == 'N/A':
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # 추세 계산
-            trend = 'N/A'
-            if len(income_stmt) >= 2 and len(balance_sheet) >= 2:
-                try:
-                    prev_year = income_stmt.index[1]
-                    prev_revenue = None
-                    prev_receivables = None
-                    
-                    for key in revenue_keys:
-                        if key in income_stmt.columns:
-                            prev_revenue = income_stmt.loc[prev_year, key]
-                            break
-                    for key in receivables_keys:
-                        if key in balance_sheet.columns:
-                            prev_receivables = balance_sheet.loc[prev_year, key]
-                            break
-                    
-                    if (prev_revenue is not None and prev_receivables is not None and
-                        not pd.isna(prev_revenue) and not pd.isna(prev_receivables)):
-                        prev_turnover = safe_divide(prev_revenue, prev_receivables, default='N/A')
-                        if prev_turnover != 'N/A' and isinstance(turnover, (int, float)):
-                            if turnover > prev_turnover:
-                                trend = 'Improving'
-                            elif turnover < prev_turnover:
-                                trend = 'Declining'
-                            else:
-                                trend = 'Stable'
-                except Exception:
-                    pass
-            
-            return {
-                'latest': round(turnover, 2),
-                'trend': trend
-            }
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'trend': 'N/A'},
-                {'latest': 'N/A', 'trend': 'N/A'},
-                "Error calculating receivables turnover",
-                log_error=True
-            )
-    
-    def _calculate_inventory_turnover(self, income_stmt: pd.DataFrame, 
-                                      balance_sheet: pd.DataFrame) -> Dict[str, Any]:
-        """Inventory Turnover = COGS / Inventory"""
-        try:
-            latest_year = income_stmt.index[0] if len(income_stmt) > 0 else None
-            if latest_year is None:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # COGS 찾기
-            cogs_keys = ['Cost Of Goods Sold', 'Cost of Revenue', 'COGS', 
-                        'CostOfGoodsSold', 'Cost of Goods Sold']
-            cogs = None
-            for key in cogs_keys:
-                if key in income_stmt.columns:
-                    cogs = income_stmt.loc[latest_year, key]
-                    break
-            
-            # Inventory 찾기
-            inventory_keys = ['Inventory', 'Inventories', 'Total Inventory']
-            inventory = None
-            for key in inventory_keys:
-                if key in balance_sheet.columns:
-                    inventory = balance_sheet.loc[latest_year, key]
-                    break
-            
-            if cogs is None or inventory is None:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # 안전한 나눗셈 사용
-            turnover = safe_divide(cogs, inventory, default='N/A')
-            if turnover == 'N/A':
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # 추세 계산
-            trend = 'N/A'
-            if len(income_stmt) >= 2 and len(balance_sheet) >= 2:
-                try:
-                    prev_year = income_stmt.index[1]
-                    prev_cogs = None
-                    prev_inventory = None
-                    
-                    for key in cogs_keys:
-                        if key in income_stmt.columns:
-                            prev_cogs = income_stmt.loc[prev_year, key]
-                            break
-                    for key in inventory_keys:
-                        if key in balance_sheet.columns:
-                            prev_inventory = balance_sheet.loc[prev_year, key]
-                            break
-                    
-                    if (prev_cogs is not None and prev_inventory is not None and
-                        not pd.isna(prev_cogs) and not pd.isna(prev_inventory)):
-                        prev_turnover = safe_divide(prev_cogs, prev_inventory, default='N/A')
-                        if prev_turnover != 'N/A' and isinstance(turnover, (int, float)):
-                            if turnover > prev_turnover:
-                                trend = 'Improving'
-                            elif turnover < prev_turnover:
-                                trend = 'Declining'
-                            else:
-                                trend = 'Stable'
-                except Exception:
-                    pass
-            
-            return {
-                'latest': round(turnover, 2),
-                'trend': trend
-            }
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'trend': 'N/A'},
-                {'latest': 'N/A', 'trend': 'N/A'},
-                "Error calculating inventory turnover",
-                log_error=True
-            )
-    
-    def _calculate_interest_coverage(self, income_stmt: pd.DataFrame) -> Dict[str, Any]:
-        """Interest Coverage Ratio = EBIT / Interest Expense"""
-        try:
-            latest_year = income_stmt.index[0] if len(income_stmt) > 0 else None
-            if latest_year is None:
-                return {'latest': 'N/A', 'status': 'N/A'}
-            
-            # EBIT 찾기
-            ebit_keys = ['EBIT', 'Earnings Before Interest And Taxes', 
-                        'Operating Income', 'Income Before Tax']
-            ebit = None
-            for key in ebit_keys:
-                if key in income_stmt.columns:
-                    ebit = income_stmt.loc[latest_year, key]
-                    break
-            
-            # Interest Expense 찾기
-            interest_keys = ['Interest Expense', 'InterestExpense', 
-                           'Total Interest Expense', 'Interest And Debt Expense']
-            interest_expense = None
-            for key in interest_keys:
-                if key in income_stmt.columns:
-                    interest_expense = income_stmt.loc[latest_year, key]
-                    break
-            
-            if ebit is None or interest_expense is None:
-                return {'latest': 'N/A', 'status': 'N/A'}
-            
-            # 안전한 나눗셈 사용 (Interest Expense는 음수일 수 있으므로 절댓값 사용)
-            ratio = safe_divide(ebit, abs(interest_expense) if interest_expense != 0 else 0, default='N/A')
-            if ratio == 'N/A':
-                return {'latest': 'N/A', 'status': 'N/A'}
-            
-            # 상태 판단 (5.0 이상이면 안정적)
-            status = 'Strong' if ratio >= 5.0 else 'Weak' if ratio >= 1.0 else 'Critical'
-            
-            return {
-                'latest': round(ratio, 2),
-                'status': status
-            }
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'status': 'N/A'},
-                {'latest': 'N/A', 'status': 'N/A'},
-                "Error calculating interest coverage",
-                log_error=True
-            )
-    
-    def _calculate_capex_growth(self, cashflow: pd.DataFrame) -> Dict[str, Any]:
-        """CapEx Growth 계산 (연간 성장률)"""
-        try:
-            if len(cashflow) < 2:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # Capital Expenditure 찾기
-            capex_keys = ['Capital Expenditure', 'CapitalExpenditure', 
-                         'Capital Expenditures', 'Purchase Of Property Plant And Equipment']
-            capex_latest = None
-            capex_prev = None
-            
-            latest_year = cashflow.index[0]
-            prev_year = cashflow.index[1]
-            
-            for key in capex_keys:
-                if key in cashflow.columns:
-                    capex_latest = cashflow.loc[latest_year, key]
-                    capex_prev = cashflow.loc[prev_year, key]
-                    break
-            
-            if capex_latest is None or capex_prev is None:
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            # CapEx는 일반적으로 음수로 표시됨 (지출이므로)
-            capex_latest = abs(capex_latest)
-            capex_prev = abs(capex_prev)
-            
-            # 안전한 나눗셈 사용
-            growth_rate = safe_divide(
-                (capex_latest - capex_prev) * 100,
-                capex_prev,
-                default='N/A'
-            )
-            if growth_rate == 'N/A':
-                return {'latest': 'N/A', 'trend': 'N/A'}
-            
-            trend = 'Expanding' if growth_rate > 0 else 'Contracting' if growth_rate < 0 else 'Stable'
-            
-            return {
-                'latest': round(growth_rate, 2),
-                'trend': trend
-            }
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'trend': 'N/A'},
-                {'latest': 'N/A', 'trend': 'N/A'},
-                "Error calculating capex growth",
-                log_error=True
-            )
-    
-    def _calculate_net_buyback_yield(self, cashflow: pd.DataFrame, 
-                                     balance_sheet: pd.DataFrame) -> Dict[str, Any]:
-        """Net Buyback Yield = (Repurchase - Issuance) / Market Cap"""
-        try:
-            latest_year = cashflow.index[0] if len(cashflow) > 0 else None
-            if latest_year is None:
-                return {'latest': 'N/A', 'status': 'N/A'}
-            
-            # Stock Repurchase 찾기
-            repurchase_keys = ['Purchase Of Common Stock', 'Common Stock Repurchased', 
-                             'Repurchase Of Common Stock', 'Stock Repurchase']
-            repurchase = None
-            for key in repurchase_keys:
-                if key in cashflow.columns:
-                    repurchase = cashflow.loc[latest_year, key]
-                    break
-            
-            # Stock Issuance 찾기
-            issuance_keys = ['Sale Of Common Stock', 'Common Stock Issued', 
-                           'Issuance Of Common Stock']
-            issuance = None
-            for key in issuance_keys:
-                if key in cashflow.columns:
-                    issuance = cashflow.loc[latest_year, key]
-                    break
-            
-            # Market Cap은 profile에서 가져와야 하지만, 여기서는 간단히 처리
-            # 실제로는 get_profile()에서 가져온 marketCap을 사용하는 것이 좋음
-            net_buyback = 0
-            if repurchase is not None and not pd.isna(repurchase):
-                net_buyback += abs(repurchase)  # Repurchase는 음수일 수 있음
-            if issuance is not None and not pd.isna(issuance):
-                net_buyback -= abs(issuance)  # Issuance는 양수일 수 있음
-            
-            # Market Cap 가져오기
-            try:
-                info = self.ticker.info
-                market_cap = info.get('marketCap', None)
-                
-                # 안전한 나눗셈 사용
-                yield_pct = safe_divide(
-                    net_buyback * 100,
-                    market_cap,
-                    default='N/A'
-                )
-                if yield_pct == 'N/A':
-                    return {'latest': 'N/A', 'status': 'N/A'}
-                status = 'Positive' if net_buyback > 0 else 'Negative' if net_buyback < 0 else 'Neutral'
-                
-                return {
-                    'latest': round(yield_pct, 4),  # 소수점 4자리 (퍼센트)
-                    'status': status
-                }
-            except Exception:
-                return {'latest': 'N/A', 'status': 'N/A'}
-            
-        except Exception as e:
-            return safe_execute(
-                lambda: {'latest': 'N/A', 'status': 'N/A'},
-                {'latest': 'N/A', 'status': 'N/A'},
-                "Error calculating net buyback yield",
-                log_error=True
-            )
-    
     def get_technicals(self) -> Dict[str, Any]:
         """
         기술적 지표 계산
@@ -822,8 +863,13 @@ class StockDataManager:
             Dict containing: RSI, TRIX, MA lines, Volume ratio, Earnings D-Day
         """
         try:
-            # 주가 데이터 수집 (최소 1년, 기술적 지표 계산을 위해 충분한 기간 필요)
-            hist = self.ticker.history(period="1y", interval="1d")
+            # 실적 발표일 조회는 주가 데이터와 독립적이므로 백그라운드에서 먼저 시작
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                earnings_future = executor.submit(self._get_earnings_d_day)
+                
+                # 주가 데이터 수집 (최소 1년, 기술적 지표 계산을 위해 충분한 기간 필요)
+                hist = self._get_history(period="1y", interval="1d")
+                earnings_info = earnings_future.result()
             
             if hist.empty:
                 return {
@@ -848,22 +894,13 @@ class StockDataManager:
                 hist['MA_120'] = ta.sma(hist['Close'], length=120)
             else:
                 # pandas-ta 없이 직접 계산
-                # RSI(14) 계산
-                hist['RSI'] = self._calculate_rsi(hist['Close'], period=14)
-                
-                # TRIX(30) 계산
-                trix_result = self._calculate_trix(hist['Close'], period=30)
-                hist['TRIX'] = trix_result['trix']
-                hist['TRIX_Signal'] = trix_result['signal']
-                
-                # 이동평균선 (SMA)
-                hist['MA_20'] = hist['Close'].rolling(window=20, min_periods=1).mean()
-                hist['MA_60'] = hist['Close'].rolling(window=60, min_periods=1).mean()
-                hist['MA_120'] = hist['Close'].rolling(window=120, min_periods=1).mean()
+                # 차트와 같은 지표 커널 사용 (numba 설치 시 종가 1회 순회, 아니면 pandas 계산)
+                hist = hist.assign(**compute_technicals(hist['Close'], hist['Volume']))
             
             # 거래량 비율 (20일 평균 대비 현재 거래량)
-            hist['Volume_MA20'] = hist['Volume'].rolling(window=20, min_periods=1).mean()
-            hist['Volume_Ratio'] = hist['Volume'] / hist['Volume_MA20']
+            if 'Volume_Ratio' not in hist.columns:
+                hist['Volume_MA20'] = rolling_mean(hist['Volume'], 20, min_periods=1)
+                hist['Volume_Ratio'] = hist['Volume'] / hist['Volume_MA20']
             
             # 현재 값 추출 (최신 데이터)
             current_rsi = safe_get_latest(hist['RSI'])
@@ -878,9 +915,6 @@ class StockDataManager:
             
             volume_ratio = safe_get_latest(hist['Volume_Ratio'])
             
-            # Earnings D-Day 계산
-            earnings_info = self._get_earnings_d_day()
-            
             return {
                 'price_data': hist,
                 'current_rsi': current_rsi,
@@ -903,7 +937,11 @@ class StockDataManager:
     def _get_earnings_d_day(self) -> Dict[str, Any]:
         """다음 실적 발표일까지 남은 일수 계산"""
         try:
-            calendar = self.ticker.calendar
+            # 다른 yfinance 요청과 같이 속도 제한/재시도를 거치고 info와 같은 TTL로 캐시
+            calendar = _cached_fetch(
+                self.ticker_symbol, 'calendar', INFO_CACHE_TTL,
+                lambda: _request_with_retry(lambda: self.ticker.calendar)
+            )
             
             # calendar가 None이거나 빈 dict인 경우
             if calendar is None:
@@ -932,36 +970,38 @@ class StockDataManager:
                     return {'date': None, 'd_day': None}
                 # 'Earnings Date' 컬럼이 있는 경우
                 if 'Earnings Date' in calendar.columns:
-                    earnings_date = calendar['Earnings Date'].iloc[0]
+                    earnings_date = calendar['Earnings Date'].iat[0]
                 # 첫 번째 행의 첫 번째 값이 날짜인 경우
                 elif len(calendar) > 0 and len(calendar.columns) > 0:
-                    first_value = calendar.iloc[0, 0]
+                    first_value = calendar.iat[0, 0]
                     earnings_date = first_value
             
             if earnings_date is None:
                 return {'date': None, 'd_day': None}
             
-            # D-Day 계산
-            today = pd.Timestamp.now()
-            
-            # datetime.date를 pd.Timestamp로 변환
-            if isinstance(earnings_date, date):
-                earnings_date = pd.Timestamp(earnings_date)
-            elif isinstance(earnings_date, str):
-                try:
-                    earnings_date = pd.Timestamp(earnings_date)
-                except Exception:
-                    return {'date': None, 'd_day': None}
-            elif not isinstance(earnings_date, pd.Timestamp):
+            # D-Day 계산 (Timestamp 생성 없이 date 단위로 비교)
+            if isinstance(earnings_date, datetime):
+                # pd.Timestamp도 datetime의 하위 클래스
+                earnings_day = earnings_date.date()
+            elif isinstance(earnings_date, date):
+                earnings_day = earnings_date
+            else:
+                # 문자열/np.datetime64는 numpy의 일 단위 변환으로 처리 (Timestamp 할당 없음)
                 try:
-                    earnings_date = pd.Timestamp(earnings_date)
-                except Exception:
+                    earnings_day = np.datetime64(earnings_date, 'D').astype(date)
+                except (ValueError, TypeError):
+                    try:
+                        earnings_day = pd.Timestamp(earnings_date).date()
+                    except Exception:
+                        return {'date': None, 'd_day': None}
+                if not isinstance(earnings_day, date):
+                    # NaT는 None으로 변환됨
                     return {'date': None, 'd_day': None}
-            
-            d_day = (earnings_date - today).days
+
+            d_day = (earnings_day - date.today()).days
             
             return {
-                'date': earnings_date.strftime('%Y-%m-%d') if isinstance(earnings_date, pd.Timestamp) else str(earnings_date),
+                'date': earnings_day.strftime('%Y-%m-%d'),
                 'd_day': d_day
             }
             
@@ -983,11 +1023,16 @@ class StockDataManager:
             - historical_events: 과거 변동성 높은 날짜별 뉴스 검색 결과
         """
         try:
-            # 1. Recent News: 최신 10개 뉴스
-            recent_news = self._get_recent_news()
-            
-            # 2. Historical Context: 변동성 높은 날짜의 뉴스 검색
-            historical_events = self._get_historical_news_context()
+            # 두 조회는 서로 독립적인 네트워크 I/O이므로 동시에 실행
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # 1. Recent News: 최신 10개 뉴스
+                recent_future = executor.submit(self._get_recent_news)
+                
+                # 2. Historical Context: 변동성 높은 날짜의 뉴스 검색
+                historical_future = executor.submit(self._get_historical_news_context)
+                
+                recent_news = recent_future.result()
+                historical_events = historical_future.result()
             
             return {
                 'recent_news': recent_news,
@@ -1005,7 +1050,12 @@ class StockDataManager:
     def _get_recent_news(self) -> list:
         """최신 10개 뉴스 수집"""
         try:
-            news_list = self.ticker.news
+            news_list = _cached_fetch(
+                self.ticker_symbol, 'news', NEWS_CACHE_TTL,
+                lambda: _json_cached_response(
+                    self.ticker_symbol, 'news', NEWS_FILE_TTL, lambda: _request_with_retry(lambda: self.ticker.news)
+                )
+            )
             
             if not news_list or len(news_list) == 0:
                 return []
@@ -1037,21 +1087,27 @@ class StockDataManager:
                         'summary': summary
                     }
                     
-                    # publishTime을 읽기 쉬운 형식으로 변환 (ISO 형식인 경우)
-                    if news_item['publishTime'] != 'N/A':
-                        try:
-                            # ISO 형식 문자열을 파싱
-                            if 'T' in str(news_item['publishTime']):
-                                dt = datetime.fromisoformat(str(news_item['publishTime']).replace('Z', '+00:00'))
-                                news_item['publishTime'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            pass
-                    
                     recent_news.append(news_item)
                 except Exception as e:
                     # 개별 뉴스 항목 처리 실패는 무시하고 계속 진행
                     continue
             
+            # publishTime을 읽기 쉬운 형식으로 변환 (ISO 형식인 항목만 한 번에 파싱/포맷)
+            iso_positions = [
+                i for i, news_item in enumerate(recent_news)
+                if news_item['publishTime'] != 'N/A' and 'T' in str(news_item['publishTime'])
+            ]
+            if iso_positions:
+                parsed = pd.to_datetime(
+                    [str(recent_news[i]['publishTime']) for i in iso_positions],
+                    utc=True, errors='coerce', format='ISO8601'
+                )
+                formatted = parsed.strftime('%Y-%m-%d %H:%M:%S')
+                # 파싱 실패(NaT)한 항목은 원래 문자열 유지
+                for i, is_missing, text in zip(iso_positions, parsed.isna(), formatted):
+                    if not is_missing:
+                        recent_news[i]['publishTime'] = text
+            
             return recent_news
             
         except Exception as e:
@@ -1070,32 +1126,40 @@ class StockDataManager:
         """
         try:
             # 1. 최근 1년 주가 데이터 수집
-            hist = self.ticker.history(period="1y", interval="1d")
+            hist = self._get_history(period="1y", interval="1d")
             
             if hist.empty:
                 return []
             
-            # 2. 일일 변동률 계산 (절대값 기준)
-            hist['Change'] = hist['Close'] - hist['Open']
-            hist['Change%'] = ((hist['Close'] - hist['Open']) / hist['Open']) * 100
-            hist['AbsChange%'] = abs(hist['Change%'])
-            
-            # 3. 변동폭이 가장 큰 상위 5일 추출
-            top_5_volatile = hist.nlargest(5, 'AbsChange%')
+            # 2. 일일 변동률 계산 (절대값 기준, 중간 컬럼 없이 ndarray로 계산)
+            close = hist['Close'].to_numpy(dtype=np.float64)
+            open_ = hist['Open'].to_numpy(dtype=np.float64)
+            volume = hist['Volume'].to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change_pct = (close - open_) / open_ * 100.0
+            abs_change = np.abs(change_pct)
+            
+            # 3. 변동폭이 가장 큰 상위 5일 추출 (argpartition O(N) 선택 후 5개만 정렬, NaN 제외)
+            valid = np.flatnonzero(~np.isnan(abs_change))
+            k = min(5, valid.size)
+            if k == 0:
+                return []
+            top = valid[np.argpartition(abs_change[valid], -k)[-k:]]
+            top = top[np.argsort(-abs_change[top], kind='stable')]
             
-            historical_events = []
+            dates = hist.index[top]
+            date_strs = dates.strftime('%Y-%m-%d') if isinstance(dates, pd.DatetimeIndex) else dates.astype(str)
             
             # 4. 날짜와 변동률만 추출
-            for date, row in top_5_volatile.iterrows():
-                date_str = date.strftime('%Y-%m-%d') if isinstance(date, pd.Timestamp) else str(date)
-                change_pct = round(row['Change%'], 2)
-                
-                historical_events.append({
+            historical_events = [
+                {
                     'date': date_str,
-                    'change_pct': change_pct,
-                    'close_price': round(row['Close'], 2),
-                    'volume': int(row['Volume']) if not pd.isna(row['Volume']) else 'N/A'
-                })
+                    'change_pct': round(float(change_pct[i]), 2),
+                    'close_price': round(float(close[i]), 2),
+                    'volume': int(volume[i]) if not np.isnan(volume[i]) else 'N/A'
+                }
+                for date_str, i in zip(date_strs, top)
+            ]
             
             return historical_events
             
@@ -1107,222 +1171,8 @@ class StockDataManager:
                 log_error=True
             )
     
-    def _get_company_name(self) -> str:
-        """회사명 가져오기 (검색 쿼리 개선을 위해)"""
-        try:
-            info = self.ticker.info
-            if info:
-                # longName 또는 shortName 사용
-                company_name = info.get('longName') or info.get('shortName') or 'N/A'
-                return company_name
-            return 'N/A'
-        except:
-            return 'N/A'
-    
-    def _filter_english_relevant_news(self, search_results: List[Dict], ticker: str, company_name: str) -> List[Dict]:
-        """
-        영문 기사만 필터링하고 관련성 높은 뉴스만 선택
-        
-        Args:
-            search_results: duckduckgo_search 결과 리스트
-            ticker: 주식 티커 (예: 'AAPL')
-            company_name: 회사명 (예: 'Apple')
-        
-        Returns:
-            필터링된 결과 리스트
-        """
-        if not search_results:
-            return []
-        
-        filtered = []
-        ticker_upper = ticker.upper()
-        company_upper = company_name.upper() if company_name else ''
-        
-        # 제외할 키워드 (관련 없는 결과 필터링)
-        exclude_keywords = ['LOGIN', 'PASSWORD', 'DOWNLOAD', 'INSTALL', 'SIGN IN', 
-                           'ACCOUNT', 'RECOVER', 'COMMUNITY', 'SUPPORT', 'HELP',
-                           'SENHA', 'CONTA', 'CUENTA', 'アカウント', 'ログイン']
-        
-        for result in search_results:
-            title = result.get('title', '')
-            body = result.get('body', '')
-            href = result.get('href', '')
-            
-            # 1. 영문 기사인지 확인
-            if not self._is_english_text(title + ' ' + body):
-                continue
-            
-            # 2. 제외 키워드 확인
-            text_upper = (title + ' ' + body).upper()
-            if any(keyword in text_upper for keyword in exclude_keywords):
-                continue
-            
-            # 3. 티커나 회사명이 포함되어 있는지 확인
-            has_ticker = ticker_upper in title.upper() or ticker_upper in body.upper()
-            has_company = company_upper and (company_upper in title.upper() or company_upper in body.upper())
-            
-            # 4. 관련성 점수 계산
-            relevance_score = self._calculate_relevance_score(
-                title, body, href, ticker_upper, company_upper
-            )
-            
-            # 티커나 회사명이 있으면 추가 점수 부여
-            if has_ticker:
-                relevance_score += 5  # 티커 포함은 높은 가중치
-            if has_company:
-                relevance_score += 3  # 회사명 포함은 중간 가중치
-            
-            # 관련성 점수가 6 이상인 결과만 선택
-            # 티커/회사명이 있으면 우선, 없어도 금융 사이트에서 주식 관련 키워드가 있으면 허용
-            is_finance_site = any(site in href.lower() for site in ['yahoo.com', 'bloomberg.com', 'reuters.com', 'cnbc.com', 
-                                                                    'wsj.com', 'marketwatch.com', 'ft.com', 'forbes.com',
-                                                                    'seekingalpha.com', 'benzinga.com', 'thestreet.com', 
-                                                                    'investing.com', 'fool.com'])
-            has_stock_keyword = any(kw in (title + ' ' + body).upper() for kw in ['STOCK', 'SHARE', 'PRICE', 'EARNINGS', 'REVENUE', 'FINANCIAL', 'TRADING', 'MARKET'])
-            
-            # 티커나 회사명이 있으면 기준 완화, 금융 사이트면 추가 허용
-            if (has_ticker or has_company) and relevance_score >= 6:
-                pass  # 통과
-            elif is_finance_site and has_stock_keyword and relevance_score >= 7:
-                pass  # 통과
-            else:
-                continue  # 필터링
-                filtered.append({
-                    'title': title,
-                    'body': body[:200] if len(body) > 200 else body,  # 200자로 제한
-                    'href': href,
-                    'relevance_score': relevance_score
-                })
-        
-        # 관련성 점수 순으로 정렬
-        filtered.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        return filtered
-    
-    def _is_english_text(self, text: str) -> bool:
-        """
-        텍스트가 영문인지 확인
-        
-        한글, 일본어, 중국어 등이 포함되어 있으면 False 반환
-        """
-        if not text:
-            return False
-        
-        # 샘플링 (처음 200자만 확인)
-        sample = text[:200]
-        
-        # 비영문 문자 패턴 확인 (스웨덴어, 독일어 등 특수문자 포함)
-        non_english_patterns = ['å', 'ä', 'ö', 'Å', 'Ä', 'Ö', 'ü', 'Ü', 'é', 'É', 'ñ', 'Ñ', 'ç', 'Ç']
-        if any(pattern in sample for pattern in non_english_patterns):
-            # 스웨덴어 등 비영문 문자가 있으면 추가 검증
-            # 하지만 일부 금융 용어에는 포함될 수 있으므로 완전히 제외하지는 않음
-            pass
-        
-        # 영문 문자 비율 계산
-        english_chars = sum(1 for c in sample if c.isascii() and (c.isalpha() or c.isspace() or c in '.,;:!?\'"-()'))
-        total_chars = len([c for c in sample if c.isalnum() or c.isspace() or c in '.,;:!?\'"-()'])
-        
-        if total_chars == 0:
-            return False
-        
-        # 영문 비율이 90% 이상이면 영문으로 간주 (기준 상향: 85% -> 90%)
-        english_ratio = english_chars / total_chars if total_chars > 0 else 0
-        
-        # URL에 비영문 도메인이 있으면 제외
-        if 'svenskafans.com' in text.lower() or 'zhihu.com' in text.lower():
-            return False
-        
-        return english_ratio >= 0.90
-    
-    def _calculate_relevance_score(self, title: str, body: str, href: str, 
-                                   ticker: str, company_name: str) -> int:
-        """
-        검색 결과의 관련성 점수 계산
-        
-        점수가 높을수록 더 관련성 높은 뉴스
-        """
-        score = 0
-        text = (title + ' ' + body).upper()
-        
-        # 1. 티커 포함 (가장 높은 가중치)
-        if ticker in title:
-            score += 10  # 제목에 티커가 있으면 높은 점수
-        elif ticker in body:
-            score += 5   # 본문에 티커가 있으면 중간 점수
-        
-        # 2. 회사명 포함
-        if company_name:
-            if company_name in title:
-                score += 8
-            elif company_name in body:
-                score += 4
-        
-        # 3. 주식 관련 키워드
-        stock_keywords = ['STOCK', 'SHARE', 'PRICE', 'TRADING', 'MARKET', 'EARNINGS', 
-                         'REVENUE', 'FINANCIAL', 'INVESTMENT', 'ANALYST', 'RATING', 
-                         'DIVIDEND', 'EQUITY', 'SHARES']
-        for keyword in stock_keywords:
-            if keyword in title or keyword in body:
-                score += 2
-                break
-        
-        # 4. 금융 뉴스 사이트 (높은 가중치)
-        finance_sites = ['yahoo.com', 'bloomberg.com', 'reuters.com', 'cnbc.com', 
-                        'wsj.com', 'marketwatch.com', 'ft.com', 'forbes.com',
-                        'seekingalpha.com', 'benzinga.com', 'thestreet.com', 
-                        'investing.com', 'fool.com']
-        for site in finance_sites:
-            if site in href.lower():
-                score += 5  # 금융 사이트는 높은 가중치
-                break
-        
-        return score
-    
     # Helper Methods (이제 utils.py로 이동됨)
     
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """RSI(Relative Strength Index) 직접 계산"""
-        try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            # RSI 계산: loss가 0인 경우를 처리하기 위해 Series 단위로 계산
-            rs = gain / loss.replace(0, np.nan)
-            rsi = 100 - (100 / (1 + rs.fillna(0)))
-            return rsi.fillna(50)  # NaN인 경우 50으로 채움
-        except Exception:
-            return pd.Series([np.nan] * len(prices), index=prices.index)
-    
-    def _calculate_trix(self, prices: pd.Series, period: int = 30) -> Dict[str, pd.Series]:
-        """TRIX(Triple Exponential Average) 직접 계산"""
-        try:
-            # EMA 계산 함수
-            def ema(series, period):
-                return series.ewm(span=period, adjust=False).mean()
-            
-            # Triple EMA
-            ema1 = ema(prices, period)
-            ema2 = ema(ema1, period)
-            ema3 = ema(ema2, period)
-            
-            # TRIX = (EMA3 - 이전 EMA3) / 이전 EMA3 * 100
-            trix = ((ema3 - ema3.shift(1)) / ema3.shift(1)) * 100
-            
-            # Signal = TRIX의 EMA (일반적으로 9일)
-            signal = ema(trix, 9)
-            
-            return {
-                'trix': trix,
-                'signal': signal
-            }
-        except Exception:
-            empty_series = pd.Series([np.nan] * len(prices), index=prices.index)
-            return {
-                'trix': empty_series,
-                'signal': empty_series
-            }
-    
     def _empty_profile(self) -> Dict[str, Any]:
         """빈 프로필 반환"""
         return {
@@ -1350,52 +1200,22 @@ class StockDataManager:
             if len(income_stmt) == 0 or len(balance_sheet) == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            revenue_keys = ['Total Revenue', 'Revenue', 'Revenues', 'Net Sales']
-            receivables_keys = ['Receivables', 'Accounts Receivable', 
-                              'Net Receivables', 'AccountsReceivable']
-            
-            time_series = []
-            turnovers = []
+            revenue_col = _find_column(income_stmt, self._REVENUE_KEYS)
+            receivables_col = _find_column(balance_sheet, self._RECEIVABLES_KEYS)
+            if revenue_col is None or receivables_col is None:
+                return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
+            dates, revenue_values, receivables_values, turnovers = _period_ratios(revenue_col, receivables_col)
             
-            for date_idx in income_stmt.index:
-                revenue = None
-                receivables = None
-                
-                for key in revenue_keys:
-                    if key in income_stmt.columns:
-                        revenue = income_stmt.loc[date_idx, key]
-                        break
-                
-                for key in receivables_keys:
-                    if key in balance_sheet.columns:
-                        receivables = balance_sheet.loc[date_idx, key]
-                        break
-                
-                if revenue is not None and receivables is not None:
-                    turnover = safe_divide(revenue, receivables, default='N/A')
-                    if turnover != 'N/A':
-                        turnovers.append(turnover)
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(turnover, 2),
-                            'revenue': float(revenue) if pd.notna(revenue) else None,
-                            'receivables': float(receivables) if pd.notna(receivables) else None
-                        })
-            
-            if not turnovers:
+            if turnovers.size == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            latest = round(turnovers[0], 2)
-            trend = 'N/A'
-            if len(turnovers) >= 2:
-                if turnovers[0] > turnovers[1]:
-                    trend = 'Improving'
-                elif turnovers[0] < turnovers[1]:
-                    trend = 'Declining'
-                else:
-                    trend = 'Stable'
+            time_series = [
+                {'date': str(date_idx), 'value': round(turnover, 2), 'revenue': revenue, 'receivables': receivables}
+                for date_idx, revenue, receivables, turnover in zip(dates, revenue_values, receivables_values, turnovers.tolist())
+            ]
             
-            return {'latest': latest, 'trend': trend, 'time_series': time_series}
+            latest = round(float(turnovers[0]), 2)
+            return {'latest': latest, 'trend': _trend_label(turnovers), 'time_series': time_series}
         except Exception:
             return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
     
@@ -1407,52 +1227,22 @@ class StockDataManager:
             if len(income_stmt) == 0 or len(balance_sheet) == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            cogs_keys = ['Cost Of Goods Sold', 'Cost of Revenue', 'COGS', 
-                        'CostOfGoodsSold', 'Cost of Goods Sold']
-            inventory_keys = ['Inventory', 'Inventories', 'Total Inventory']
-            
-            time_series = []
-            turnovers = []
+            cogs_col = _find_column(income_stmt, self._COGS_KEYS)
+            inventory_col = _find_column(balance_sheet, self._INVENTORY_KEYS)
+            if cogs_col is None or inventory_col is None:
+                return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
+            dates, cogs_values, inventory_values, turnovers = _period_ratios(cogs_col, inventory_col)
             
-            for date_idx in income_stmt.index:
-                cogs = None
-                inventory = None
-                
-                for key in cogs_keys:
-                    if key in income_stmt.columns:
-                        cogs = income_stmt.loc[date_idx, key]
-                        break
-                
-                for key in inventory_keys:
-                    if key in balance_sheet.columns:
-                        inventory = balance_sheet.loc[date_idx, key]
-                        break
-                
-                if cogs is not None and inventory is not None:
-                    turnover = safe_divide(cogs, inventory, default='N/A')
-                    if turnover != 'N/A':
-                        turnovers.append(turnover)
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(turnover, 2),
-                            'cogs': float(cogs) if pd.notna(cogs) else None,
-                            'inventory': float(inventory) if pd.notna(inventory) else None
-                        })
-            
-            if not turnovers:
+            if turnovers.size == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            latest = round(turnovers[0], 2)
-            trend = 'N/A'
-            if len(turnovers) >= 2:
-                if turnovers[0] > turnovers[1]:
-                    trend = 'Improving'
-                elif turnovers[0] < turnovers[1]:
-                    trend = 'Declining'
-                else:
-                    trend = 'Stable'
+            time_series = [
+                {'date': str(date_idx), 'value': round(turnover, 2), 'cogs': cogs, 'inventory': inventory}
+                for date_idx, cogs, inventory, turnover in zip(dates, cogs_values, inventory_values, turnovers.tolist())
+            ]
             
-            return {'latest': latest, 'trend': trend, 'time_series': time_series}
+            latest = round(float(turnovers[0]), 2)
+            return {'latest': latest, 'trend': _trend_label(turnovers), 'time_series': time_series}
         except Exception:
             return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
     
@@ -1463,45 +1253,27 @@ class StockDataManager:
             if len(income_stmt) == 0:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            ebit_keys = ['EBIT', 'Earnings Before Interest And Taxes', 
-                        'Operating Income', 'Income Before Tax']
-            interest_keys = ['Interest Expense', 'InterestExpense', 
-                           'Total Interest Expense', 'Interest And Debt Expense']
-            
-            time_series = []
-            ratios = []
+            ebit_col = _find_column(income_stmt, self._EBIT_KEYS)
+            interest_col = _find_column(income_stmt, self._INTEREST_KEYS)
+            if ebit_col is None or interest_col is None:
+                return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
+            # Interest Expense는 음수일 수 있으므로 절댓값으로 나눔
+            dates, ebit_values, interest_values, ratios = _period_ratios(
+                ebit_col, interest_col, absolute_denominator=True
+            )
             
-            for date_idx in income_stmt.index:
-                ebit = None
-                interest_expense = None
-                
-                for key in ebit_keys:
-                    if key in income_stmt.columns:
-                        ebit = income_stmt.loc[date_idx, key]
-                        break
-                
-                for key in interest_keys:
-                    if key in income_stmt.columns:
-                        interest_expense = income_stmt.loc[date_idx, key]
-                        break
-                
-                if ebit is not None and interest_expense is not None:
-                    ratio = safe_divide(ebit, abs(interest_expense) if interest_expense != 0 else 0, default='N/A')
-                    if ratio != 'N/A':
-                        ratios.append(ratio)
-                        status = 'Strong' if ratio >= 5.0 else 'Weak' if ratio >= 1.0 else 'Critical'
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(ratio, 2),
-                            'status': status,
-                            'ebit': float(ebit) if pd.notna(ebit) else None,
-                            'interest_expense': float(interest_expense) if pd.notna(interest_expense) else None
-                        })
-            
-            if not ratios:
+            if ratios.size == 0:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            latest = round(ratios[0], 2)
+            statuses = np.select([ratios >= 5.0, ratios >= 1.0], ['Strong', 'Weak'], default='Critical')
+            time_series = [
+                {'date': str(date_idx), 'value': round(ratio, 2), 'status': str(status),
+                 'ebit': ebit, 'interest_expense': interest_expense}
+                for date_idx, ebit, interest_expense, ratio, status
+                in zip(dates, ebit_values, interest_values, ratios.tolist(), statuses)
+            ]
+            
+            latest = round(float(ratios[0]), 2)
             status = 'Strong' if latest >= 5.0 else 'Weak' if latest >= 1.0 else 'Critical'
             
             return {'latest': latest, 'status': status, 'time_series': time_series}
@@ -1515,111 +1287,26 @@ class StockDataManager:
             if len(balance_sheet) == 0:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            debt_keys = ['Total Debt', 'TotalDebt', 'Total Liabilities Net Minority Interest',
-                        'Total Liabilities', 'Long Term Debt', 'Short Term Debt']
-            equity_keys = ['Total Stockholder Equity', 'Stockholders Equity', 
-                          'Total Equity', 'Total Shareholders Equity']
-            
-            time_series = []
-            ratios = []
-            
-            for date_idx in balance_sheet.index:
-                total_debt = None
-                total_equity = None
-                
-                # 부채 찾기
-                for key in debt_keys:
-                    if key in balance_sheet.columns:
-                        value = balance_sheet.loc[date_idx, key]
-                        if value is not None and pd.notna(value):
-                            total_debt = value
-                            break
-                
-                # 자기자본 찾기
-                for key in equity_keys:
-                    if key in balance_sheet.columns:
-                        value = balance_sheet.loc[date_idx, key]
-                        if value is not None and pd.notna(value):
-                            total_equity = value
-                            break
-                
-                if total_debt is not None and total_equity is not None and total_equity != 0:
-                    ratio = safe_divide(total_debt, total_equity, default='N/A')
-                    if ratio != 'N/A':
-                        ratios.append(ratio)
-                        # 상태 판정: 0-1: Low, 1-2: Moderate, 2+: High
-                        status = 'Low' if ratio < 1.0 else 'Moderate' if ratio < 2.0 else 'High'
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(ratio, 2),
-                            'status': status,
-                            'total_debt': float(total_debt) if pd.notna(total_debt) else None,
-                            'total_equity': float(total_equity) if pd.notna(total_equity) else None
-                        })
-            
-            if not ratios:
+            # 부채/자기자본: 기간마다 후보 컬럼 중 첫 번째 유효값 사용
+            debt_col = _coalesce_columns(balance_sheet, self._DEBT_KEYS)
+            equity_col = _coalesce_columns(balance_sheet, self._EQUITY_KEYS)
+            if debt_col is None or equity_col is None:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
+            dates, debt_values, equity_values, ratios = _period_ratios(debt_col, equity_col)
             
-            latest = round(ratios[0], 2)
-            status = 'Low' if latest < 1.0 else 'Moderate' if latest < 2.0 else 'High'
-            
-            return {'latest': latest, 'status': status, 'time_series': time_series}
-        except Exception:
-            return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
-    
-    def _calculate_debt_to_equity_with_trend(self, balance_sheet: pd.DataFrame,
-                                             period_type: str = 'annual') -> Dict[str, Any]:
-        """Debt to Equity Ratio 계산 (시계열 포함)"""
-        try:
-            if len(balance_sheet) == 0:
+            if ratios.size == 0:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            debt_keys = ['Total Debt', 'TotalDebt', 'Total Liabilities Net Minority Interest',
-                        'Total Liabilities', 'Long Term Debt', 'Short Term Debt']
-            equity_keys = ['Total Stockholder Equity', 'Stockholders Equity', 
-                          'Total Equity', 'Total Shareholders Equity']
-            
-            time_series = []
-            ratios = []
+            # 상태 판정: 0-1: Low, 1-2: Moderate, 2+: High
+            statuses = np.select([ratios < 1.0, ratios < 2.0], ['Low', 'Moderate'], default='High')
+            time_series = [
+                {'date': str(date_idx), 'value': round(ratio, 2), 'status': str(status),
+                 'total_debt': total_debt, 'total_equity': total_equity}
+                for date_idx, total_debt, total_equity, ratio, status
+                in zip(dates, debt_values, equity_values, ratios.tolist(), statuses)
+            ]
             
-            for date_idx in balance_sheet.index:
-                total_debt = None
-                total_equity = None
-                
-                # 부채 찾기
-                for key in debt_keys:
-                    if key in balance_sheet.columns:
-                        value = balance_sheet.loc[date_idx, key]
-                        if value is not None and pd.notna(value):
-                            total_debt = value
-                            break
-                
-                # 자기자본 찾기
-                for key in equity_keys:
-                    if key in balance_sheet.columns:
-                        value = balance_sheet.loc[date_idx, key]
-                        if value is not None and pd.notna(value):
-                            total_equity = value
-                            break
-                
-                if total_debt is not None and total_equity is not None and total_equity != 0:
-                    ratio = safe_divide(total_debt, total_equity, default='N/A')
-                    if ratio != 'N/A':
-                        ratios.append(ratio)
-                        # 상태 판정: 0-1: Low, 1-2: Moderate, 2+: High
-                        status = 'Low' if ratio < 1.0 else 'Moderate' if ratio < 2.0 else 'High'
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(ratio, 2),
-                            'status': status,
-                            'total_debt': float(total_debt) if pd.notna(total_debt) else None,
-                            'total_equity': float(total_equity) if pd.notna(total_equity) else None
-                        })
-            
-            if not ratios:
-                return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
-            
-            latest = round(ratios[0], 2)
+            latest = round(float(ratios[0]), 2)
             status = 'Low' if latest < 1.0 else 'Moderate' if latest < 2.0 else 'High'
             
             return {'latest': latest, 'status': status, 'time_series': time_series}
@@ -1633,43 +1320,31 @@ class StockDataManager:
             if len(cashflow) < 2:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            capex_keys = ['Capital Expenditure', 'CapitalExpenditure', 
-                         'Capital Expenditures', 'Purchase Of Property Plant And Equipment']
-            
-            capex_values = []
-            dates_list = []
+            capex_col = _find_column(cashflow, self._CAPEX_KEYS)
+            if capex_col is None:
+                return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            for date_idx in cashflow.index:
-                capex = None
-                for key in capex_keys:
-                    if key in cashflow.columns:
-                        capex = cashflow.loc[date_idx, key]
-                        break
-                
-                if capex is not None and pd.notna(capex):
-                    capex_values.append(abs(float(capex)))
-                    dates_list.append(str(date_idx))
+            # 결측 기간을 제외한 CapEx 절댓값 (행=최신순)
+            capex = pd.to_numeric(capex_col, errors='coerce').to_numpy(dtype=np.float64)
+            valid = ~np.isnan(capex)
+            capex_values = np.abs(capex[valid])
+            dates = cashflow.index[valid].tolist()
             
-            if len(capex_values) < 2:
+            if capex_values.size < 2:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
             
-            # Growth 계산
-            time_series = []
-            growth_rates = []
-            
-            for i in range(len(capex_values) - 1):
-                if capex_values[i+1] != 0:
-                    growth = ((capex_values[i] - capex_values[i+1]) / capex_values[i+1]) * 100
-                    growth_rates.append(growth)
-                    time_series.append({
-                        'date': dates_list[i],
-                        'value': round(growth, 2),
-                        'capex': capex_values[i],
-                        'prev_capex': capex_values[i+1]
-                    })
-            
-            if not growth_rates:
+            # Growth 계산 (각 기간 vs 직전 기간, 직전 CapEx가 0인 기간 제외)
+            current, previous = capex_values[:-1], capex_values[1:]
+            positions = np.flatnonzero(previous != 0)
+            if positions.size == 0:
                 return {'latest': 'N/A', 'trend': 'N/A', 'time_series': []}
+            growth_rates = ((current[positions] - previous[positions]) / previous[positions] * 100).tolist()
+            
+            time_series = [
+                {'date': str(dates[i]), 'value': round(growth, 2),
+                 'capex': float(current[i]), 'prev_capex': float(previous[i])}
+                for i, growth in zip(positions.tolist(), growth_rates)
+            ]
             
             latest = round(growth_rates[0], 2)
             trend = 'Expanding' if latest > 0 else 'Contracting' if latest < 0 else 'Stable'
@@ -1686,56 +1361,30 @@ class StockDataManager:
             if len(cashflow) == 0:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            repurchase_keys = ['Purchase Of Common Stock', 'Common Stock Repurchased', 
-                             'Repurchase Of Common Stock', 'Stock Repurchase']
-            issuance_keys = ['Sale Of Common Stock', 'Common Stock Issued', 
-                           'Issuance Of Common Stock']
-            
-            time_series = []
-            yields = []
-            
-            try:
-                info = self.ticker.info
-                market_cap = info.get('marketCap', None)
-            except:
-                market_cap = None
+            market_cap = self._get_market_cap()
+            if not isinstance(market_cap, (int, float)) or market_cap == 0 or pd.isna(market_cap):
+                return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            for date_idx in cashflow.index:
-                repurchase = None
-                issuance = None
-                
-                for key in repurchase_keys:
-                    if key in cashflow.columns:
-                        repurchase = cashflow.loc[date_idx, key]
-                        break
-                
-                for key in issuance_keys:
-                    if key in cashflow.columns:
-                        issuance = cashflow.loc[date_idx, key]
-                        break
-                
-                net_buyback = 0
-                if repurchase is not None and pd.notna(repurchase):
-                    net_buyback += abs(repurchase)
-                if issuance is not None and pd.notna(issuance):
-                    net_buyback -= abs(issuance)
-                
-                if market_cap and market_cap != 0 and pd.notna(market_cap):
-                    yield_pct = safe_divide(net_buyback * 100, market_cap, default='N/A')
-                    if yield_pct != 'N/A':
-                        yields.append(yield_pct)
-                        status = 'Positive' if net_buyback > 0 else 'Negative' if net_buyback < 0 else 'Neutral'
-                        time_series.append({
-                            'date': str(date_idx),
-                            'value': round(yield_pct, 4),
-                            'status': status,
-                            'net_buyback': net_buyback
-                        })
-            
-            if not yields:
+            # 순매입 = |자사주 매입| - |신주 발행| (기간별 벡터 연산, 컬럼이 없거나 결측인 기간은 0으로 취급)
+            net_buybacks = np.zeros(len(cashflow.index))
+            for keys, sign in ((self._REPURCHASE_KEYS, 1.0), (self._ISSUANCE_KEYS, -1.0)):
+                column = _find_column(cashflow, keys)
+                if column is not None:
+                    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64)
+                    net_buybacks += sign * np.nan_to_num(np.abs(values), nan=0.0)
+            yields = net_buybacks * 100 / float(market_cap)
+            statuses = np.select([net_buybacks > 0, net_buybacks < 0], ['Positive', 'Negative'], default='Neutral')
+            
+            time_series = [
+                {'date': str(date_idx), 'value': round(yield_pct, 4), 'status': str(status), 'net_buyback': net_buyback}
+                for date_idx, yield_pct, status, net_buyback
+                in zip(cashflow.index, yields.tolist(), statuses, net_buybacks.tolist())
+            ]
+            
+            if not time_series:
                 return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
             
-            latest = round(yields[0], 4)
+            latest = round(float(yields[0]), 4)
             status = 'Positive' if latest > 0 else 'Negative' if latest < 0 else 'Neutral'
             
             return {'latest': latest, 'status': status, 'time_series': time_series}
@@ -1743,18 +1392,18 @@ class StockDataManager:
             return {'latest': 'N/A', 'status': 'N/A', 'time_series': []}
     
     def _empty_financials(self) -> Dict[str, Any]:
-        """빈 재무 데이터 반환"""
+        """빈 재무 데이터 반환 (dict는 호출마다 새로 만들고, 빈 DataFrame은 모듈 공유 인스턴스 사용)"""
         return {
             'raw_data': {
                 'annual': {
-                    'income_stmt': pd.DataFrame(),
-                    'balance_sheet': pd.DataFrame(),
-                    'cashflow': pd.DataFrame()
+                    'income_stmt': _EMPTY_STATEMENT,
+                    'balance_sheet': _EMPTY_STATEMENT,
+                    'cashflow': _EMPTY_STATEMENT
                 },
                 'quarterly': {
-                    'income_stmt': pd.DataFrame(),
-                    'balance_sheet': pd.DataFrame(),
-                    'cashflow': pd.DataFrame()
+                    'income_stmt': _EMPTY_STATEMENT,
+                    'balance_sheet': _EMPTY_STATEMENT,
+                    'cashflow': _EMPTY_STATEMENT
                 }
             },
             'derived_metrics': {
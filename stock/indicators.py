@@ -0,0 +1,259 @@
+"""
+기술적 지표 계산 모듈 (차트 / StockDataManager.get_technicals 공용)
+MA(20/60/120), RSI(14), TRIX(30) + Signal(9) 을 종가 배열 1회 순회로 계산
+"""
+
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+
+# numba가 설치되어 있으면 JIT 커널 사용, 없으면 pandas 계산으로 대체
+try:
+    from numba import njit
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+
+
+def _indicator_kernel(close: np.ndarray, rsi_period: int, trix_period: int, signal_period: int,
+                      full_window: bool):
+    """
+    종가 배열 1회 순회로 MA 20/60/120, RSI, TRIX, TRIX Signal 계산 (차트/get_technicals 공용)
+
+    pandas 계산과 동일한 정의:
+    - MA: rolling(window).mean(), full_window가 False면 min_periods=1 (초반은 누적 평균)
+    - RSI: rsi_period일 단순 평균 상승폭/하락폭 기반, 변동폭이 rsi_period개 모인 i >= rsi_period부터 유효
+      (그 이전과 변동이 없는 구간은 NaN, 하락 없이 상승만 있는 구간은 100)
+    - TRIX: span=trix_period EMA(adjust=False) 3회 적용 후 pct_change * 100
+    - Signal: TRIX의 span=signal_period EMA(adjust=False)
+    """
+    n = close.size
+    ma20 = np.full(n, np.nan)
+    ma60 = np.full(n, np.nan)
+    ma120 = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    trix = np.full(n, np.nan)
+    sig = np.full(n, np.nan)
+
+    sum20 = 0.0
+    sum60 = 0.0
+    sum120 = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+
+    alpha = 2.0 / (trix_period + 1.0)
+    sig_alpha = 2.0 / (signal_period + 1.0)
+    ema1 = 0.0
+    ema2 = 0.0
+    ema3 = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # 이동평균 (누적합으로 window 밖 값 제거)
+        sum20 += price
+        sum60 += price
+        sum120 += price
+        if i >= 20:
+            sum20 -= close[i - 20]
+        if i >= 60:
+            sum60 -= close[i - 60]
+        if i >= 120:
+            sum120 -= close[i - 120]
+        if i >= 19 or not full_window:
+            ma20[i] = sum20 / min(i + 1, 20)
+        if i >= 59 or not full_window:
+            ma60[i] = sum60 / min(i + 1, 60)
+        if i >= 119 or not full_window:
+            ma120[i] = sum120 / min(i + 1, 120)
+
+        # RSI - delta[0]은 없으므로 i=rsi_period부터 유효
+        if i >= 1:
+            delta = price - close[i - 1]
+            if delta > 0:
+                gain_sum += delta
+            else:
+                loss_sum -= delta
+            if i > rsi_period:
+                # 윈도우에서 빠지는 (i - rsi_period)번째 날의 변동폭
+                old_delta = close[i - rsi_period] - close[i - rsi_period - 1]
+                if old_delta > 0:
+                    gain_sum -= old_delta
+                else:
+                    loss_sum += old_delta
+            if i >= rsi_period:
+                if loss_sum > 0.0:
+                    rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+                elif gain_sum > 0.0:
+                    rsi[i] = 100.0
+
+        # TRIX - EMA 3단계 후 변화율
+        if i == 0:
+            ema1 = price
+            ema2 = price
+            ema3 = price
+        else:
+            prev_ema3 = ema3
+            ema1 = ema1 + alpha * (price - ema1)
+            ema2 = ema2 + alpha * (ema1 - ema2)
+            ema3 = ema3 + alpha * (ema2 - ema3)
+            if prev_ema3 != 0.0:
+                trix[i] = (ema3 / prev_ema3 - 1.0) * 100.0
+            if i == 1:
+                sig[i] = trix[i]
+            else:
+                sig[i] = sig[i - 1] + sig_alpha * (trix[i] - sig[i - 1])
+
+    return ma20, ma60, ma120, rsi, trix, sig
+
+
+if USE_NUMBA:
+    _indicator_kernel = njit(cache=True)(_indicator_kernel)
+
+
+def rolling_mean(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    누적합 1회로 계산하는 이동평균 (pandas rolling(window, min_periods).mean()과 동일한 결과)
+    
+    결측치는 합계/개수에서 제외하며, 윈도우 내 유효값이 min_periods 미만이면 NaN
+    
+    Args:
+        values: 1차원 배열 또는 Series
+        window: 이동평균 기간
+        min_periods: 최소 유효값 개수 (기본값: window)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if min_periods is None:
+        min_periods = window
+    
+    valid = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    
+    end = np.arange(1, values.size + 1)
+    start = np.maximum(end - window, 0)
+    window_sums = sums[end] - sums[start]
+    window_counts = counts[end] - counts[start]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = window_sums / window_counts
+    means[window_counts < max(min_periods, 1)] = np.nan
+    return means
+
+
+def _compute_with_pandas(close: pd.Series, full_window: bool) -> Dict[str, np.ndarray]:
+    """numba 미설치 또는 결측치가 있는 경우의 pandas 계산 (_indicator_kernel과 같은 정의)"""
+    indicators = {}
+
+    # 이동평균선
+    for window in (20, 60, 120):
+        indicators[f'MA_{window}'] = rolling_mean(close, window, min_periods=window if full_window else 1)
+
+    # RSI(14) - loss가 0이면 gain / loss = inf -> RSI 100, 둘 다 0이면 NaN
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(window=14).mean()
+    loss = (-delta.clip(upper=0)).rolling(window=14).mean()
+    indicators['RSI'] = (100 - (100 / (1 + gain / loss))).to_numpy()
+
+    # TRIX(30) = 30일 EMA의 3차 지수 이동평균 변화율, Signal = TRIX의 9일 EMA
+    ema1 = close.ewm(span=30, adjust=False).mean()
+    ema2 = ema1.ewm(span=30, adjust=False).mean()
+    ema3 = ema2.ewm(span=30, adjust=False).mean()
+    trix = ema3.pct_change() * 100
+    indicators['TRIX'] = trix.to_numpy()
+    indicators['TRIX_SIG'] = trix.ewm(span=9, adjust=False).mean().to_numpy()
+
+    return indicators
+
+
+def _compute_indicators(close: pd.Series, full_window: bool) -> Dict[str, np.ndarray]:
+    """
+    MA 20/60/120, RSI(14), TRIX(30), TRIX Signal(9) 계산 (numba 설치 시 JIT 커널, 아니면 pandas)
+
+    Args:
+        close: 종가 Series
+        full_window: True면 MA를 window가 다 찬 구간부터, False면 min_periods=1로 계산
+    """
+    values = close.to_numpy(dtype=np.float64)
+
+    # 결측치가 있으면 pandas의 NaN 처리 규칙을 그대로 따르도록 pandas 계산 사용
+    if not USE_NUMBA or not np.isfinite(values).all():
+        return _compute_with_pandas(close, full_window)
+
+    keys = ('MA_20', 'MA_60', 'MA_120', 'RSI', 'TRIX', 'TRIX_SIG')
+    arrays = _indicator_kernel(np.ascontiguousarray(values), 14, 30, 9, full_window)
+    return dict(zip(keys, arrays))
+
+
+def compute_chart_indicators(close: pd.Series) -> Dict[str, np.ndarray]:
+    """
+    차트용 기술적 지표 계산 (입력 DataFrame에 컬럼을 추가하지 않고 별도 배열로 반환)
+
+    Args:
+        close: 종가 Series (DatetimeIndex)
+
+    Returns:
+        {'MA_20', 'MA_60', 'MA_120', 'RSI', 'TRIX', 'TRIX_SIG'} -> close와 같은 길이의 numpy 배열
+    """
+    return _compute_indicators(close, full_window=True)
+
+
+def compute_technicals(close: pd.Series, volume: pd.Series) -> Dict[str, pd.Series]:
+    """
+    StockDataManager.get_technicals용 RSI(14), TRIX(30)/Signal(9), MA 20/60/120, 거래량 비율 계산
+
+    차트와 같은 커널을 사용하며, MA는 min_periods=1, 계산 불가 구간의 RSI는 50으로 채움
+
+    Args:
+        close: 종가 Series
+        volume: 거래량 Series
+
+    Returns:
+        get_technicals의 hist 컬럼명 -> Series 딕셔너리
+    """
+    values = _compute_indicators(close, full_window=False)
+    technicals = {
+        'RSI': pd.Series(values['RSI'], index=close.index).fillna(50),
+        'TRIX': pd.Series(values['TRIX'], index=close.index),
+        'TRIX_Signal': pd.Series(values['TRIX_SIG'], index=close.index)
+    }
+    for window in (20, 60, 120):
+        technicals[f'MA_{window}'] = pd.Series(values[f'MA_{window}'], index=close.index)
+
+    # 거래량 비율 (20일 평균 대비 현재 거래량)
+    technicals['Volume_MA20'] = pd.Series(rolling_mean(volume, 20, min_periods=1), index=volume.index)
+    technicals['Volume_Ratio'] = volume / technicals['Volume_MA20']
+    return technicals
+
+
+# RSI 과매수/과매도 기준
+RSI_OVERBOUGHT = 70.0
+RSI_OVERSOLD = 30.0
+
+
+def rsi_status_labels(rsi_values) -> np.ndarray:
+    """
+    RSI 값 배열을 과매수/과매도 라벨로 분류 (if/elif 대신 np.select로 일괄 분류)
+
+    Args:
+        rsi_values: RSI 값 (스칼라 또는 배열, NaN 허용)
+
+    Returns:
+        " (Overbought)", " (Oversold)", "" 중 하나로 이루어진 문자열 배열
+    """
+    rsi = np.atleast_1d(np.asarray(rsi_values, dtype=np.float64))
+    return np.select(
+        [rsi > RSI_OVERBOUGHT, rsi < RSI_OVERSOLD],
+        [" (Overbought)", " (Oversold)"],
+        default=""
+    )
+
+
+def _warmup_kernels() -> None:
+    """첫 요청에서 JIT 컴파일 지연이 생기지 않도록 import 시 실제 호출과 같은 타입으로 커널 1회 실행"""
+    close = np.linspace(1.0, 2.0, 300)
+    _indicator_kernel(close, 14, 30, 9, True)
+
+
+if USE_NUMBA:
+    _warmup_kernels()
@@ -5,6 +5,7 @@
 
 from typing import Any, Callable, TypeVar, Optional
 import pandas as pd
+import numpy as np
 import logging
 
 # 로깅 설정 (선택적 - 사용하지 않을 경우 INFO 레벨로 설정)
@@ -46,6 +47,62 @@ def format_number(value: Any) -> str:
         return str(value)
 
 
+_NUMBER_SUFFIXES = np.array(['', 'K', 'M', 'B', 'T'])
+
+
+def format_series(values: Any) -> list:
+    """
+    format_number의 배치 버전 - 전체 값을 numpy 배열로 한 번에 스케일링
+    
+    Args:
+        values: 포맷팅할 값 목록 (Series, list 등 - 숫자/문자열 혼합 가능)
+    
+    Returns:
+        포맷팅된 문자열 리스트 (숫자가 아닌 값은 원래 문자열 유지, 결측은 "N/A")
+    """
+    series = pd.Series(values, dtype=object)
+    nums = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+    finite = np.isfinite(nums)
+    magnitude = np.abs(np.where(finite, nums, 0.0))
+    # format_number와 동일한 경계값 (1e3/1e6/1e9/1e12) 으로 단위 선택
+    bucket = np.select(
+        [magnitude >= 1e12, magnitude >= 1e9, magnitude >= 1e6, magnitude >= 1e3],
+        [4, 3, 2, 1],
+        default=0
+    )
+    scaled = nums / np.power(1e3, bucket)
+    suffixes = _NUMBER_SUFFIXES[bucket]
+    
+    return [
+        f"{v:.2f}{suffix}" if ok
+        else ('N/A' if raw is None or raw == 'N/A' or pd.isna(raw) else str(raw))
+        for v, suffix, ok, raw in zip(scaled, suffixes, finite, series)
+    ]
+
+
+def flatten_metrics(metrics: dict, sep: str = '.') -> dict:
+    """
+    중첩된 지표 딕셔너리를 1단계로 평탄화
+    
+    Args:
+        metrics: {'지표명': {'latest': ..., 'trend': ...}} 형태의 딕셔너리
+        sep: 키 구분자
+    
+    Returns:
+        {'지표명.latest': ..., '지표명.trend': ...} 형태의 딕셔너리
+    
+    Usage:
+        flat = flatten_metrics(metrics)
+        flat.get('quality_of_earnings.latest', 'N/A')
+    """
+    return {
+        f"{name}{sep}{key}": value
+        for name, fields in (metrics or {}).items()
+        if isinstance(fields, dict)
+        for key, value in fields.items()
+    }
+
+
 def safe_get_numeric(info: dict, key: str) -> Any:
     """
     딕셔너리에서 안전하게 숫자 값 가져오기
@@ -57,12 +114,16 @@ def safe_get_numeric(info: dict, key: str) -> Any:
     Returns:
         숫자 값 또는 'N/A'
     """
+    value = info.get(key)
+    if value is None:
+        return 'N/A'
+    # 숫자(가장 흔한 경우)는 pd.isna 디스패치/예외 처리 없이 바로 판정 (NaN은 자기 자신과 같지 않음)
+    if isinstance(value, (int, float)):
+        return 'N/A' if value != value else float(value)
     try:
-        value = info.get(key)
-        if value is None or pd.isna(value):
-            return 'N/A'
-        return float(value) if isinstance(value, (int, float)) else value
+        return 'N/A' if pd.isna(value) else value
     except Exception:
+        # 리스트 등 배열형 값은 기존과 같이 'N/A'
         return 'N/A'
 
 
@@ -76,13 +137,14 @@ def safe_get_latest(series: pd.Series) -> Any:
     Returns:
         최신 값 (float, int) 또는 'N/A'
     """
+    if series is None or series.empty:
+        return 'N/A'
+    latest = series.iat[-1]
+    if isinstance(latest, (int, float)):
+        # NaN은 자기 자신과 같지 않음 (pd.isna 호출 생략)
+        return 'N/A' if latest != latest else round(float(latest), 2)
     try:
-        if series.empty:
-            return 'N/A'
-        latest = series.iloc[-1]
-        if pd.isna(latest):
-            return 'N/A'
-        return round(float(latest), 2) if isinstance(latest, (int, float)) else latest
+        return 'N/A' if pd.isna(latest) else latest
     except Exception:
         return 'N/A'
 